@@ -0,0 +1,71 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException, Response
+from sqlalchemy import String, Select, tuple_, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Response header carrying the cursor of the next page (list bodies stay plain arrays)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: str, row_id: str) -> str:
+    """Opaque cursor for the position after (created_at, id)."""
+    raw = json.dumps([created_at, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        if not isinstance(created_at, str) or not isinstance(row_id, str):
+            raise ValueError("cursor fields must be strings")
+        return created_at, row_id
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    model: Any,
+    response: Response,
+    skip: int,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> List[Any]:
+    """
+    One page of `query` ordered newest first by (created_at, id).
+
+    Without a cursor this is offset pagination (`skip`); with one, rows strictly after the
+    cursor position are read through the created_at indexes, so deep pages cost the same as
+    the first. Either way, a full page sets the X-Next-Cursor header. The cursor holds
+    created_at as stored: SQLite keeps timestamps as text in more than one format, and a
+    re-rendered datetime would not compare equal to its own row.
+    """
+    stored_created_at = type_coerce(model.created_at, String)
+    query = query.add_columns(stored_created_at.label("cursor_created_at"))
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+
+    if cursor:
+        created_at, last_id = decode_cursor(cursor)
+        if db.get_bind().dialect.name == "sqlite":
+            query = query.where(tuple_(stored_created_at, model.id) < (created_at, last_id))
+        else:
+            try:
+                position = datetime.fromisoformat(created_at)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+            query = query.where(tuple_(model.created_at, model.id) < (position, last_id))
+    elif skip:
+        query = query.offset(skip)
+
+    rows = (await db.execute(query.limit(limit))).all()
+    if len(rows) == limit and rows[-1].cursor_created_at is not None:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(str(last.cursor_created_at), last[0].id)
+    return [row[0] for row in rows]
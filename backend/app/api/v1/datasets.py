@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from app.core.database import get_db
+from app.api.pagination import paginate
+from app.core.database import get_async_db
 from app.models.schemas import DatasetCreate, DatasetResponse
 from app.models.database import Dataset
 from app.models.enums import DatasetSource, AccessType
@@ -11,23 +13,25 @@ router = APIRouter()
 
 @router.get("", response_model=List[DatasetResponse])
 async def list_datasets(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page (replaces skip)"),
     source: Optional[DatasetSource] = None,
     access_type: Optional[AccessType] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List all datasets with optional filtering."""
+    """List all datasets with optional filtering, newest first."""
     
-    query = db.query(Dataset)
+    query = select(Dataset)
     
     if source:
-        query = query.filter(Dataset.source == source.value)
+        query = query.where(Dataset.source == source.value)
     
     if access_type:
-        query = query.filter(Dataset.access_type == access_type.value)
+        query = query.where(Dataset.access_type == access_type.value)
     
-    datasets = query.offset(skip).limit(limit).all()
+    datasets = await paginate(db, query, Dataset, response, skip, limit, cursor)
     
     return [DatasetResponse(
         id=d.id,
@@ -52,11 +56,11 @@ async def list_datasets(
 @router.get("/{dataset_id}", response_model=DatasetResponse)
 async def get_dataset(
     dataset_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific dataset by ID."""
     
-    dataset = db.query(Dataset).filter(Dataset.id == dataset_id).first()
+    dataset = await db.get(Dataset, dataset_id)
     if not dataset:
         raise HTTPException(status_code=404, detail="Dataset not found")
     
@@ -83,7 +87,7 @@ async def get_dataset(
 @router.post("", response_model=DatasetResponse)
 async def create_dataset(
     dataset: DatasetCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new dataset entry."""
     
@@ -107,8 +111,8 @@ async def create_dataset(
     )
     
     db.add(db_dataset)
-    db.commit()
-    db.refresh(db_dataset)
+    await db.commit()
+    await db.refresh(db_dataset)
     
     return DatasetResponse(
         id=db_dataset.id,
@@ -134,11 +138,11 @@ async def create_dataset(
 async def update_dataset(
     dataset_id: str,
     dataset: DatasetCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an existing dataset."""
     
-    db_dataset = db.query(Dataset).filter(Dataset.id == dataset_id).first()
+    db_dataset = await db.get(Dataset, dataset_id)
     if not db_dataset:
         raise HTTPException(status_code=404, detail="Dataset not found")
     
@@ -158,8 +162,8 @@ async def update_dataset(
     db_dataset.publication_url = dataset.publication_url
     db_dataset.extra_metadata = dataset.extra_metadata
     
-    db.commit()
-    db.refresh(db_dataset)
+    await db.commit()
+    await db.refresh(db_dataset)
     
     return DatasetResponse(
         id=db_dataset.id,
@@ -184,15 +188,15 @@ async def update_dataset(
 @router.delete("/{dataset_id}")
 async def delete_dataset(
     dataset_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a dataset."""
     
-    db_dataset = db.query(Dataset).filter(Dataset.id == dataset_id).first()
+    db_dataset = await db.get(Dataset, dataset_id)
     if not db_dataset:
         raise HTTPException(status_code=404, detail="Dataset not found")
     
-    db.delete(db_dataset)
-    db.commit()
+    await db.delete(db_dataset)
+    await db.commit()
     
     return {"message": "Dataset deleted successfully"}
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from app.core.database import get_db
+from datetime import datetime
+from app.api.pagination import paginate
+from app.core.database import get_async_db
 from app.models.schemas import OutreachRequest, OutreachResponse
 from app.models.database import OutreachRequest as DBOutreachRequest
 from app.models.enums import OutreachStatus
@@ -11,26 +14,25 @@ router = APIRouter()
 
 @router.get("", response_model=List[OutreachResponse])
 async def list_outreach_requests(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page (replaces skip)"),
     status: Optional[OutreachStatus] = None,
     requester_email: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List all outreach requests with optional filtering."""
+    """List all outreach requests with optional filtering, newest first."""
     
-    query = db.query(DBOutreachRequest)
+    query = select(DBOutreachRequest)
     
     if status:
-        query = query.filter(DBOutreachRequest.status == status.value)
+        query = query.where(DBOutreachRequest.status == status.value)
         
     if requester_email:
-        query = query.filter(DBOutreachRequest.requester_email == requester_email)
+        query = query.where(DBOutreachRequest.requester_email == requester_email)
     
-    # Order by creation date, newest first
-    query = query.order_by(DBOutreachRequest.created_at.desc())
-    
-    requests = query.offset(skip).limit(limit).all()
+    requests = await paginate(db, query, DBOutreachRequest, response, skip, limit, cursor)
     
     return [OutreachResponse(
         id=req.id,
@@ -49,11 +51,11 @@ async def list_outreach_requests(
 @router.get("/{outreach_id}", response_model=OutreachResponse)
 async def get_outreach_request(
     outreach_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific outreach request by ID."""
     
-    request = db.query(DBOutreachRequest).filter(DBOutreachRequest.id == outreach_id).first()
+    request = await db.get(DBOutreachRequest, outreach_id)
     if not request:
         raise HTTPException(status_code=404, detail="Outreach request not found")
     
@@ -74,7 +76,7 @@ async def get_outreach_request(
 @router.post("", response_model=OutreachResponse)
 async def create_outreach_request(
     outreach: OutreachRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new outreach request."""
     
@@ -93,8 +95,8 @@ async def create_outreach_request(
     )
     
     db.add(db_outreach)
-    db.commit()
-    db.refresh(db_outreach)
+    await db.commit()
+    await db.refresh(db_outreach)
     
     return OutreachResponse(
         id=db_outreach.id,
@@ -113,11 +115,11 @@ async def create_outreach_request(
 @router.post("/{outreach_id}/send")
 async def send_outreach_request(
     outreach_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Send an outreach request email."""
     
-    request = db.query(DBOutreachRequest).filter(DBOutreachRequest.id == outreach_id).first()
+    request = await db.get(DBOutreachRequest, outreach_id)
     if not request:
         raise HTTPException(status_code=404, detail="Outreach request not found")
     
@@ -131,7 +133,7 @@ async def send_outreach_request(
     # For now, just update the status
     request.status = OutreachStatus.QUEUED.value
     
-    db.commit()
+    await db.commit()
     
     return {
         "message": "Outreach request queued for sending",
@@ -143,11 +145,11 @@ async def send_outreach_request(
 async def update_outreach_status(
     outreach_id: str,
     status: OutreachStatus,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update the status of an outreach request (for webhook updates)."""
     
-    request = db.query(DBOutreachRequest).filter(DBOutreachRequest.id == outreach_id).first()
+    request = await db.get(DBOutreachRequest, outreach_id)
     if not request:
         raise HTTPException(status_code=404, detail="Outreach request not found")
     
@@ -155,11 +157,11 @@ async def update_outreach_status(
     
     # Set timestamps based on status
     if status == OutreachStatus.SENT:
-        request.sent_at = db.func.now()
+        request.sent_at = datetime.utcnow()
     elif status == OutreachStatus.REPLIED:
-        request.replied_at = db.func.now()
+        request.replied_at = datetime.utcnow()
     
-    db.commit()
+    await db.commit()
     
     return {
         "message": "Outreach status updated successfully",
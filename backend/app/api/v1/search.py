@@ -1,22 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
-from app.core.database import get_db, SessionLocal
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.core.database import get_async_db, get_async_session_factory
+from app.core.job_queue import get_job_queue
+from app.core.search_tasks import FINISHED_STATUSES, run_search_task
+from app.core.task_events import END_EVENT, get_task_event_bus
 from app.models.schemas import SearchRequest, SearchResponse, TaskResponse
-from app.core.agent_orchestrator import AgentOrchestrator
 from app.models.database import Task
 from app.models.enums import TaskType, TaskStatus
 from datetime import datetime
+from typing import AsyncIterator, Optional
+import asyncio
+import json
 import uuid
 import logging
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
-orchestrator = AgentOrchestrator()
 
 @router.post("", response_model=SearchResponse)
 async def initiate_search(
     search_request: SearchRequest,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Initiate a new dataset search task."""
     
@@ -32,11 +41,22 @@ async def initiate_search(
     )
     
     db.add(task)
-    db.commit()
-    db.refresh(task)
+    await db.commit()
 
-    # Kick off agentic workflow in background
-    background_tasks.add_task(_run_agentic_search, task_id, search_request.dict())
+    if settings.JOB_QUEUE_BACKEND.lower() == "inline":
+        # Kick off agentic workflow in background
+        background_tasks.add_task(run_search_task, task_id, search_request.dict())
+    else:
+        # Workers pick the task up from the queue (keyed on the task id)
+        try:
+            await get_job_queue().enqueue(task_id, TaskType.SEARCH.value, {"request": search_request.model_dump(mode="json")})
+        except Exception as e:
+            logger.error(f"Could not queue search task {task_id}: {e}")
+            task.status = TaskStatus.FAILED.value
+            task.error_message = f"Could not queue task: {e}"
+            task.completed_at = datetime.utcnow()
+            await db.commit()
+            raise HTTPException(status_code=503, detail="Search queue unavailable")
 
     return SearchResponse(
         task_id=task_id,
@@ -44,53 +64,14 @@ async def initiate_search(
         message="Search task initiated successfully"
     )
 
-async def _run_agentic_search(task_id: str, req_data: dict) -> None:
-    """Background task to execute the multi-agent workflow and persist results."""
-    logger = logging.getLogger(__name__)
-    db = SessionLocal()
-    try:
-        task = db.query(Task).filter(Task.id == task_id).first()
-        if task:
-            task.status = TaskStatus.RUNNING.value
-            task.started_at = datetime.utcnow()
-            db.commit()
-
-        request = SearchRequest(**req_data)
-        user_email = task.user_email if task and task.user_email else ""
-        result = await orchestrator.execute_workflow(request, user_email=user_email)
-
-        # Persist results
-        task = db.query(Task).filter(Task.id == task_id).first()
-        if task:
-            task.status = TaskStatus.COMPLETED.value
-            task.output_data = result
-            task.completed_at = datetime.utcnow()
-            db.commit()
-    except Exception as e:
-        logger.error(f"Agent workflow failed for task {task_id}: {e}")
-        try:
-            task = db.query(Task).filter(Task.id == task_id).first()
-            if task:
-                task.status = TaskStatus.FAILED.value
-                task.error_message = str(e)
-                task.completed_at = datetime.utcnow()
-                db.commit()
-        except Exception:
-            pass
-    finally:
-        try:
-            db.close()
-        except Exception:
-            pass
-
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_search_status(
     task_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get the status of a search task."""
     
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
@@ -110,11 +91,11 @@ async def get_search_status(
 @router.get("/{task_id}/results")
 async def get_search_results(
     task_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get the results of a completed search task."""
     
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
@@ -130,3 +111,75 @@ async def get_search_results(
         "results": task.output_data or [],
         "completed_at": task.completed_at
     }
+
+@router.get("/{task_id}/events")
+async def stream_search_events(
+    task_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Stream a search task's progress as server-sent events instead of polling GET /search/{task_id}.
+
+    Events: status, plan_ready, source_results, dataset_found, contacts_found, outreach_sent,
+    summary_ready, step_started/step_finished, error, and a final `end` carrying the task's
+    final status. Events published by queue workers reach the API through the task event
+    bus of JOB_QUEUE_BACKEND (task_events table or Redis streams). Reconnecting clients
+    resume after their Last-Event-ID.
+    """
+
+    task = await db.get(Task, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    try:
+        last_event_id = int(request.headers.get("last-event-id", ""))
+    except ValueError:
+        last_event_id = None
+
+    return StreamingResponse(
+        _task_event_stream(task_id, task.status, task.error_message, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+async def _task_status(task_id: str) -> Optional[tuple]:
+    # Own short-lived session per poll; the request's session is closed once streaming starts
+    async with get_async_session_factory()() as db:
+        row = (await db.execute(select(Task.status, Task.error_message).where(Task.id == task_id))).first()
+    return tuple(row) if row else None
+
+async def _task_event_stream(
+    task_id: str,
+    status: str,
+    error: Optional[str],
+    last_event_id: Optional[int],
+) -> AsyncIterator[str]:
+    bus = get_task_event_bus()
+    keepalive = settings.SSE_KEEPALIVE_SECONDS
+
+    # Until the workflow publishes (still queued), follow the task row
+    reported, idle = None, 0.0
+    while not await bus.has_events(task_id):
+        if status != reported:
+            yield _sse("status", {"task_id": task_id, "status": status})
+            reported = status
+        if status in FINISHED_STATUSES:
+            yield _sse(END_EVENT, {"task_id": task_id, "status": status, "error": error})
+            return
+        await asyncio.sleep(settings.SSE_STATUS_POLL_SECONDS)
+        idle += settings.SSE_STATUS_POLL_SECONDS
+        if idle >= keepalive:
+            yield ": keepalive\n\n"
+            idle = 0.0
+        current = await _task_status(task_id)
+        if current is None:
+            yield _sse(END_EVENT, {"task_id": task_id, "status": "deleted"})
+            return
+        status, error = current
+
+    async for item in bus.subscribe(task_id, last_event_id, idle_timeout=keepalive):
+        yield ": keepalive\n\n" if item is None else item.to_sse()
@@ -2,6 +2,8 @@ from fastapi import APIRouter
 from datetime import datetime
 from app.models.schemas import HealthResponse
 from app.config import settings
+from app.core.utils.query_cache import get_query_cache
+from app.core.utils.provenance import get_provenance_writer
 
 router = APIRouter()
 
@@ -22,5 +24,7 @@ async def api_status():
         "version": settings.VERSION,
         "app_name": settings.APP_NAME,
         "timestamp": datetime.utcnow(),
-        "debug_mode": settings.DEBUG
+        "debug_mode": settings.DEBUG,
+        "query_cache": get_query_cache().stats(),
+        "provenance": get_provenance_writer().stats(),
     }
@@ -1,47 +1,73 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import select
+from sqlalchemy.orm import defer
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from app.core.database import get_db
+from datetime import datetime
+from app.api.pagination import paginate
+from app.core.database import get_async_db
+from app.core.search_tasks import cancel_running_search
 from app.models.schemas import TaskResponse
 from app.models.database import Task
 from app.models.enums import TaskType, TaskStatus
 
 router = APIRouter()
 
+# JSON columns list_tasks leaves out unless requested with include=
+HEAVY_TASK_FIELDS = ("input_data", "output_data")
+
+
+def _parse_include(include: Optional[str]) -> List[str]:
+    fields = [f.strip() for f in (include or "").split(",") if f.strip()]
+    unknown = [f for f in fields if f not in HEAVY_TASK_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown include field(s): {', '.join(unknown)}; expected {', '.join(HEAVY_TASK_FIELDS)}",
+        )
+    return fields
+
 @router.get("", response_model=List[TaskResponse])
 async def list_tasks(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page (replaces skip)"),
     task_type: Optional[TaskType] = None,
     status: Optional[TaskStatus] = None,
     user_email: Optional[str] = None,
-    db: Session = Depends(get_db)
+    include: Optional[str] = Query(None, description="Comma-separated heavy fields to return: input_data, output_data"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List all tasks with optional filtering."""
-    
-    query = db.query(Task)
+    """
+    List all tasks with optional filtering, newest first.
+
+    Returns summaries by default: input_data and output_data (the full orchestrator result)
+    are not loaded and come back as null unless named in `include`.
+    """
+    included = _parse_include(include)
+    query = select(Task).options(
+        *(defer(getattr(Task, name), raiseload=True) for name in HEAVY_TASK_FIELDS if name not in included)
+    )
     
     if task_type:
-        query = query.filter(Task.type == task_type.value)
+        query = query.where(Task.type == task_type.value)
     
     if status:
-        query = query.filter(Task.status == status.value)
+        query = query.where(Task.status == status.value)
         
     if user_email:
-        query = query.filter(Task.user_email == user_email)
+        query = query.where(Task.user_email == user_email)
     
-    # Order by creation date, newest first
-    query = query.order_by(Task.created_at.desc())
-    
-    tasks = query.offset(skip).limit(limit).all()
+    tasks = await paginate(db, query, Task, response, skip, limit, cursor)
     
     return [TaskResponse(
         id=task.id,
         type=task.type,
         status=TaskStatus(task.status),
         user_email=task.user_email,
-        input_data=task.input_data,
-        output_data=task.output_data,
+        input_data=task.input_data if "input_data" in included else None,
+        output_data=task.output_data if "output_data" in included else None,
         error_message=task.error_message,
         created_at=task.created_at,
         started_at=task.started_at,
@@ -51,11 +77,11 @@ async def list_tasks(
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific task by ID."""
     
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
@@ -75,11 +101,16 @@ async def get_task(
 @router.delete("/{task_id}")
 async def cancel_task(
     task_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Cancel a pending or running task."""
+    """
+    Cancel a pending or running task.
+    A workflow running in this process is stopped right away; workers in other processes
+    notice the cancelled status within TASK_CANCEL_CHECK_INTERVAL_SECONDS, and queued
+    tasks are skipped when delivered.
+    """
     
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
@@ -89,23 +120,23 @@ async def cancel_task(
             detail=f"Cannot cancel task with status: {task.status}"
         )
     
-    # Mark as failed with cancellation message
-    task.status = TaskStatus.FAILED.value
+    task.status = TaskStatus.CANCELLED.value
     task.error_message = "Task cancelled by user"
-    task.completed_at = db.func.now()
+    task.completed_at = datetime.utcnow()
     
-    db.commit()
+    await db.commit()
+    stopped = cancel_running_search(task_id)
     
-    return {"message": "Task cancelled successfully"}
+    return {"message": "Task cancelled successfully", "stopped_running_workflow": stopped}
 
 @router.get("/{task_id}/logs")
 async def get_task_logs(
     task_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get logs for a specific task (placeholder for future implementation)."""
     
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Header
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, Dict, Any
 import hmac
 import hashlib
 import logging
 from datetime import datetime
 
-from app.core.database import get_db
+from app.core.database import get_async_db
+from app.core.utils.provenance import log_provenance
 from app.models.database import OutreachRequest
 from app.models.enums import OutreachStatus
 from app.config import settings
@@ -21,7 +22,7 @@ logger = logging.getLogger(__name__)
 @router.post("/agentmail/webhook")
 async def handle_agentmail_webhook(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     x_agentmail_signature: Optional[str] = Header(default=None),
 ):
     """
@@ -57,11 +58,11 @@ async def handle_agentmail_webhook(
 
     try:
         if event_type == "message.received":
-            handle_message_received(db, payload)
+            await handle_message_received(db, payload)
         elif event_type == "message.delivered":
-            handle_message_delivered(db, payload)
+            await handle_message_delivered(db, payload)
         elif event_type == "message.bounced":
-            handle_message_bounced(db, payload)
+            await handle_message_bounced(db, payload)
         else:
             logger.info(f"Unhandled AgentMail event type: {event_type}")
             return {"status": "ignored", "reason": "unhandled event type", "event_type": event_type}
@@ -72,7 +73,12 @@ async def handle_agentmail_webhook(
     return {"status": "ok", "event_type": event_type}
 
 
-def handle_message_received(db: Session, payload: Dict[str, Any]) -> None:
+async def _find_outreach(db: AsyncSession, column, value: Any) -> Optional[OutreachRequest]:
+    """First outreach request whose `column` equals `value`."""
+    return await db.scalar(select(OutreachRequest).where(column == str(value)).limit(1))
+
+
+async def handle_message_received(db: AsyncSession, payload: Dict[str, Any]) -> None:
     """
     Handle incoming email replies.
     Attempt to map to outreach via thread_id, message_id, or metadata.dataset_id.
@@ -86,11 +92,11 @@ def handle_message_received(db: Session, payload: Dict[str, Any]) -> None:
 
     outreach = None
     if thread_id:
-        outreach = db.query(OutreachRequest).filter(OutreachRequest.thread_id == str(thread_id)).first()
+        outreach = await _find_outreach(db, OutreachRequest.thread_id, thread_id)
     if not outreach and message_id:
-        outreach = db.query(OutreachRequest).filter(OutreachRequest.message_id == str(message_id)).first()
+        outreach = await _find_outreach(db, OutreachRequest.message_id, message_id)
     if not outreach and dataset_id:
-        outreach = db.query(OutreachRequest).filter(OutreachRequest.dataset_id == str(dataset_id)).first()
+        outreach = await _find_outreach(db, OutreachRequest.dataset_id, dataset_id)
 
     if not outreach:
         logger.warning("Cannot map AgentMail reply to an outreach request")
@@ -108,58 +114,51 @@ def handle_message_received(db: Session, payload: Dict[str, Any]) -> None:
     if attachments:
         outreach.approval_required = True
 
-    db.commit()
+    await db.commit()
 
     # Provenance
-    try:
-        from app.core.utils.provenance import log_provenance as log_prov
-        sender = message.get("from") or message.get("from_email")
-        log_prov_sync(db, actor="webhook_receiver", action="reply_received", details={
-            "from": sender, "has_attachments": bool(attachments), "outreach_id": outreach.id
-        })
-    except Exception:
-        pass
+    sender = message.get("from") or message.get("from_email")
+    await log_provenance(actor="webhook_receiver", action="reply_received", details={
+        "from": sender, "has_attachments": bool(attachments), "outreach_id": outreach.id
+    })
 
 
-def handle_message_delivered(db: Session, payload: Dict[str, Any]) -> None:
+async def handle_message_delivered(db: AsyncSession, payload: Dict[str, Any]) -> None:
     """Update outreach status to delivered."""
     message_id = payload.get("message_id") or payload.get("id")
     thread_id = payload.get("thread_id")
 
     outreach = None
     if message_id:
-        outreach = db.query(OutreachRequest).filter(OutreachRequest.message_id == str(message_id)).first()
+        outreach = await _find_outreach(db, OutreachRequest.message_id, message_id)
     if not outreach and thread_id:
-        outreach = db.query(OutreachRequest).filter(OutreachRequest.thread_id == str(thread_id)).first()
+        outreach = await _find_outreach(db, OutreachRequest.thread_id, thread_id)
 
     if not outreach:
         logger.info("Delivery event received but outreach not found")
         return
 
     outreach.status = OutreachStatus.DELIVERED.value
-    db.commit()
+    await db.commit()
 
 
-def handle_message_bounced(db: Session, payload: Dict[str, Any]) -> None:
+async def handle_message_bounced(db: AsyncSession, payload: Dict[str, Any]) -> None:
     """Handle bounced/failed emails."""
     message_id = payload.get("message_id") or payload.get("id")
     reason = payload.get("reason") or payload.get("error") or "unknown"
 
     outreach = None
     if message_id:
-        outreach = db.query(OutreachRequest).filter(OutreachRequest.message_id == str(message_id)).first()
+        outreach = await _find_outreach(db, OutreachRequest.message_id, message_id)
 
     if not outreach:
         logger.info("Bounce event received but outreach not found")
         return
 
     outreach.status = OutreachStatus.CLOSED.value  # or keep previous; CLOSED to stop retry loop
-    db.commit()
+    await db.commit()
 
-    try:
-        log_prov_sync(db, actor="webhook_receiver", action="email_bounced", details={"reason": reason, "outreach_id": outreach.id})
-    except Exception:
-        pass
+    await log_provenance(actor="webhook_receiver", action="email_bounced", details={"reason": reason, "outreach_id": outreach.id})
 
 
 def verify_webhook_signature(body: bytes, signature: Optional[str], secret: str) -> bool:
@@ -173,25 +172,6 @@ def verify_webhook_signature(body: bytes, signature: Optional[str], secret: str)
         return False
 
 
-def log_prov_sync(db: Session, actor: str, action: str, details: Optional[Dict[str, Any]] = None) -> None:
-    """Synchronous provenance log helper to avoid creating new sessions inside webhook path."""
-    try:
-        from app.core.utils.provenance import log_provenance
-        # utils.provenance.log_provenance is async; call via loop if available, else best-effort swallow.
-        import asyncio
-        loop = None
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-        if loop and loop.is_running():
-            loop.create_task(log_provenance(actor=actor, action=action, details=details or {}))  # fire-and-forget
-        else:
-            asyncio.run(log_provenance(actor=actor, action=action, details=details or {}))
-    except Exception:
-        pass
-
-
 @router.get("/health")
 async def webhook_health():
     """Health check for webhook endpoints."""
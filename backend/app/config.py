@@ -13,6 +13,14 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = Field(default="sqlite:///./biodata.db", description="Database connection URL")
+    ASYNC_DATABASE_URL: Optional[str] = Field(default=None, description="Async driver URL for API routes (default: DATABASE_URL with aiosqlite/asyncpg)")
+    SQLITE_POOL: str = Field(default="queue", description="SQLite connection strategy: queue (connection per session) or static (one shared connection)")
+    SQLITE_POOL_SIZE: int = Field(default=10, description="Pooled SQLite connections (plus as many overflow connections)")
+    SQLITE_JOURNAL_MODE: Optional[str] = Field(default="WAL", description="PRAGMA journal_mode for SQLite connections (WAL lets readers run during writes)")
+    SQLITE_SYNCHRONOUS: Optional[str] = Field(default="NORMAL", description="PRAGMA synchronous for SQLite connections")
+    SQLITE_BUSY_TIMEOUT_MS: Optional[int] = Field(default=5000, description="PRAGMA busy_timeout: wait this long for a lock before failing")
+    SQLITE_CACHE_SIZE: Optional[int] = Field(default=-64000, description="PRAGMA cache_size (negative values are KiB, i.e. -64000 = 64 MB)")
+    SQLITE_MMAP_SIZE: Optional[int] = Field(default=268435456, description="PRAGMA mmap_size in bytes (0 disables memory-mapped reads)")
     
     # API Keys
     AGENTMAIL_API_KEY: Optional[str] = Field(default=None, description="AgentMail API key")
@@ -44,6 +52,39 @@ class Settings(BaseSettings):
     
     # Browser Service
     BROWSER_SERVICE_URL: str = Field(default="http://browser-service:3000", description="Browser service URL")
+
+    # Browser Pool (shared by Browser-Use scrapers)
+    BROWSER_POOL_SIZE: int = Field(default=2, description="Max warm browsers per site in the shared pool")
+    BROWSER_POOL_MAX_USES: int = Field(default=20, description="Leases served by a browser before it is recycled")
+    BROWSER_POOL_IDLE_TIMEOUT_SECONDS: int = Field(default=300, description="Idle seconds before a pooled browser is evicted")
+    BROWSER_POOL_PROFILE_ROOT: str = Field(default=".", description="Directory holding per-site browser profile dirs")
+
+    # NCBI E-utilities (direct GEO search)
+    GEO_SEARCH_BACKEND: str = Field(default="eutils", description="GEO search backend: 'eutils' (browser as fallback) or 'browser'")
+    NCBI_EUTILS_BASE_URL: str = Field(default="https://eutils.ncbi.nlm.nih.gov/entrez/eutils", description="NCBI E-utilities base URL")
+    NCBI_API_KEY: Optional[str] = Field(default=None, description="NCBI API key (raises rate limit from 3 to 10 req/s)")
+    NCBI_EMAIL: Optional[str] = Field(default=None, description="Contact email sent to NCBI with E-utilities requests")
+    GEO_ENRICHMENT_CONCURRENCY: int = Field(default=4, description="Max concurrent GEO enrichment fetches (SOFT headers / browser agents)")
+
+    # GEO accession metadata cache
+    GEO_CACHE_ENABLED: bool = Field(default=True, description="Cache enriched GEO accession metadata in the database")
+    GEO_CACHE_TTL_SECONDS: int = Field(default=7 * 24 * 3600, description="Seconds a cached accession is served as fresh")
+    GEO_CACHE_STALE_SECONDS: int = Field(default=30 * 24 * 3600, description="Extra seconds a stale accession is served while it is revalidated")
+
+    # Query-result cache (bio_database_agent / search_geo_direct)
+    QUERY_CACHE_ENABLED: bool = Field(default=True, description="Cache search results by normalized query fingerprint")
+    QUERY_CACHE_TTL_SECONDS: int = Field(default=3600, description="Seconds a cached search result stays valid")
+    QUERY_CACHE_MAX_ENTRIES: int = Field(default=256, description="Max cached search results (LRU eviction)")
+    
+    # GitHub prospecting
+    GITHUB_TOKEN: Optional[str] = Field(default=None, description="GitHub token for the REST/GraphQL API (GraphQL profile batches require one)")
+    GITHUB_API_URL: str = Field(default="https://api.github.com", description="GitHub API base URL")
+    GITHUB_REPO_CONCURRENCY: int = Field(default=3, description="Max repositories prospected concurrently")
+    GITHUB_ETAG_CACHE_MAX_ENTRIES: int = Field(default=1000, description="Max GitHub responses kept for conditional requests (LRU eviction)")
+    LEAD_QUALIFICATION_CONCURRENCY: int = Field(default=8, description="Max concurrent lead-qualification LLM calls")
+    LEAD_QUALIFICATION_BATCH_SIZE: int = Field(default=10, description="Issues qualified per LLM call (1 = one call per issue)")
+    LEAD_PREFILTER_ENABLED: bool = Field(default=True, description="Score issues heuristically before LLM qualification")
+    LEAD_PREFILTER_MIN_SCORE: float = Field(default=0.2, description="Minimum heuristic novice score for an issue to reach the LLM")
     
     # Requester Information
     REQUESTER_EMAIL: str = Field(default="kevin.yar@omics-os.com", description="Default requester email")
@@ -61,6 +102,39 @@ class Settings(BaseSettings):
 
     # Logging
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
+
+    # Provenance writer (buffered, batched inserts)
+    PROVENANCE_BUFFER_ENABLED: bool = Field(default=True, description="Queue provenance records and insert them in batches")
+    PROVENANCE_BATCH_SIZE: int = Field(default=100, description="Records per provenance insert")
+    PROVENANCE_FLUSH_INTERVAL_SECONDS: float = Field(default=1.0, description="Max seconds a queued provenance record waits")
+    PROVENANCE_MAX_QUEUE: int = Field(default=10000, description="Max queued provenance records")
+    PROVENANCE_OVERFLOW_POLICY: str = Field(default="drop", description="When the queue is full: 'drop' new records or 'block' until flushed")
+
+    # Job queue (search workflows)
+    JOB_QUEUE_BACKEND: str = Field(default="inline", description="Where searches run: 'inline' (API process), 'sqlite' (job table in DATABASE_URL) or 'redis' (stream)")
+    REDIS_URL: str = Field(default="redis://localhost:6379/0", description="Redis URL for the 'redis' job queue backend")
+    JOB_QUEUE_NAME: str = Field(default="biodata-jobs", description="Queue name (Redis key prefix / job table partition)")
+    JOB_WORKER_CONCURRENCY: int = Field(default=2, description="Jobs run concurrently by each worker process")
+    JOB_VISIBILITY_TIMEOUT_SECONDS: float = Field(default=300.0, description="Lease length; a job not renewed within it is redelivered")
+    JOB_MAX_ATTEMPTS: int = Field(default=3, description="Deliveries before a job is dead-lettered")
+    JOB_RETRY_BACKOFF_SECONDS: float = Field(default=5.0, description="Delay before the first retry (doubles per attempt)")
+    JOB_RETRY_BACKOFF_MAX_SECONDS: float = Field(default=300.0, description="Upper bound for the retry delay")
+    JOB_POLL_INTERVAL_SECONDS: float = Field(default=1.0, description="Idle worker wait between claim attempts")
+    TASK_CANCEL_CHECK_INTERVAL_SECONDS: float = Field(default=2.0, description="How often a running search checks whether its task was cancelled from another process")
+
+    # Search workflow
+    OUTREACH_CONCURRENCY: int = Field(default=4, description="Outreach emails a search workflow sends at the same time")
+    WORKFLOW_STEP_TIMEOUT_SECONDS: float = Field(default=300.0, description="Default time limit per plan step (a step's timeout_seconds parameter overrides it; 0 disables)")
+    WORKFLOW_STEP_CACHE_ENABLED: bool = Field(default=True, description="Reuse outputs of cacheable plan steps (colleague search) across workflows")
+    WORKFLOW_STEP_CACHE_TTL_SECONDS: int = Field(default=1800, description="Seconds a cached step output stays valid")
+    WORKFLOW_STEP_CACHE_MAX_ENTRIES: int = Field(default=128, description="Max cached step outputs (LRU eviction)")
+
+    # Task progress events (GET /search/{task_id}/events)
+    TASK_EVENTS_HISTORY_LIMIT: int = Field(default=500, description="Events kept per task for late or reconnecting subscribers")
+    TASK_EVENTS_RETENTION_SECONDS: float = Field(default=300.0, description="How long a finished task's events stay available")
+    TASK_EVENTS_POLL_SECONDS: float = Field(default=0.5, description="Event table poll interval of subscribers when JOB_QUEUE_BACKEND=sqlite")
+    SSE_KEEPALIVE_SECONDS: float = Field(default=15.0, description="Idle interval before an event stream sends a keepalive comment")
+    SSE_STATUS_POLL_SECONDS: float = Field(default=2.0, description="Status poll interval of a stream whose task has not published events yet")
     
     # Pydantic v2 settings config (replaces deprecated class Config)
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
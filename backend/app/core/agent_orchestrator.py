@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from app.core.agents import (
     planner_agent,
     bio_database_agent,
+    run_database_search,
     colleagues_agent,
     email_agent,
     summarizer_agent,
@@ -17,11 +18,89 @@ from app.core.agents import (
     InternalContact,
     SummaryInput,
 )
+from app.core.agents.planner_agent import WorkflowStep, create_workflow_plan
+from app.core.plan_executor import (
+    STEP_COMPLETED,
+    PlanExecutor,
+    PlanValidationError,
+    StepResult,
+    get_step_cache,
+    topological_order,
+)
+from app.config import settings
 from app.models.schemas import SearchRequest
 from app.core.utils.provenance import log_provenance
 
 logger = logging.getLogger(__name__)
 
+# Progress callback: on_event(event_name, data); see execute_workflow
+EventCallback = Callable[[str, Dict[str, Any]], None]
+
+
+def _emit(on_event: Optional[EventCallback], event: str, data: Dict[str, Any]) -> None:
+    """Report a progress event; a failing listener must not break the workflow."""
+    if on_event is None:
+        return
+    try:
+        on_event(event, data)
+    except Exception as e:
+        logger.warning(f"Progress listener failed on {event}: {e}")
+
+
+def _needs_outreach(d: DatasetCandidate) -> bool:
+    """Request-only datasets with a contact email get an outreach email."""
+    access_type = (d.access_type or "").lower()
+    return access_type == "request" and bool(d.contact_info and d.contact_info.get("email"))
+
+
+def _step_sources(step: Optional[WorkflowStep], search_request: SearchRequest) -> List[str]:
+    """Databases to search: the request's sources, else the step's, else GEO (MVP default)."""
+    sources = search_request.sources or (step.parameters.get("databases") if step is not None else None) or ["GEO"]
+    names = [getattr(source, "value", str(source)) for source in sources]  # "GEO", not "DatasetSource.GEO"
+    return list(dict.fromkeys(names))
+
+
+def _completed_outputs(results: Dict[int, StepResult], action: str, flatten: bool = True) -> List[Any]:
+    """Outputs of the completed steps with `action`, in step order (list outputs concatenated)."""
+    outputs: List[Any] = []
+    for _, r in sorted(results.items()):
+        if r.action != action or r.status != STEP_COMPLETED or r.output is None:
+            continue
+        if flatten and isinstance(r.output, list):
+            outputs.extend(r.output)
+        else:
+            outputs.append(r.output)
+    return outputs
+
+
+async def _collect_outreach(outreach: List[Tuple[str, asyncio.Task]]) -> List[Dict[str, Any]]:
+    """Wait for the outreach sends; a send that was cancelled (step timeout) becomes a failed result."""
+    sent = await asyncio.gather(*(sending for _, sending in outreach), return_exceptions=True)
+    return [
+        r if not isinstance(r, BaseException) else {
+            "success": False,
+            "status": "failed",
+            "error_message": str(r) or type(r).__name__,
+            "dataset_id": dataset_id,
+        }
+        for (dataset_id, _), r in zip(outreach, sent)
+    ]
+
+
+async def _no_op_step(step: WorkflowStep, results: Dict[int, StepResult]) -> None:
+    return None
+
+
+def _run_output(result: Any) -> Any:
+    """Output of an agent run; cached database searches return the candidate list directly."""
+    if isinstance(result, list):
+        return result
+    try:
+        # Pydantic AI returns AgentRunResult with .output
+        return result.output
+    except Exception:
+        return None
+
 
 class AgentOrchestrator:
     """
@@ -31,6 +110,12 @@ class AgentOrchestrator:
     3) Search internal colleagues (optional)
     4) Send outreach (if access_type requires request and contact exists)
     5) Summarize
+
+    The planner's WorkflowPlan drives execution: its steps run as a DAG on PlanExecutor, so
+    steps without a dependency path between them run concurrently (an unusable plan falls
+    back to the default plan). Within that, work is pipelined: the request's database
+    searches start alongside planning, and when the plan includes outreach each search's
+    datasets are emailed as soon as that search returns, OUTREACH_CONCURRENCY at a time.
     """
 
     def __init__(self) -> None:
@@ -42,9 +127,20 @@ class AgentOrchestrator:
             "summarizer": summarizer_agent,
         }
 
-    async def execute_workflow(self, search_request: SearchRequest, user_email: str) -> Dict[str, Any]:
+    async def execute_workflow(
+        self,
+        search_request: SearchRequest,
+        user_email: str,
+        on_event: Optional[EventCallback] = None,
+    ) -> Dict[str, Any]:
         """
         Execute complete workflow from research question to results.
+        Cancelling the calling task (e.g. cancel_task) stops the workflow at its next await,
+        cancels the searches and outreach still running and re-raises CancelledError.
+
+        `on_event(event, data)` is called as steps finish: plan_ready, source_results (per
+        database, as soon as its search returns), dataset_found (per dataset), contacts_found,
+        outreach_sent (per email), summary_ready, and step_started/step_finished per plan step.
         """
         await log_provenance(
             actor=user_email or "system",
@@ -53,107 +149,172 @@ class AgentOrchestrator:
             details={"query": search_request.query},
         )
 
+        subtasks: List[asyncio.Future] = []
+        try:
+            return await self._run_workflow(search_request, user_email, subtasks, on_event)
+        except Exception:
+            # e.g. the planner failed while searches were already running
+            for pending in subtasks:
+                pending.cancel()
+            raise
+        except asyncio.CancelledError:
+            for pending in subtasks:
+                pending.cancel()
+            await log_provenance(
+                actor=user_email or "system",
+                action="workflow_cancelled",
+                resource_type="task",
+                details={"query": search_request.query},
+            )
+            raise
+
+    async def _run_workflow(
+        self,
+        search_request: SearchRequest,
+        user_email: str,
+        subtasks: List[asyncio.Future],
+        on_event: Optional[EventCallback] = None,
+    ) -> Dict[str, Any]:
+        outreach_slots = asyncio.Semaphore(max(1, settings.OUTREACH_CONCURRENCY))
+        outreach: List[Tuple[str, asyncio.Task]] = []  # (dataset id, send) in start order
+        searches: Dict[str, asyncio.Task] = {}  # database -> search, shared by every step asking for it
+        found: Dict[str, List[DatasetCandidate]] = {}  # database -> datasets, as each search returns
+        eager_outreach: Set[str] = set()  # databases whose datasets are emailed as soon as they arrive
+
+        def start_outreach(candidates: List[DatasetCandidate]) -> None:
+            started = {dataset_id for dataset_id, _ in outreach}
+            for d in candidates:
+                if _needs_outreach(d) and d.accession not in started:
+                    started.add(d.accession)
+                    sending = asyncio.create_task(
+                        self._send_outreach(d, search_request, user_email, outreach_slots, on_event)
+                    )
+                    outreach.append((d.accession, sending))
+                    subtasks.append(sending)
+
+        def on_found(database: str, candidates: List[DatasetCandidate]) -> None:
+            found[database] = candidates
+            if database in eager_outreach:
+                start_outreach(candidates)
+
+        def search(database: str) -> asyncio.Task:
+            if database not in searches:
+                search_params = DatabaseSearchParams(
+                    query=search_request.query,
+                    database=database,
+                    max_results=search_request.max_results,
+                    filters={
+                        "modalities": search_request.modalities or [],
+                        "cancer_types": search_request.cancer_types or [],
+                    },
+                )
+                searches[database] = asyncio.create_task(
+                    self._search_source(search_params, on_event, lambda candidates: on_found(database, candidates))
+                )
+                subtasks.append(searches[database])
+            return searches[database]
+
+        # Public database searches only need the request: start them alongside planning
+        for database in _step_sources(None, search_request):
+            search(database)
+
         # Step 1: Planning
         plan_run = await planner_agent.run(search_request)
         plan = plan_run.output
+        _emit(on_event, "plan_ready", {"plan": plan.model_dump() if hasattr(plan, "model_dump") else dict(plan)})  # type: ignore[arg-type]
 
-        # Step 2: Parallel execution of searches
-        search_tasks: List[asyncio.Future] = []
-
-        # Public database searches
-        sources = search_request.sources or []
-        if not sources:
-            sources = []  # default empty; bio-database tools will default to GEO when invoked
-            # We can choose to always include GEO for MVP
-            sources = ["GEO"]
-
-        for source in sources:
-            search_params = DatabaseSearchParams(
-                query=search_request.query,
-                database=str(source),
-                max_results=search_request.max_results,
-                filters={
-                    "modalities": search_request.modalities or [],
-                    "cancer_types": search_request.cancer_types or [],
-                },
-            )
-            search_tasks.append(asyncio.create_task(bio_database_agent.run(search_params)))
+        steps = list(plan.steps or [])
+        try:
+            if not steps:
+                raise PlanValidationError("the plan has no steps")
+            topological_order(steps)
+        except PlanValidationError as e:
+            logger.warning(f"Unusable workflow plan ({e}); running the default plan")
+            steps = (await create_workflow_plan(search_request)).steps
+
+        # When send_outreach depends directly on a search step, that search's request-only
+        # datasets are emailed as soon as it returns and the outreach step waits for those
+        # emails. Outreach behind any other step (e.g. evaluate_results) waits for it.
+        outreach_inputs = {dep for step in steps if step.action == "send_outreach" for dep in step.dependencies}
+        for step in steps:
+            if step.action == "search_public" and step.step_number in outreach_inputs:
+                eager_outreach.update(_step_sources(step, search_request))
+        for database in eager_outreach:
+            start_outreach(found.get(database, []))
 
-        # Internal colleague search (if enabled)
-        if search_request.include_internal:
+        # Steps 2-5 run as the plan's DAG
+        async def search_step(step: WorkflowStep, results: Dict[int, StepResult]) -> List[DatasetCandidate]:
+            databases = _step_sources(step, search_request)
+            outputs = await asyncio.gather(*(search(database) for database in databases), return_exceptions=True)
+            candidates: List[DatasetCandidate] = []
+            for database, r in zip(databases, outputs):
+                if isinstance(r, BaseException):
+                    logger.error(f"Search sub-task error ({database}): {r!r}")
+                    continue
+                candidates.extend(_run_output(r) or [])
+            return candidates
+
+        async def colleagues_step(step: WorkflowStep, results: Dict[int, StepResult]) -> List[InternalContact]:
+            if not search_request.include_internal:
+                return []
             colleague_params = ColleagueSearchParams(
                 company="YourCompany",
                 keywords=plan.confirmed_requirements.get("keywords", []),
             )
-            search_tasks.append(asyncio.create_task(colleagues_agent.run(colleague_params)))
-
-        # Execute searches in parallel
-        results = await asyncio.gather(*search_tasks, return_exceptions=True)
-
-        # Step 3: Process search results
-        datasets: List[DatasetCandidate] = []
-        contacts: List[InternalContact] = []
-
-        for r in results:
-            if isinstance(r, Exception):
-                logger.error(f"Search sub-task error: {r}")
-                continue
-            try:
-                # Pydantic AI returns AgentRunResult with .output
-                out = r.output  # type: ignore[attr-defined]
-            except Exception:
-                out = None
-
-            if not out:
-                continue
-
-            # Heuristics to separate dataset vs contacts output
-            if isinstance(out, list) and out:
-                first = out[0]
-                if isinstance(first, DatasetCandidate) or ("accession" in dict(first)):
-                    datasets.extend(out)  # type: ignore[arg-type]
-                elif isinstance(first, InternalContact) or ("linkedin_url" in dict(first)):
-                    contacts.extend(out)  # type: ignore[arg-type]
-
-        # Step 4: Outreach for request-only datasets (if contact info exists)
-        outreach_results: List[Dict[str, Any]] = []
-        for d in datasets:
-            access_type = (d.access_type or "").lower()
-            if access_type == "request" and d.contact_info and d.contact_info.get("email"):
-                email_params = EmailOutreachParams(
-                    dataset_id=d.accession,
-                    dataset_title=d.title,
-                    requester_name=(user_email.split("@")[0] if user_email else "researcher"),
-                    requester_email=user_email or "researcher@example.com",
-                    requester_title="Researcher",
-                    contact_name=d.contact_info.get("name", "Data Custodian"),
-                    contact_email=d.contact_info["email"],  # type: ignore[index]
-                    project_description=search_request.query,
-                )
-                try:
-                    email_run = await email_agent.run(email_params)
-                    outreach_results.append(email_run.output.model_dump())
-                except Exception as e:
-                    logger.error(f"Email agent failed for {d.accession}: {e}")
-                    outreach_results.append(
-                        {
-                            "success": False,
-                            "status": "failed",
-                            "error_message": str(e),
-                            "dataset_id": d.accession,
-                        }
-                    )
+            contacts = list(_run_output(await colleagues_agent.run(colleague_params)) or [])
+            if contacts:
+                _emit(on_event, "contacts_found", {
+                    "count": len(contacts),
+                    "contacts": [cc.model_dump() if hasattr(cc, "model_dump") else dict(cc) for cc in contacts],  # type: ignore[arg-type]
+                })
+            return contacts
+
+        async def outreach_step(step: WorkflowStep, results: Dict[int, StepResult]) -> List[Dict[str, Any]]:
+            start_outreach(_completed_outputs(results, "search_public"))
+            return await _collect_outreach(outreach)
 
-        # Step 5: Summarize
-        summary_input = SummaryInput(
-            research_question=search_request.query,
-            datasets_found=[dc.model_dump() if hasattr(dc, "model_dump") else dict(dc) for dc in datasets],  # type: ignore[arg-type]
-            contacts_identified=[cc.model_dump() if hasattr(cc, "model_dump") else dict(cc) for cc in contacts],  # type: ignore[arg-type]
-            outreach_sent=outreach_results,
-            total_duration_minutes=5,
+        async def summary_step(step: WorkflowStep, results: Dict[int, StepResult]) -> Any:
+            summary_input = SummaryInput(
+                research_question=search_request.query,
+                datasets_found=[dc.model_dump() if hasattr(dc, "model_dump") else dict(dc) for dc in _completed_outputs(results, "search_public")],  # type: ignore[arg-type]
+                contacts_identified=[cc.model_dump() if hasattr(cc, "model_dump") else dict(cc) for cc in _completed_outputs(results, "find_colleagues")],  # type: ignore[arg-type]
+                outreach_sent=_completed_outputs(results, "send_outreach"),
+                total_duration_minutes=5,
+            )
+            summary_run = await summarizer_agent.run(summary_input)
+            summary = summary_run.output
+            _emit(on_event, "summary_ready", {"summary": summary.model_dump() if hasattr(summary, "model_dump") else dict(summary)})  # type: ignore[arg-type]
+            return summary
+
+        executor = PlanExecutor(
+            handlers={
+                "search_public": search_step,
+                "find_colleagues": colleagues_step,
+                "send_outreach": outreach_step,
+                "summarize": summary_step,
+            },
+            default_handler=_no_op_step,  # e.g. evaluate_results: ordering only, nothing to run
+            cache=get_step_cache(),
+            cacheable_actions={"find_colleagues"},
+            cache_context={
+                "request": search_request.model_dump(mode="json"),
+                "keywords": plan.confirmed_requirements.get("keywords", []),
+            },
+            skip_on_failed_dependency=False,  # e.g. summarize even if the colleague search failed
+            on_event=on_event,
         )
-        summary_run = await summarizer_agent.run(summary_input)
-        summary = summary_run.output
+        results = await executor.run(steps)
+        for pending in searches.values():
+            pending.cancel()  # speculative searches no step asked for
+
+        summaries = [r for r in results.values() if r.action == "summarize"]
+        if summaries and all(r.status != STEP_COMPLETED for r in summaries):
+            raise RuntimeError(f"Summarize step {summaries[-1].status}: {summaries[-1].error}")
+        summary = _completed_outputs(results, "summarize", flatten=False)
+        summary = summary[-1] if summary else None
+        datasets: List[DatasetCandidate] = _completed_outputs(results, "search_public")
+        contacts: List[InternalContact] = _completed_outputs(results, "find_colleagues")
+        outreach_results = await _collect_outreach(outreach)
 
         await log_provenance(
             actor=user_email or "system",
@@ -163,6 +324,7 @@ class AgentOrchestrator:
                 "datasets_count": len(datasets),
                 "contacts_count": len(contacts),
                 "outreach_count": len(outreach_results),
+                "steps": {str(n): r.status for n, r in sorted(results.items())},
             },
         )
 
@@ -171,5 +333,63 @@ class AgentOrchestrator:
             "datasets": [dc.model_dump() if hasattr(dc, "model_dump") else dict(dc) for dc in datasets],  # type: ignore[arg-type]
             "contacts": [cc.model_dump() if hasattr(cc, "model_dump") else dict(cc) for cc in contacts],  # type: ignore[arg-type]
             "outreach": outreach_results,
-            "summary": summary.model_dump() if hasattr(summary, "model_dump") else dict(summary),  # type: ignore[arg-type]
+            "summary": summary.model_dump() if hasattr(summary, "model_dump") else summary,  # type: ignore[union-attr]
+            "steps": [r.summary() for _, r in sorted(results.items())],
         }
+
+    async def _search_source(
+        self,
+        params: DatabaseSearchParams,
+        on_event: Optional[EventCallback],
+        on_found: Optional[Callable[[List[DatasetCandidate]], None]] = None,
+    ) -> Any:
+        """Search one database and hand its results on (events, outreach) as soon as they arrive."""
+        try:
+            result = await run_database_search(params)
+        except Exception as e:
+            _emit(on_event, "source_results", {"source": params.database, "count": 0, "error": str(e)})
+            raise
+        found = _run_output(result) or []
+        _emit(on_event, "source_results", {"source": params.database, "count": len(found)})
+        for d in found:
+            _emit(on_event, "dataset_found", {
+                "source": params.database,
+                "dataset": d.model_dump() if hasattr(d, "model_dump") else dict(d),
+            })
+        if on_found is not None:
+            on_found(list(found))
+        return result
+
+    async def _send_outreach(
+        self,
+        d: DatasetCandidate,
+        search_request: SearchRequest,
+        user_email: str,
+        slots: asyncio.Semaphore,
+        on_event: Optional[EventCallback],
+    ) -> Dict[str, Any]:
+        """Email the dataset's contact (holding one of `slots`); failures become a failed result."""
+        try:
+            email_params = EmailOutreachParams(
+                dataset_id=d.accession,
+                dataset_title=d.title,
+                requester_name=(user_email.split("@")[0] if user_email else "researcher"),
+                requester_email=user_email or "researcher@example.com",
+                requester_title="Researcher",
+                contact_name=d.contact_info.get("name", "Data Custodian"),  # type: ignore[union-attr]
+                contact_email=d.contact_info["email"],  # type: ignore[index]
+                project_description=search_request.query,
+            )
+            async with slots:
+                email_run = await email_agent.run(email_params)
+            outcome = email_run.output.model_dump()
+        except Exception as e:
+            logger.error(f"Email agent failed for {d.accession}: {e}")
+            outcome = {
+                "success": False,
+                "status": "failed",
+                "error_message": str(e),
+                "dataset_id": d.accession,
+            }
+        _emit(on_event, "outreach_sent", {"dataset_id": d.accession, "outreach": outcome})
+        return outcome
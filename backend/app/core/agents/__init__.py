@@ -1,5 +1,5 @@
 from .planner_agent import planner_agent, WorkflowPlan, WorkflowStep
-from .biodatabase_agent import DatabaseSearchParams, DatasetCandidate
+from .biodatabase_agent import bio_database_agent, run_database_search, DatabaseSearchParams, DatasetCandidate
 from .colleagues_agent import colleagues_agent, ColleagueSearchParams, InternalContact
 from .email_agent import email_agent, EmailOutreachParams, EmailResult
 from .summarizer_agent import summarizer_agent, SummaryInput, ResearchSummary
@@ -8,6 +8,8 @@ __all__ = [
     "planner_agent",
     "WorkflowPlan",
     "WorkflowStep",
+    "bio_database_agent",
+    "run_database_search",
     "DatabaseSearchParams",
     "DatasetCandidate",
     "colleagues_agent",
@@ -12,6 +12,8 @@ from pydantic_ai.models.bedrock import BedrockConverseModel
 from app.core.utils.provenance import log_provenance
 from app.config import settings
 from app.core.scrapers.geo_scraper import GEOScraper
+from app.core.integrations.ncbi_eutils import get_eutils_client
+from app.core.utils.query_cache import get_query_cache, query_fingerprint
 
 # Browser-Use (Python) — MUST be used for scraping
 
@@ -28,6 +30,8 @@ class DatabaseSearchParams(BaseModel):
     database: str  # 'GEO'|'PRIDE'|'ENSEMBL'
     filters: Dict[str, Any] = {}
     max_results: int = 20
+    backend: str = Field(default_factory=lambda: settings.GEO_SEARCH_BACKEND)  # 'eutils'|'browser'
+    bypass_cache: bool = False  # skip the query-result cache and force a fresh search
 
 
 class DatasetCandidate(BaseModel):
@@ -158,36 +162,89 @@ def _extract_json_list(text: str) -> List[Dict[str, Any]]:
 #             pass
 
 
+def _to_candidate_dict(r: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize a GEOScraper / E-utilities record into a DatasetCandidate-like dict.
+    """
+    contact_name = r.get("contact_name")
+    contact_email = r.get("contact_email")
+    contact_info = {"name": contact_name, "email": contact_email} if (contact_name or contact_email) else None
+    return {
+        "accession": r.get("accession", ""),
+        "title": r.get("title", ""),
+        "description": r.get("description"),
+        "modalities": r.get("modalities", []),
+        "cancer_types": r.get("cancer_types", []),
+        "sample_size": r.get("sample_size"),
+        "access_type": r.get("access_type", "public"),
+        "download_url": r.get("download_url"),
+        "contact_info": contact_info,
+        "link": r.get("link"),
+        "relevance_score": 0.0,
+    }
+
+
+async def _search_geo_raw(
+    query: str,
+    max_results: int,
+    backend: Optional[str] = None,
+    bypass_cache: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch raw GEO records via NCBI E-utilities, falling back to the Browser-Use scraper
+    when the 'browser' backend is selected or the E-utilities call fails.
+    Results are served from the query cache for repeated (query, max_results, backend) inputs.
+    """
+    backend = (backend or settings.GEO_SEARCH_BACKEND or "eutils").lower()
+
+    async def _fetch() -> List[Dict[str, Any]]:
+        if backend == "eutils":
+            try:
+                return await get_eutils_client().search_datasets(query=query, max_results=max_results)
+            except Exception as e:
+                logger.warning(f"E-utilities GEO search failed, falling back to browser scraper: {e}")
+
+        scraper = GEOScraper(headless=not bool(getattr(settings, "DEBUG", False)))
+        return await scraper.search_datasets(query=query, max_results=max_results)
+
+    key = query_fingerprint(query, "GEO", max_results=max_results, namespace=f"geo_raw:{backend}")
+    return await get_query_cache().get_or_compute(key, _fetch, bypass=bypass_cache)
+
+
+async def run_database_search(params: DatabaseSearchParams) -> List[DatasetCandidate]:
+    """
+    Run bio_database_agent for `params`, reusing cached output for identical
+    (query, database, filters, max_results) requests unless params.bypass_cache is set.
+    """
+
+    async def _run() -> List[Dict[str, Any]]:
+        agent_run = await bio_database_agent.run(params)
+        return [c.model_dump() if hasattr(c, "model_dump") else dict(c) for c in (agent_run.output or [])]
+
+    key = query_fingerprint(
+        params.query,
+        params.database,
+        filters=params.filters,
+        max_results=params.max_results,
+        namespace=f"agent:{params.backend}",
+    )
+    rows = await get_query_cache().get_or_compute(key, _run, bypass=params.bypass_cache)
+    return [DatasetCandidate(**row) for row in rows]
+
+
 @bio_database_agent.tool(retries=2)
 async def search_ncbi_geo(ctx: RunContext[DatabaseSearchParams]) -> List[Dict[str, Any]]:
     """
-    Search NCBI GEO using the dedicated GEOScraper (Browser-Use under the hood).
+    Search NCBI GEO (E-utilities by default, GEOScraper/Browser-Use as fallback).
     Returns a list of dicts normalized for DatasetCandidate.
     """
-    scraper = GEOScraper(headless=not bool(getattr(settings, "DEBUG", False)))
-    raw = await scraper.search_datasets(query=ctx.deps.query, max_results=ctx.deps.max_results)
-
-    # Normalize into DatasetCandidate-like dicts expected by downstream code
-    results: List[Dict[str, Any]] = []
-    for r in raw:
-        contact_name = r.get("contact_name")
-        contact_email = r.get("contact_email")
-        contact_info = {"name": contact_name, "email": contact_email} if (contact_name or contact_email) else None
-        results.append(
-            {
-                "accession": r.get("accession", ""),
-                "title": r.get("title", ""),
-                "description": r.get("description"),
-                "modalities": r.get("modalities", []),
-                "cancer_types": r.get("cancer_types", []),
-                "sample_size": r.get("sample_size"),
-                "access_type": r.get("access_type", "public"),
-                "download_url": r.get("download_url"),
-                "contact_info": contact_info,
-                "link": r.get("link"),
-                "relevance_score": 0.0,
-            }
-        )
+    raw = await _search_geo_raw(
+        ctx.deps.query,
+        ctx.deps.max_results,
+        backend=ctx.deps.backend,
+        bypass_cache=ctx.deps.bypass_cache,
+    )
+    results: List[Dict[str, Any]] = [_to_candidate_dict(r) for r in raw]
 
     await log_provenance(
         actor="bio_database_agent",
@@ -197,16 +254,47 @@ async def search_ncbi_geo(ctx: RunContext[DatabaseSearchParams]) -> List[Dict[st
     return results
 
 
-async def search_geo_direct(query: str, max_results: int) -> List[Dict[str, Any]]:
+async def search_geo_direct(
+    query: str,
+    max_results: int,
+    backend: Optional[str] = None,
+    bypass_cache: bool = False,
+) -> List[Dict[str, Any]]:
     """
     Professional GEO search with dynamic optimization and validation.
-    Uses the bio_database_agent's intelligence for query optimization and result validation.
+    With the 'eutils' backend the query goes straight to NCBI E-utilities (no LLM, no browser);
+    otherwise, or if E-utilities fails, the bio_database_agent drives the search.
+    Identical requests are answered from the query cache unless `bypass_cache` is set.
     """
+    backend = (backend or settings.GEO_SEARCH_BACKEND or "eutils").lower()
+    key = query_fingerprint(query, "GEO", max_results=max_results, namespace=f"geo_direct:{backend}")
+    return await get_query_cache().get_or_compute(
+        key,
+        lambda: _search_geo_direct_uncached(query, max_results, backend),
+        bypass=bypass_cache,
+    )
+
+
+async def _search_geo_direct_uncached(query: str, max_results: int, backend: str) -> List[Dict[str, Any]]:
+    if backend == "eutils":
+        try:
+            raw = await get_eutils_client().search_datasets(query=query, max_results=max_results)
+            results = [_to_candidate_dict(r) for r in raw]
+            await log_provenance(
+                actor="bio_database_agent",
+                action="searched_geo_eutils",
+                details={"query": query, "results_count": len(results)},
+            )
+            return results
+        except Exception as e:
+            logger.warning(f"E-utilities search failed, falling back to agent search: {e}")
+
     # Create search parameters
     search_params = DatabaseSearchParams(
         query=query,
         database="GEO",
-        max_results=max_results
+        max_results=max_results,
+        backend="browser",
     )
     
     try:
@@ -242,26 +330,7 @@ async def search_geo_direct(query: str, max_results: int) -> List[Dict[str, Any]
     scraper = GEOScraper(headless=not bool(getattr(settings, "DEBUG", False)))
     raw = await scraper.search_datasets(query=query, max_results=max_results)
 
-    results: List[Dict[str, Any]] = []
-    for r in raw:
-        contact_name = r.get("contact_name")
-        contact_email = r.get("contact_email")
-        contact_info = {"name": contact_name, "email": contact_email} if (contact_name or contact_email) else None
-        results.append(
-            {
-                "accession": r.get("accession", ""),
-                "title": r.get("title", ""),
-                "description": r.get("description"),
-                "modalities": r.get("modalities", []),
-                "cancer_types": r.get("cancer_types", []),
-                "sample_size": r.get("sample_size"),
-                "access_type": r.get("access_type", "public"),
-                "download_url": r.get("download_url"),
-                "contact_info": contact_info,
-                "link": r.get("link"),
-                "relevance_score": 0.0,
-            }
-        )
+    results: List[Dict[str, Any]] = [_to_candidate_dict(r) for r in raw]
 
     await log_provenance(
         actor="bio_database_agent",
@@ -314,8 +383,6 @@ async def search_with_advanced_strategy(ctx: RunContext[DatabaseSearchParams]) -
     optimized_query = ctx.deps.query
     
     # Step 2: Execute search with optimized query
-    scraper = GEOScraper(headless=not bool(getattr(settings, "DEBUG", False)))
-    
     # Apply filters based on context
     filters = ctx.deps.filters.copy()
     if not filters.get("date_range"):
@@ -323,27 +390,19 @@ async def search_with_advanced_strategy(ctx: RunContext[DatabaseSearchParams]) -
     if not filters.get("organisms"):
         filters["organisms"] = ["human"]  # Default to human studies
     
-    raw_results = await scraper.search_datasets(
-        query=optimized_query, 
-        max_results=ctx.deps.max_results * 2  # Get more for filtering
+    raw_results = await _search_geo_raw(
+        optimized_query,
+        ctx.deps.max_results * 2,  # Get more for filtering
+        backend=ctx.deps.backend,
+        bypass_cache=ctx.deps.bypass_cache,
     )
     
     # Step 3: Process and validate each result
     validated_results = []
     for r in raw_results:
         # Normalize result structure
-        result = {
-            "accession": r.get("accession", ""),
-            "title": r.get("title", ""),
-            "description": r.get("description"),
-            "modalities": r.get("modalities", []),
-            "cancer_types": r.get("cancer_types", []),
-            "sample_size": r.get("sample_size"),
-            "access_type": r.get("access_type", "public"),
-            "download_url": r.get("download_url"),
-            "contact_info": {"name": r.get("contact_name"), "email": r.get("contact_email")} if (r.get("contact_name") or r.get("contact_email")) else None,
-            "link": r.get("link"),
-        }
+        result = _to_candidate_dict(r)
+        result.pop("relevance_score", None)
         
         # Validate metadata requirements
         validation = await validate_metadata_requirements(ctx, result)
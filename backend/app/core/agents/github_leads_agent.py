@@ -2,16 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import math
+import uuid
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
+from sqlalchemy import select, update
 from app.config import settings
 from app.core.utils.provenance import log_provenance
 from app.core.scrapers.github_issues_scraper import GitHubIssuesScraper
 from app.models.schemas import LeadCreate
 from app.models.enums import LeadStage
+from app.utils.scoring import score_issue_for_outreach
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -33,22 +37,46 @@ async def prospect_github_issues(
     require_email: bool = True,
     persist_to_db: bool = True,
     profile_enrichment: str = "browser",
+    repo_concurrency: Optional[int] = None,
+    llm_concurrency: Optional[int] = None,
+    incremental: bool = True,
+    qualification_batch_size: Optional[int] = None,
+    prefilter_min_score: Optional[float] = None,
 ) -> List[Dict[str, Any]]:
     """
     Direct GitHub prospecting function with AI-powered lead qualification.
     
+    Repositories are prospected concurrently (bounded by `repo_concurrency`) and issues are
+    qualified concurrently under one LLM semaphore shared by all repos (`llm_concurrency`).
+    Results are merged in `target_repos` order, then issue order, regardless of completion order.
+    
+    With `incremental`, each repo resumes from its stored high-water mark (github_sync_state)
+    and issues whose issue_url is already in the leads table are not re-qualified.
+    
+    Before the LLM, issues are scored with the heuristic novice scorer; only issues scoring at
+    least `prefilter_min_score` (and, with `require_email`, having an email) are qualified.
+    
     Args:
         target_repos: List of repos in "owner/repo" format
         max_issues_per_repo: Max issues to fetch per repo
         require_email: Only include leads with email addresses
         persist_to_db: Whether to save leads to database
-        profile_enrichment: Enrichment strategy for email/website ("none", "simple", "browser")
+        profile_enrichment: Enrichment strategy for email/website ("none", "simple", "browser", "api")
+        repo_concurrency: Max repos prospected at once (default: settings.GITHUB_REPO_CONCURRENCY)
+        llm_concurrency: Max concurrent qualification calls (default: settings.LEAD_QUALIFICATION_CONCURRENCY)
+        incremental: Resume from per-repo sync state and skip already-stored leads; the sync
+            cursor only advances once the run's leads are stored (so requires persist_to_db)
+        qualification_batch_size: Issues qualified per LLM call (default: settings.LEAD_QUALIFICATION_BATCH_SIZE;
+            1 qualifies each issue separately)
+        prefilter_min_score: Heuristic score lower bound (default: settings.LEAD_PREFILTER_MIN_SCORE
+            when settings.LEAD_PREFILTER_ENABLED, else 0.0 which disables the pre-filter)
         
     Returns:
         List of qualified lead dictionaries
     """
     if target_repos is None:
         target_repos = ["scverse/scanpy", "scverse/anndata"]
+    target_repos = list(dict.fromkeys(target_repos))
     
     await log_provenance(
         actor="github_leads_agent",
@@ -60,54 +88,65 @@ async def prospect_github_issues(
         },
     )
     
-    scraper = GitHubIssuesScraper(headless=not bool(getattr(settings, "DEBUG", False)))
+    repo_semaphore = asyncio.Semaphore(max(1, repo_concurrency or settings.GITHUB_REPO_CONCURRENCY))
+    llm_semaphore = asyncio.Semaphore(max(1, llm_concurrency or settings.LEAD_QUALIFICATION_CONCURRENCY))
+    batch_size = qualification_batch_size or settings.LEAD_QUALIFICATION_BATCH_SIZE
+    if prefilter_min_score is None:
+        prefilter_min_score = settings.LEAD_PREFILTER_MIN_SCORE if settings.LEAD_PREFILTER_ENABLED else 0.0
+    
+    async def _run_repo(repo: str) -> Tuple[List[Dict[str, Any]], Dict[str, int], Dict[str, Any]]:
+        async with repo_semaphore:
+            return await _prospect_repo(
+                repo,
+                max_issues_per_repo=max_issues_per_repo,
+                require_email=require_email,
+                profile_enrichment=profile_enrichment,
+                llm_semaphore=llm_semaphore,
+                incremental=incremental,
+                batch_size=batch_size,
+                prefilter_min_score=prefilter_min_score,
+            )
+    
+    repo_results = await asyncio.gather(*(_run_repo(repo) for repo in target_repos), return_exceptions=True)
+    
+    # Deterministic merge: repo order, then issue order; first occurrence of an issue_url wins
     all_qualified_leads = []
     leads_by_repo = {}
-    
-    for repo in target_repos:
-        try:
-            logger.info(f"Fetching issues from {repo}")
-            
-            # Fetch issues with full content from repository
-            issues = await scraper.fetch_issue_list(repo, max_issues_per_repo, profile_enrichment=profile_enrichment)
-            
-            # Use AI agent to qualify each lead
-            qualified_issues = []
-            for issue in issues:
-                try:
-                    # Have the AI agent decide if this is a good prospect
-                    qualification = await _qualify_lead_with_ai(issue, repo)
-                    
-                    if qualification.get("should_contact", False):
-                        issue["repo"] = repo
-                        issue["qualification_reason"] = qualification.get("reason", "")
-                        issue["contact_priority"] = qualification.get("priority", "medium")
-                        qualified_issues.append(issue)
-                        
-                except Exception as e:
-                    logger.debug(f"Failed to qualify issue {issue.get('issue_number')} from {repo}: {e}")
-                    continue
-            
-            # Apply email requirement filter
-            if require_email:
-                qualified_issues = [lead for lead in qualified_issues if lead.get("email")]
-            
-            leads_by_repo[repo] = len(qualified_issues)
-            all_qualified_leads.extend(qualified_issues)
-            
-            logger.info(f"Found {len(qualified_issues)} qualified leads from {repo}")
-            
-        except Exception as e:
-            logger.error(f"Failed to prospect {repo}: {e}")
+    prefilter = {"issues_scored": 0, "issues_prefiltered": 0, "llm_calls_avoided": 0}
+    seen_urls = set()
+    sync_updates = {}
+    for repo, result in zip(target_repos, repo_results):
+        if isinstance(result, BaseException):
+            logger.error(f"Failed to prospect {repo}: {result}")
             leads_by_repo[repo] = 0
             continue
+        leads, repo_stats, sync_updates[repo] = result
+        for key in prefilter:
+            prefilter[key] += repo_stats.get(key, 0)
+        leads_by_repo[repo] = len(leads)
+        for lead in leads:
+            url = lead.get("issue_url")
+            if url and url in seen_urls:
+                continue
+            if url:
+                seen_urls.add(url)
+            all_qualified_leads.append(lead)
     
     # Persist leads to database if requested
+    persisted = persist_to_db
     if persist_to_db and all_qualified_leads:
         try:
             await _persist_leads_to_db(all_qualified_leads)
         except Exception as e:
             logger.error(f"Failed to persist leads to database: {e}")
+            persisted = False
+    
+    # Advance the sync cursors only once the leads behind them are stored; otherwise the
+    # next run fetches the same issues again
+    if incremental and persisted:
+        for repo, sync in sync_updates.items():
+            if sync["issues"]:
+                await _save_sync_state(repo, sync["issues"], sync["previous"])
     
     await log_provenance(
         actor="github_leads_agent",
@@ -115,14 +154,215 @@ async def prospect_github_issues(
         details={
             "total_qualified": len(all_qualified_leads),
             "leads_by_repo": leads_by_repo,
+            "prefilter_min_score": prefilter_min_score,
+            **prefilter,
         },
     )
     
     return all_qualified_leads
 
 
+async def _prospect_repo(
+    repo: str,
+    max_issues_per_repo: int,
+    require_email: bool,
+    profile_enrichment: str,
+    llm_semaphore: asyncio.Semaphore,
+    incremental: bool = True,
+    batch_size: int = 1,
+    prefilter_min_score: float = 0.0,
+) -> Tuple[List[Dict[str, Any]], Dict[str, int], Dict[str, Any]]:
+    """
+    Fetch and qualify one repository's issues. Qualification calls (batched or per issue)
+    run concurrently under `llm_semaphore`; the returned list keeps the fetched issue order.
+    Also returns pre-filter counters for the prospecting_completed event, and the sync
+    update for the caller to save once the leads are stored: the fetched issues up to the
+    first one whose qualification failed, and the previous sync state.
+    """
+    logger.info(f"Fetching issues from {repo}")
+    
+    # One scraper per repo: scrapers hold their leased browser on the instance
+    scraper = GitHubIssuesScraper(headless=not bool(getattr(settings, "DEBUG", False)))
+    
+    sync_state = await _load_sync_state(repo) if incremental else {}
+    
+    # Fetch issues with full content from repository (only new/changed ones when incremental)
+    fetched = await scraper.fetch_issue_list(
+        repo,
+        max_issues_per_repo,
+        profile_enrichment=profile_enrichment,
+        since=sync_state.get("last_updated_at"),
+    )
+    
+    issues = fetched
+    if incremental and fetched:
+        known = await _existing_lead_urls([i.get("issue_url") for i in fetched])
+        issues = [i for i in fetched if i.get("issue_url") not in known]
+        if known:
+            logger.info(f"Skipping {len(fetched) - len(issues)} already-qualified issues from {repo}")
+    
+    candidates = _prefilter_issues(issues, prefilter_min_score, require_email)
+    stats = {
+        "issues_scored": len(issues),
+        "issues_prefiltered": len(issues) - len(candidates),
+        # Calls the LLM stage would have made for the unfiltered issues, minus the calls it makes
+        "llm_calls_avoided": math.ceil(len(issues) / max(1, batch_size)) - math.ceil(len(candidates) / max(1, batch_size)),
+    }
+    if stats["issues_prefiltered"]:
+        logger.info(f"Pre-filter dropped {stats['issues_prefiltered']} of {len(issues)} issues from {repo}")
+    
+    decisions = await _qualify_issues(candidates, repo, llm_semaphore, batch_size=batch_size)
+    
+    # The cursor stops before the first issue that could not be qualified, so it is retried
+    failed = {id(issue) for issue, qualification in zip(candidates, decisions) if qualification is None}
+    processed = []
+    for issue in fetched:
+        if id(issue) in failed:
+            break
+        processed.append(issue)
+    
+    qualified_issues = []
+    for issue, qualification in zip(candidates, decisions):
+        if not qualification or not qualification.get("should_contact", False):
+            continue
+        issue["repo"] = repo
+        issue["qualification_reason"] = qualification.get("reason", "")
+        issue["contact_priority"] = qualification.get("priority", "medium")
+        issue["confidence"] = qualification.get("confidence", 0.0)
+        qualified_issues.append(issue)
+    
+    # Apply email requirement filter
+    if require_email:
+        qualified_issues = [lead for lead in qualified_issues if lead.get("email")]
+    
+    logger.info(f"Found {len(qualified_issues)} qualified leads from {repo}")
+    return qualified_issues, stats, {"issues": processed, "previous": sync_state}
+
+
+def _prefilter_issues(issues: List[Dict[str, Any]], min_score: float, require_email: bool) -> List[Dict[str, Any]]:
+    """
+    Cheap first stage: attach heuristic `signals`/`novice_score` to every issue and keep those
+    worth an LLM call (score >= min_score, and an email when one is required).
+    """
+    kept = []
+    for issue in issues:
+        score_issue_for_outreach(issue)
+        if require_email and not issue.get("email"):
+            continue
+        if issue.get("novice_score", 0.0) < min_score:
+            continue
+        kept.append(issue)
+    return kept
+
+
+async def _qualify_issues(
+    issues: List[Dict[str, Any]],
+    repo: str,
+    llm_semaphore: asyncio.Semaphore,
+    batch_size: int = 1,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Qualification decisions aligned with `issues` (None where qualification failed).
+    With batch_size > 1, issues are sent K per LLM call; issues the batch answer misses or
+    gets wrong are re-qualified one by one.
+    """
+    async def _single(issue: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        try:
+            # Have the AI agent decide if this is a good prospect
+            async with llm_semaphore:
+                return await _qualify_lead_with_ai(issue, repo)
+        except Exception as e:
+            logger.debug(f"Failed to qualify issue {issue.get('issue_number')} from {repo}: {e}")
+            return None
+    
+    if batch_size <= 1:
+        return list(await asyncio.gather(*(_single(i) for i in issues)))
+    
+    async def _chunk(chunk: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        async with llm_semaphore:
+            by_number = await _qualify_leads_batch(chunk, repo)
+        # Fallback runs outside the semaphore we held above, so it cannot deadlock
+        pending = [i for i in chunk if int(i.get("issue_number") or 0) not in by_number]
+        if pending:
+            logger.info(f"Batch qualification fell back to per-issue calls for {len(pending)} issue(s) from {repo}")
+            for issue, decision in zip(pending, await asyncio.gather(*(_single(i) for i in pending))):
+                by_number[int(issue.get("issue_number") or 0)] = decision
+        return [by_number.get(int(i.get("issue_number") or 0)) for i in chunk]
+    
+    chunks = [issues[i:i + batch_size] for i in range(0, len(issues), batch_size)]
+    results = await asyncio.gather(*(_chunk(c) for c in chunks))
+    return [decision for chunk_result in results for decision in chunk_result]
+
+
+async def _load_sync_state(repo: str) -> Dict[str, Any]:
+    """Return the stored high-water marks for a repo ({} when never synced or unavailable)."""
+    from app.core.database import get_async_session_factory
+    from app.models.database import GitHubSyncState
+    
+    try:
+        async with get_async_session_factory()() as session:
+            state = await session.get(GitHubSyncState, repo)
+    except Exception as e:
+        logger.warning(f"Could not load sync state for {repo}; doing a full fetch: {e}")
+        return {}
+    if state is None:
+        return {}
+    return {
+        "last_issue_number": state.last_issue_number or 0,
+        "last_updated_at": state.last_updated_at,
+    }
+
+
+async def _save_sync_state(repo: str, issues: List[Dict[str, Any]], previous: Dict[str, Any]) -> None:
+    """Advance the repo's high-water marks to the last of the issues processed in this run."""
+    from app.core.database import get_async_session_factory
+    from app.models.database import GitHubSyncState
+    
+    last_number = max([previous.get("last_issue_number") or 0] + [int(i.get("issue_number") or 0) for i in issues])
+    stamps = [str(t) for t in (i.get("issue_updated_at") or i.get("issue_created_at") for i in issues) if t]
+    last_updated = previous.get("last_updated_at")
+    if last_updated:
+        # Incremental fetches list the oldest changes first: resume after the last one processed.
+        # ISO 8601 UTC timestamps compare correctly as strings.
+        if stamps:
+            last_updated = max(str(last_updated), stamps[-1])
+    else:
+        # A first run lists the newest issues; start from the latest change seen
+        last_updated = max(stamps, default=None)
+    
+    try:
+        async with get_async_session_factory()() as session:
+            state = await session.get(GitHubSyncState, repo)
+            if state is None:
+                state = GitHubSyncState(repo=repo)
+                session.add(state)
+            state.last_issue_number = last_number
+            state.last_updated_at = last_updated
+            state.last_synced_at = datetime.utcnow()
+            await session.commit()
+    except Exception as e:
+        logger.warning(f"Could not save sync state for {repo}: {e}")
+
+
+async def _existing_lead_urls(issue_urls: List[Optional[str]]) -> set:
+    """issue_urls that are already stored in the leads table (one IN query)."""
+    from app.core.database import get_async_session_factory
+    from app.models.database import Lead
+    
+    urls = [u for u in issue_urls if u]
+    if not urls:
+        return set()
+    try:
+        async with get_async_session_factory()() as session:
+            return set((await session.scalars(select(Lead.issue_url).where(Lead.issue_url.in_(urls)))).all())
+    except Exception as e:
+        logger.warning(f"Could not check existing leads: {e}")
+        return set()
+
+
 class LeadQualificationInput(BaseModel):
     """Input for AI lead qualification"""
+    issue_number: int = 0
     issue_title: str
     issue_body: str = ""  # Default empty string to avoid validation errors
     issue_labels: List[str] = []  # Default empty list
@@ -138,26 +378,51 @@ class LeadQualificationResult(BaseModel):
     confidence: float = Field(ge=0, le=1)
 
 
+class LeadQualificationBatchInput(BaseModel):
+    """Several issues from one repository, qualified in a single LLM call"""
+    repo: str
+    issues: List[LeadQualificationInput]
+
+
+class LeadQualificationBatchItem(LeadQualificationResult):
+    """Batch result for one issue, keyed by issue number"""
+    issue_number: int
+
+
 # Create specialized agent for lead qualification
+LEAD_QUALIFICATION_INSTRUCTIONS = (
+    "You are an expert at identifying struggling bioinformatics users who would benefit from omics-os a no-code bioinformatics tool.\n"
+    "Analyze GitHub issues to determine if the user is:\n"
+    "1. Struggling with bioinformatics tools (ScanPy, AnnData, MuData, BioPython)\n"
+    "2. Showing signs of being a beginner or having difficulties\n"
+    "3. Would benefit from a no-code solution like omics-os\n\n"
+    "Prioritize:\n"
+    "- HIGH: Clear struggle with basic tasks, installation issues, beginner questions\n"
+    "- MEDIUM: General usage questions, moderate difficulty\n"
+    "- LOW: Advanced users with complex technical questions\n\n"
+    "Do NOT contact:\n"
+    "- Advanced users asking sophisticated questions\n"
+    "- Feature requests from power users\n"
+    "- Issues that show deep technical knowledge\n"
+    "- Generally accept everybody\n"
+)
+
 lead_qualification_agent = Agent[LeadQualificationInput, LeadQualificationResult](
     'openai:gpt-4.1',
     deps_type=LeadQualificationInput,
     output_type=LeadQualificationResult,
+    instructions=LEAD_QUALIFICATION_INSTRUCTIONS,
+)
+
+# Same criteria, several issues per request (one system prompt for K issues)
+batch_lead_qualification_agent = Agent[LeadQualificationBatchInput, List[LeadQualificationBatchItem]](
+    'openai:gpt-4.1',
+    deps_type=LeadQualificationBatchInput,
+    output_type=List[LeadQualificationBatchItem],
     instructions=(
-        "You are an expert at identifying struggling bioinformatics users who would benefit from omics-os a no-code bioinformatics tool.\n"
-        "Analyze GitHub issues to determine if the user is:\n"
-        "1. Struggling with bioinformatics tools (ScanPy, AnnData, MuData, BioPython)\n"
-        "2. Showing signs of being a beginner or having difficulties\n"
-        "3. Would benefit from a no-code solution like omics-os\n\n"
-        "Prioritize:\n"
-        "- HIGH: Clear struggle with basic tasks, installation issues, beginner questions\n"
-        "- MEDIUM: General usage questions, moderate difficulty\n"
-        "- LOW: Advanced users with complex technical questions\n\n"
-        "Do NOT contact:\n"
-        "- Advanced users asking sophisticated questions\n"
-        "- Feature requests from power users\n"
-        "- Issues that show deep technical knowledge\n",
-        "- Generally accept everybody\n"
+        LEAD_QUALIFICATION_INSTRUCTIONS
+        + "\nYou will receive several issues at once. Return exactly one result per issue, "
+        "with issue_number copied from the input.\n"
     ),
 )
 
@@ -188,6 +453,7 @@ async def _qualify_lead_with_ai(issue: Dict[str, Any], repo: str, max_retries: i
         try:
             # Prepare input for AI qualification
             qualification_input = LeadQualificationInput(
+                issue_number=int(issue.get("issue_number") or 0),
                 issue_title=issue.get("issue_title", ""),
                 issue_body=issue.get("issue_body", ""),
                 issue_labels=issue.get("issue_labels", []),
@@ -197,7 +463,8 @@ async def _qualify_lead_with_ai(issue: Dict[str, Any], repo: str, max_retries: i
             
             # Run AI qualification - FIXED: Pass prompt as first arg, deps as parameter
             result = await lead_qualification_agent.run(
-                "Analyze this GitHub issue and determine if the user would benefit from omics-os",
+                "Analyze this GitHub issue and determine if the user would benefit from omics-os:\n"
+                + qualification_input.model_dump_json(),
                 deps=qualification_input
             )
             ####################
@@ -250,68 +517,162 @@ async def _qualify_lead_with_ai(issue: Dict[str, Any], repo: str, max_retries: i
     }
 
 
-async def _persist_leads_to_db(leads: List[Dict[str, Any]]) -> None:
+async def _qualify_leads_batch(issues: List[Dict[str, Any]], repo: str, max_body_chars: int = 2000) -> Dict[int, Dict[str, Any]]:
+    """
+    Qualify several issues with one batch_lead_qualification_agent call.
+    
+    Returns decisions keyed by issue number. Issues without a title are decided locally;
+    issues missing from the answer (or answered twice / with unknown numbers) are left out
+    so the caller can re-qualify them individually. Never raises.
+    """
+    decisions: Dict[int, Dict[str, Any]] = {}
+    inputs: List[LeadQualificationInput] = []
+    for issue in issues:
+        number = int(issue.get("issue_number") or 0)
+        if not issue.get("issue_title"):
+            decisions[number] = {
+                "should_contact": False,
+                "reason": "Missing issue title",
+                "priority": "low",
+                "confidence": 0.0,
+            }
+            continue
+        inputs.append(
+            LeadQualificationInput(
+                issue_number=number,
+                issue_title=issue.get("issue_title", ""),
+                issue_body=(issue.get("issue_body") or "")[:max_body_chars],
+                issue_labels=issue.get("issue_labels") or [],
+                user_login=issue.get("user_login", ""),
+                repo=repo,
+            )
+        )
+    if not inputs:
+        return decisions
+    
+    batch_input = LeadQualificationBatchInput(repo=repo, issues=inputs)
+    try:
+        items = await _run_batch_qualification(batch_input)
+    except Exception as e:
+        logger.warning(f"Batch qualification failed for {len(inputs)} issue(s) from {repo}: {e}")
+        return decisions
+    
+    expected = {i.issue_number for i in inputs}
+    counts: Dict[int, int] = {}
+    for item in items:
+        counts[item.issue_number] = counts.get(item.issue_number, 0) + 1
+    for item in items:
+        if item.issue_number not in expected or counts[item.issue_number] > 1:
+            continue
+        decisions[item.issue_number] = {
+            "should_contact": item.should_contact,
+            "reason": item.reason,
+            "priority": item.priority,
+            "confidence": item.confidence,
+        }
+    
+    answered = [i for i in inputs if i.issue_number in decisions]
+    await log_provenance(
+        actor="lead_qualification_agent",
+        action="qualified_leads_batch",
+        resource_type="repo",
+        resource_id=repo,
+        details={
+            "batch_size": len(inputs),
+            "answered": len(answered),
+            "results": [
+                {
+                    "issue_number": i.issue_number,
+                    "should_contact": decisions[i.issue_number]["should_contact"],
+                    "priority": decisions[i.issue_number]["priority"],
+                    "confidence": decisions[i.issue_number]["confidence"],
+                }
+                for i in answered
+            ],
+        },
+    )
+    return decisions
+
+
+async def _run_batch_qualification(batch_input: LeadQualificationBatchInput) -> List[LeadQualificationBatchItem]:
+    """Single LLM round trip for a batch of issues."""
+    result = await batch_lead_qualification_agent.run(
+        "Analyze these GitHub issues and decide, for each one, if the user would benefit from omics-os:\n"
+        + batch_input.model_dump_json(),
+        deps=batch_input,
+    )
+    return list(result.output or [])
+
+
+async def _persist_leads_to_db(leads: List[Dict[str, Any]], batch_size: int = 500) -> Dict[str, int]:
     """
     Persist qualified leads to the database.
     Performs upsert based on issue_url to avoid duplicates.
+    
+    One IN query finds which issue_urls already exist, then rows are written in batches:
+    INSERT ... ON CONFLICT (issue_url) DO UPDATE on SQLite and PostgreSQL, a bulk insert
+    plus a bulk update by primary key elsewhere. Returns inserted/updated counts.
     """
     from app.core.database import SessionLocal
     from app.models.database import Lead
-    from sqlalchemy.exc import IntegrityError
     
     if not leads:
-        return
-        
+        return {"inserted": 0, "updated": 0}
+    
+    # Validate and convert; a later duplicate issue_url wins, as with row-by-row upserts
+    rows: Dict[str, Dict[str, Any]] = {}
+    for lead_data in leads:
+        try:
+            row = _lead_row(lead_data)
+        except Exception as e:
+            logger.error(f"Failed to process lead {lead_data.get('issue_url')}: {e}")
+            continue
+        rows[row["issue_url"]] = row
+    if not rows:
+        return {"inserted": 0, "updated": 0}
+    
     session = SessionLocal()
     
     try:
-        for lead_data in leads:
-            try:
-                # Convert dict to LeadCreate schema for validation
-                # Store AI qualification results in signals field
-                qualification_data = {
-                    "qualification_reason": lead_data.get("qualification_reason", ""),
-                    "contact_priority": lead_data.get("contact_priority", "medium"),
-                    "confidence": lead_data.get("confidence", 0.0),
-                    "ai_qualified": True,
-                }
-                
-                lead_create = LeadCreate(
-                    repo=lead_data.get("repo", ""),
-                    issue_number=lead_data.get("issue_number", 0),
-                    issue_url=lead_data.get("issue_url", ""),
-                    issue_title=lead_data.get("issue_title", ""),
-                    issue_labels=lead_data.get("issue_labels", []),
-                    issue_created_at=_parse_date(lead_data.get("issue_created_at")),
-                    user_login=lead_data.get("user_login", ""),
-                    profile_url=lead_data.get("profile_url", ""),
-                    email=lead_data.get("email"),
-                    website=lead_data.get("website"),
-                    signals=qualification_data,
-                    novice_score=lead_data.get("confidence", 0.0),  # Use AI confidence as score
-                    stage=LeadStage.ENRICHED,  # Already qualified and enriched
+        existing: Dict[str, str] = {}
+        urls = list(rows)
+        for i in range(0, len(urls), batch_size):
+            chunk = urls[i:i + batch_size]
+            existing.update(session.query(Lead.issue_url, Lead.id).filter(Lead.issue_url.in_(chunk)).all())
+        
+        now = datetime.utcnow()
+        values = list(rows.values())
+        dialect = session.get_bind().dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            if dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            for i in range(0, len(values), batch_size):
+                stmt = dialect_insert(Lead).values(values[i:i + batch_size])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Lead.issue_url],
+                    set_={
+                        **{name: stmt.excluded[name] for name in values[0] if name not in ("id", "issue_url")},
+                        "updated_at": now,
+                    },
                 )
-                
-                # Check if lead already exists
-                existing = session.query(Lead).filter_by(issue_url=lead_create.issue_url).first()
-                
-                if existing:
-                    # Update existing lead with new data
-                    for field, value in lead_create.model_dump().items():
-                        if field not in ["id", "created_at"]:  # Don't update these
-                            setattr(existing, field, value)
-                    existing.updated_at = datetime.utcnow()
-                else:
-                    # Create new lead
-                    new_lead = Lead(**lead_create.model_dump())
-                    session.add(new_lead)
-                
-            except Exception as e:
-                logger.error(f"Failed to process lead {lead_data.get('issue_url')}: {e}")
-                continue
+                session.execute(stmt)
+        else:
+            inserts = [row for url, row in rows.items() if url not in existing]
+            updates = [
+                {**{k: v for k, v in row.items() if k != "issue_url"}, "id": existing[url], "updated_at": now}
+                for url, row in rows.items() if url in existing
+            ]
+            if inserts:
+                session.execute(Lead.__table__.insert(), inserts)
+            if updates:
+                session.execute(update(Lead), updates)
         
         session.commit()
-        logger.info(f"Successfully persisted {len(leads)} leads to database")
+        counts = {"inserted": len(rows) - len(existing), "updated": len(existing)}
+        logger.info(f"Successfully persisted {len(rows)} leads to database ({counts['inserted']} new, {counts['updated']} updated)")
+        return counts
         
     except Exception as e:
         session.rollback()
@@ -321,6 +682,39 @@ async def _persist_leads_to_db(leads: List[Dict[str, Any]]) -> None:
         session.close()
 
 
+def _lead_row(lead_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Column values for one qualified lead, validated through LeadCreate."""
+    # Store AI qualification results in signals field
+    qualification_data = {
+        **(lead_data.get("signals") or {}),
+        "heuristic_score": lead_data.get("novice_score"),
+        "qualification_reason": lead_data.get("qualification_reason", ""),
+        "contact_priority": lead_data.get("contact_priority", "medium"),
+        "confidence": lead_data.get("confidence", 0.0),
+        "ai_qualified": True,
+    }
+    
+    lead_create = LeadCreate(
+        repo=lead_data.get("repo", ""),
+        issue_number=lead_data.get("issue_number", 0),
+        issue_url=lead_data.get("issue_url", ""),
+        issue_title=lead_data.get("issue_title", ""),
+        issue_labels=lead_data.get("issue_labels", []),
+        issue_created_at=_parse_date(lead_data.get("issue_created_at")),
+        user_login=lead_data.get("user_login", ""),
+        profile_url=lead_data.get("profile_url", ""),
+        email=lead_data.get("email"),
+        website=lead_data.get("website"),
+        signals=qualification_data,
+        novice_score=lead_data.get("confidence", 0.0),  # Use AI confidence as score
+        stage=LeadStage.ENRICHED,  # Already qualified and enriched
+    )
+    row = lead_create.model_dump()
+    row["stage"] = lead_create.stage.value
+    row["id"] = str(uuid.uuid4())  # only used when the row is inserted
+    return row
+
+
 def _parse_date(date_str: Optional[str]) -> Optional[datetime]:
     """Parse date string to datetime object."""
     if not date_str:
@@ -43,6 +43,8 @@ planner_agent = Agent[SearchRequest, WorkflowPlan](
         "3. Evaluate results\n"
         "4. Send outreach emails for non-public datasets\n"
         "5. Generate summary\n"
+        "Outreach only needs the search results: make send_outreach depend on the search step\n"
+        "itself unless it must wait for another step's output.\n"
     ),
 )
 
@@ -80,12 +82,13 @@ async def create_workflow_plan(search_request: SearchRequest) -> WorkflowPlan:
                     "departments": [],
                     "keywords": [],
                 },
-                dependencies=[1],
+                dependencies=[],  # uses the request's keywords, not search results: runs alongside step 1
             )
         )
 
     # Step 3: Evaluate results
     next_step = 2 if not include_internal else 3
+    evaluate_step = next_step
     steps.append(
         WorkflowStep(
             step_number=next_step,
@@ -104,7 +107,7 @@ async def create_workflow_plan(search_request: SearchRequest) -> WorkflowPlan:
             action="send_outreach",
             description="Compose and send data access requests (for non-public datasets with contacts)",
             parameters={"template": "data_request"},
-            dependencies=[next_step - 1],
+            dependencies=[1],  # emails each search's request-only datasets as that search returns
         )
     )
 
@@ -116,7 +119,7 @@ async def create_workflow_plan(search_request: SearchRequest) -> WorkflowPlan:
             action="summarize",
             description="Create executive summary and export data",
             parameters={"format": "executive_summary"},
-            dependencies=[next_step - 1],
+            dependencies=[evaluate_step, next_step - 1],
         )
     )
 
@@ -1,4 +1,8 @@
-from sqlalchemy import create_engine
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
@@ -7,15 +11,62 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+
+def sqlite_pragmas() -> List[Tuple[str, Any]]:
+    """
+    PRAGMAs run on every new SQLite connection, from the SQLITE_* settings (None skips one).
+    busy_timeout comes first so switching the journal mode waits for other connections.
+    """
+    pragmas = [
+        ("busy_timeout", settings.SQLITE_BUSY_TIMEOUT_MS),
+        ("journal_mode", settings.SQLITE_JOURNAL_MODE),
+        ("synchronous", settings.SQLITE_SYNCHRONOUS),
+        ("cache_size", settings.SQLITE_CACHE_SIZE),
+        ("mmap_size", settings.SQLITE_MMAP_SIZE),
+    ]
+    return [(name, value) for name, value in pragmas if value is not None]
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in sqlite_pragmas():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    return make_url(url).database in (None, "", ":memory:")
+
+
+def create_database_engine(url: str, sqlite_pool: Optional[str] = None, apply_pragmas: bool = True) -> Engine:
+    """
+    Sync engine for `url`.
+
+    SQLite files get a queue pool by default (SQLITE_POOL="queue"): each session checks out
+    its own connection, so with WAL readers are not blocked by a writer in a background
+    search. SQLITE_POOL="static" keeps the single shared connection; in-memory databases
+    always use it, since every new connection would be a separate empty database.
+    """
+    if not url.startswith("sqlite"):
+        return create_engine(url)
+    pool = (sqlite_pool or settings.SQLITE_POOL).lower()
+    if pool not in ("queue", "static"):
+        raise ValueError(f"Unknown SQLite pool: {pool}")
+    kwargs: dict = {"connect_args": {"check_same_thread": False}}
+    if pool == "static" or _is_memory_sqlite(url):
+        kwargs["poolclass"] = StaticPool
+    else:
+        kwargs.update(pool_size=settings.SQLITE_POOL_SIZE, max_overflow=settings.SQLITE_POOL_SIZE)
+    sqlite_engine = create_engine(url, **kwargs)
+    if apply_pragmas:
+        event.listen(sqlite_engine, "connect", _apply_sqlite_pragmas)
+    return sqlite_engine
+
+
 # Create SQLAlchemy engine
-if settings.DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
-        settings.DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-else:
-    engine = create_engine(settings.DATABASE_URL)
+engine = create_database_engine(settings.DATABASE_URL)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -31,6 +82,88 @@ def get_db() -> Session:
     finally:
         db.close()
 
+
+# Async driver per sync URL scheme (used when ASYNC_DATABASE_URL is not set)
+_ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+_ASYNC_DRIVER_NAMES = {"aiosqlite", "asyncpg", "psycopg", "psycopg_async"}
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+
+def async_database_url(url: Optional[str] = None) -> str:
+    """ASYNC_DATABASE_URL, or DATABASE_URL with its driver swapped for the async one."""
+    if url is None and settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    parsed = make_url(url or settings.DATABASE_URL)
+    backend = parsed.get_backend_name()
+    if backend not in _ASYNC_DRIVERS or parsed.get_driver_name() in _ASYNC_DRIVER_NAMES:
+        return parsed.render_as_string(hide_password=False)
+    return parsed.set(drivername=_ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """Return the process-wide async engine (created on first use, so the driver is only needed by async callers)."""
+    global _async_engine
+    if _async_engine is None:
+        url = async_database_url()
+        if url.startswith("sqlite"):
+            kwargs = {"connect_args": {"check_same_thread": False}}
+            if _is_memory_sqlite(url):
+                kwargs["poolclass"] = StaticPool
+            _async_engine = create_async_engine(url, **kwargs)
+            event.listen(_async_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+        else:
+            _async_engine = create_async_engine(url, pool_pre_ping=True)
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    global _async_session_factory
+    if _async_session_factory is None:
+        # expire_on_commit=False: attributes stay loaded after commit (no implicit async IO on access)
+        _async_session_factory = async_sessionmaker(get_async_engine(), class_=AsyncSession, expire_on_commit=False)
+    return _async_session_factory
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Get async database session (FastAPI dependency)."""
+    async with get_async_session_factory()() as session:
+        yield session
+
+
+async def close_async_engine() -> None:
+    """Dispose the async engine's connections (application shutdown)."""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
+
+def ensure_indexes(bind=None) -> List[str]:
+    """
+    Create model indexes missing from existing tables (create_all skips tables that already
+    exist, and with them any index added to the model later). Idempotent; returns the names
+    of the indexes created.
+    """
+    from sqlalchemy import inspect
+    from app.models import database  # noqa: F401  (register models)
+
+    bind = bind or engine
+    created: List[str] = []
+    inspector = inspect(bind)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda i: i.name):
+            if index.name not in existing:
+                index.create(bind=bind)
+                created.append(index.name)
+    if created:
+        logger.info(f"Created indexes: {', '.join(created)}")
+    return created
+
 async def init_db():
     """Initialize database tables."""
     try:
@@ -39,6 +172,7 @@ async def init_db():
         
         # Create all tables
         Base.metadata.create_all(bind=engine)
+        ensure_indexes(engine)
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Error initializing database: {e}")
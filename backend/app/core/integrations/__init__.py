@@ -1,2 +1,4 @@
 # Integrations package
 # - agentmail_client: Thin wrapper around AgentMail SDK with retries, provenance, and fallbacks.
+# - ncbi_eutils: Direct NCBI E-utilities (esearch/esummary) client for GEO with pooled HTTP and rate limiting.
+# - github_api: GitHub REST (issues) + GraphQL (batched profiles) client with ETag caching and rate-limit handling.
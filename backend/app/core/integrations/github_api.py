@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+from multidict import CIMultiDict
+
+from app.config import settings
+from app.core.utils.query_cache import QueryCache
+
+logger = logging.getLogger(__name__)
+
+GRAPHQL_BATCH_SIZE = 100  # GitHub allows up to 100 aliased nodes per query comfortably
+
+_LINK_NEXT_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+
+class GitHubAPIError(Exception):
+    """Raised when the GitHub API returns an unexpected status or payload."""
+
+
+class GitHubRateLimitError(GitHubAPIError):
+    """Raised when the rate limit is exhausted and the reset is too far away to wait for."""
+
+
+class GitHubAPIClient:
+    """
+    GitHub REST + GraphQL client for issue prospecting.
+
+    - Issues come from the paginated REST issues endpoint (pull requests are skipped).
+    - Author profiles are fetched in GraphQL batches of up to 100 users per query
+      (REST /users/{login} fallback when no token is configured; GraphQL requires one).
+    - GET requests are conditional (ETag / If-None-Match); 304 responses are served from
+      the in-memory ETag cache (an LRU of `etag_cache_size` responses) and do not count
+      against the primary rate limit.
+    - X-RateLimit-* headers are tracked; when the budget is exhausted the client waits for
+      the reset if it is within `max_rate_limit_wait` seconds, otherwise raises.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        api_url: Optional[str] = None,
+        graphql_url: Optional[str] = None,
+        timeout: float = 30.0,
+        max_connections: int = 10,
+        max_rate_limit_wait: float = 60.0,
+        max_retries: int = 3,
+        etag_cache_size: Optional[int] = None,
+    ) -> None:
+        self.token = token if token is not None else settings.GITHUB_TOKEN
+        self.api_url = (api_url or settings.GITHUB_API_URL).rstrip("/")
+        self.graphql_url = graphql_url or f"{self.api_url}/graphql"
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self.max_retries = max(1, max_retries)
+
+        self.rate_limit: Dict[str, Optional[int]] = {"limit": None, "remaining": None, "reset": None}
+        # url -> (etag, payload, headers); no TTL, since every hit is revalidated with GitHub
+        self._etags = QueryCache(
+            max_entries=etag_cache_size if etag_cache_size is not None else settings.GITHUB_ETAG_CACHE_MAX_ENTRIES,
+            ttl=0,
+            enabled=True,
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def list_issues(
+        self,
+        repo: str,
+        max_issues: int = 25,
+        state: str = "open",
+        since: Optional[str] = None,
+        sort: str = "created",
+        direction: str = "desc",
+    ) -> List[Dict[str, Any]]:
+        """
+        List issues for "owner/repo" in the scraper's issue format (pull requests excluded).
+        `since` (ISO 8601) restricts to issues updated at or after that time.
+        """
+        per_page = max(1, min(100, max_issues))
+        params: Optional[Dict[str, Any]] = {
+            "state": state,
+            "per_page": per_page,
+            "sort": sort,
+            "direction": direction,
+        }
+        if since:
+            params["since"] = since
+
+        url: Optional[str] = f"{self.api_url}/repos/{repo}/issues"
+        issues: List[Dict[str, Any]] = []
+        while url and len(issues) < max_issues:
+            payload, headers = await self._get(url, params)
+            if not isinstance(payload, list):
+                raise GitHubAPIError(f"Unexpected issues payload for {repo}")
+            for item in payload:
+                if "pull_request" in item:
+                    continue
+                issues.append(self.to_issue(item))
+                if len(issues) >= max_issues:
+                    break
+            url = self._next_link(headers.get("Link", ""))
+            params = None  # the next link already carries the query string
+        return issues
+
+    async def fetch_user_profiles(self, logins: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch profile metadata for many users, keyed by login."""
+        unique = list(dict.fromkeys(l for l in logins if l))
+        if not unique:
+            return {}
+
+        profiles: Dict[str, Dict[str, Any]] = {}
+        if self.token:
+            for start in range(0, len(unique), GRAPHQL_BATCH_SIZE):
+                profiles.update(await self._graphql_profiles(unique[start:start + GRAPHQL_BATCH_SIZE]))
+            return profiles
+
+        semaphore = asyncio.Semaphore(self.max_connections)
+
+        async def _one(login: str) -> None:
+            async with semaphore:
+                try:
+                    data, _ = await self._get(f"{self.api_url}/users/{login}")
+                    profiles[login] = self.to_profile(
+                        login=data.get("login") or login,
+                        created_at=data.get("created_at"),
+                        followers=data.get("followers"),
+                        public_repos=data.get("public_repos"),
+                        email=data.get("email"),
+                        website=data.get("blog"),
+                    )
+                except GitHubRateLimitError:
+                    raise
+                except Exception as e:
+                    logger.debug(f"GitHub profile fetch failed for {login}: {e}")
+
+        await asyncio.gather(*(_one(login) for login in unique))
+        return profiles
+
+    @staticmethod
+    def to_issue(item: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a REST issue object onto the scraper's issue dict."""
+        user = item.get("user") or {}
+        login = user.get("login") or ""
+        return {
+            "issue_number": int(item.get("number") or 0),
+            "issue_title": item.get("title") or "",
+            "issue_url": item.get("html_url") or "",
+            "user_login": login,
+            "profile_url": user.get("html_url") or (f"https://github.com/{login}" if login else ""),
+            "issue_body": item.get("body") or "",
+            "issue_labels": [
+                (label.get("name") if isinstance(label, dict) else str(label))
+                for label in (item.get("labels") or [])
+            ],
+            "issue_created_at": item.get("created_at"),
+            "issue_updated_at": item.get("updated_at"),
+            "email": None,
+            "website": None,
+        }
+
+    @staticmethod
+    def to_profile(
+        login: str,
+        created_at: Optional[str],
+        followers: Optional[int],
+        public_repos: Optional[int],
+        email: Optional[str] = None,
+        website: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Normalize profile fields; account_age_days is derived from created_at."""
+        account_age_days = None
+        if created_at:
+            try:
+                created = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+                account_age_days = (datetime.now(timezone.utc) - created).days
+            except ValueError:
+                account_age_days = None
+        return {
+            "user_login": login,
+            "user_created_at": created_at,
+            "account_age_days": account_age_days,
+            "followers": followers,
+            "public_repos": public_repos,
+            "email": email or None,
+            "website": website or None,
+        }
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def _graphql_profiles(self, logins: List[str]) -> Dict[str, Dict[str, Any]]:
+        fields = (
+            "login createdAt email websiteUrl "
+            "followers { totalCount } repositories(privacy: PUBLIC) { totalCount }"
+        )
+        aliases = [f"u{i}: user(login: {json.dumps(login)}) {{ {fields} }}" for i, login in enumerate(logins)]
+        query = "query {\n  " + "\n  ".join(aliases) + "\n  rateLimit { cost remaining resetAt }\n}"
+
+        payload = await self._post(self.graphql_url, {"query": query})
+        data = payload.get("data") or {}
+        for err in payload.get("errors") or []:
+            # Unknown/suspended users come back as per-alias NOT_FOUND errors
+            logger.debug(f"GitHub GraphQL error: {err.get('message')}")
+
+        profiles: Dict[str, Dict[str, Any]] = {}
+        for i, login in enumerate(logins):
+            node = data.get(f"u{i}")
+            if not node:
+                continue
+            profiles[login] = self.to_profile(
+                login=node.get("login") or login,
+                created_at=node.get("createdAt"),
+                followers=(node.get("followers") or {}).get("totalCount"),
+                public_repos=(node.get("repositories") or {}).get("totalCount"),
+                email=node.get("email"),
+                website=node.get("websiteUrl"),
+            )
+        return profiles
+
+    async def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, CIMultiDict]:
+        """Conditional GET; returns (json payload, response headers)."""
+        cache_key = url + ("?" + json.dumps(params, sort_keys=True) if params else "")
+        cached = self._etags.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+
+        status, payload, resp_headers = await self._request("GET", url, params=params, headers=headers)
+        if status == 304 and cached:
+            return cached[1], cached[2]
+        etag = resp_headers.get("ETag")
+        if etag:
+            self._etags.set(cache_key, (etag, payload, resp_headers))
+        return payload, resp_headers
+
+    async def _post(self, url: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        _, payload, _ = await self._request("POST", url, json_body=body)
+        return payload or {}
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[int, Any, CIMultiDict]:
+        session = await self._get_session()
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self.max_retries):
+            await self._wait_for_rate_limit()
+            try:
+                async with session.request(method, url, params=params, headers=headers, json=json_body) as response:
+                    resp_headers = CIMultiDict(response.headers)  # header names are case-insensitive
+                    self._record_rate_limit(resp_headers)
+
+                    if response.status == 304:
+                        return 304, None, resp_headers
+                    if response.status in (403, 429) and self._is_rate_limited(response.status, resp_headers):
+                        last_error = GitHubRateLimitError(f"{method} {url} rate limited")
+                        await self._sleep_for_retry(resp_headers)
+                        continue
+                    if response.status >= 500:
+                        last_error = GitHubAPIError(f"{method} {url} returned HTTP {response.status}")
+                    elif response.status >= 400:
+                        raise GitHubAPIError(f"{method} {url} returned HTTP {response.status}")
+                    else:
+                        return response.status, await response.json(content_type=None), resp_headers
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = e
+
+            if attempt < self.max_retries - 1:
+                await asyncio.sleep(0.5 * (2 ** attempt))
+
+        if isinstance(last_error, GitHubRateLimitError):
+            raise last_error
+        raise GitHubAPIError(f"{method} {url} failed after {self.max_retries} attempts: {last_error}")
+
+    def _record_rate_limit(self, headers: Dict[str, str]) -> None:
+        for key, header in (("limit", "X-RateLimit-Limit"), ("remaining", "X-RateLimit-Remaining"), ("reset", "X-RateLimit-Reset")):
+            value = headers.get(header)
+            if value is not None and str(value).isdigit():
+                self.rate_limit[key] = int(value)
+
+    def _is_rate_limited(self, status: int, headers: Dict[str, str]) -> bool:
+        return status == 429 or "Retry-After" in headers or headers.get("X-RateLimit-Remaining") == "0"
+
+    async def _sleep_for_retry(self, headers: Dict[str, str]) -> None:
+        retry_after = headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            wait = float(retry_after)
+        else:
+            reset = self.rate_limit.get("reset")
+            wait = max(0.0, reset - time.time()) if reset else 1.0
+        if wait > self.max_rate_limit_wait:
+            raise GitHubRateLimitError(f"GitHub rate limit resets in {int(wait)}s")
+        await asyncio.sleep(wait)
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Pause before a request when the last response said the budget is exhausted."""
+        if self.rate_limit.get("remaining") != 0:
+            return
+        reset = self.rate_limit.get("reset") or 0
+        wait = reset - time.time()
+        if wait <= 0:
+            self.rate_limit["remaining"] = None
+            return
+        if wait > self.max_rate_limit_wait:
+            raise GitHubRateLimitError(f"GitHub rate limit resets in {int(wait)}s")
+        logger.info(f"GitHub rate limit exhausted; waiting {wait:.0f}s for reset")
+        await asyncio.sleep(wait)
+        self.rate_limit["remaining"] = None
+
+    @staticmethod
+    def _next_link(link_header: str) -> Optional[str]:
+        m = _LINK_NEXT_RE.search(link_header or "")
+        return m.group(1) if m else None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            headers = {
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+                "User-Agent": "biodata-assistant",
+            }
+            if self.token:
+                headers["Authorization"] = f"Bearer {self.token}"
+            self._session = aiohttp.ClientSession(
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+            )
+            self._session_loop = loop
+        return self._session
+
+
+_github_client: Optional[GitHubAPIClient] = None
+
+
+def get_github_client() -> GitHubAPIClient:
+    """Return the process-wide GitHub API client (shares connections and the ETag cache)."""
+    global _github_client
+    if _github_client is None:
+        _github_client = GitHubAPIClient()
+    return _github_client
@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from app.config import settings
+from app.core.scrapers.geo_scraper import GEODataset
+
+logger = logging.getLogger(__name__)
+
+GEO_QUERY_BASE_URL = "https://www.ncbi.nlm.nih.gov/geo/query"
+GEO_ACC_URL = GEO_QUERY_BASE_URL + "/acc.cgi?acc={accession}"
+PUBMED_URL = "https://pubmed.ncbi.nlm.nih.gov/{pubmed_id}/"
+
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+
+
+class EUtilsError(Exception):
+    """Raised when NCBI E-utilities returns an error payload or an unexpected response."""
+
+
+class EUtilsGEOClient:
+    """
+    Direct NCBI E-utilities client for GEO DataSets (db=gds).
+
+    One esearch (usehistory=y) stores the hit list on the NCBI history server; esummary is
+    then paged through WebEnv/query_key in batches of `batch_size`. A single aiohttp session
+    (with a bounded connection pool) is reused across calls and requests are throttled to
+    NCBI's published rate limits (3 req/s, 10 req/s with an API key).
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        email: Optional[str] = None,
+        tool: str = "biodata-assistant",
+        timeout: float = 30.0,
+        batch_size: int = 200,
+        max_retries: int = 3,
+        max_connections: int = 10,
+        min_interval: Optional[float] = None,
+        geo_base_url: Optional[str] = None,
+        cache: Optional[Any] = None,
+    ) -> None:
+        self.base_url = (base_url or settings.NCBI_EUTILS_BASE_URL).rstrip("/")
+        self.geo_base_url = (geo_base_url or GEO_QUERY_BASE_URL).rstrip("/")
+        self.cache = cache  # optional GEOMetadataCache consulted before SOFT fetches
+        self.api_key = api_key if api_key is not None else settings.NCBI_API_KEY
+        self.email = email if email is not None else settings.NCBI_EMAIL
+        self.tool = tool
+        self.timeout = timeout
+        self.batch_size = max(1, batch_size)
+        self.max_retries = max(1, max_retries)
+        self.max_connections = max_connections
+        if min_interval is None:
+            min_interval = 0.1 if self.api_key else 0.34
+        self.min_interval = min_interval
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._throttle_lock: Optional[asyncio.Lock] = None
+        self._last_request = 0.0
+
+    async def search_datasets(
+        self,
+        query: str,
+        max_results: int = 20,
+        enrich_contacts: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search GEO and return GEODataset-shaped dicts (same surface as GEOScraper.search_datasets).
+        With `enrich_contacts`, series records are completed from their SOFT headers
+        (contact, supplementary files) since esummary does not carry them.
+        """
+        search = await self.esearch(query, retmax=max_results)
+        total = min(search["count"], max_results)
+        if total <= 0:
+            return []
+
+        docs: List[Dict[str, Any]] = []
+        for retstart in range(0, total, self.batch_size):
+            docs.extend(
+                await self.esummary(
+                    webenv=search["webenv"],
+                    query_key=search["query_key"],
+                    retstart=retstart,
+                    retmax=min(self.batch_size, total - retstart),
+                )
+            )
+
+        datasets: List[Dict[str, Any]] = []
+        for doc in docs[:max_results]:
+            try:
+                datasets.append(self.to_geo_dataset(doc).model_dump())
+            except Exception as e:
+                logger.debug(f"Skipping unparseable esummary document {doc.get('uid')}: {e}")
+
+        if enrich_contacts:
+            await self._enrich_from_soft(datasets)
+        return datasets
+
+    async def fetch_soft_header(self, accession: str) -> Dict[str, Any]:
+        """
+        Fetch the brief SOFT header for one GEO accession (acc.cgi?targ=self&form=text)
+        and return the enrichment fields parsed from it.
+        """
+        text = await self._request(
+            f"{self.geo_base_url}/acc.cgi",
+            {"acc": accession, "targ": "self", "form": "text", "view": "brief"},
+            as_json=False,
+        )
+        return parse_soft_header(text)
+
+    async def fetch_soft_headers(
+        self,
+        accessions: List[str],
+        concurrency: Optional[int] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch SOFT headers for many accessions in one pass over the pooled session.
+        Requests run concurrently (bounded by `concurrency`) but still respect the NCBI rate limit;
+        accessions that fail are omitted from the result.
+        """
+        unique = list(dict.fromkeys(a for a in accessions if a))
+        if not unique:
+            return {}
+        semaphore = asyncio.Semaphore(max(1, concurrency or settings.GEO_ENRICHMENT_CONCURRENCY))
+
+        async def _one(acc: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await self.fetch_soft_header(acc)
+                except Exception as e:
+                    logger.debug(f"SOFT header fetch failed for {acc}: {e}")
+                    return None
+
+        results = await asyncio.gather(*(_one(acc) for acc in unique))
+        return {acc: res for acc, res in zip(unique, results) if res}
+
+    async def esearch(self, term: str, retmax: int = 20, db: str = "gds") -> Dict[str, Any]:
+        """Run esearch with usehistory=y. Returns count, ids, webenv and query_key."""
+        data = await self._get(
+            "esearch.fcgi",
+            {"db": db, "term": term, "retmax": retmax, "usehistory": "y", "retmode": "json"},
+        )
+        result = data.get("esearchresult") or {}
+        if "ERROR" in result or "error" in data:
+            raise EUtilsError(str(result.get("ERROR") or data.get("error")))
+        return {
+            "count": int(result.get("count") or 0),
+            "ids": list(result.get("idlist") or []),
+            "webenv": result.get("webenv"),
+            "query_key": result.get("querykey"),
+        }
+
+    async def esummary(
+        self,
+        webenv: Optional[str] = None,
+        query_key: Optional[str] = None,
+        ids: Optional[List[str]] = None,
+        retstart: int = 0,
+        retmax: int = 200,
+        db: str = "gds",
+    ) -> List[Dict[str, Any]]:
+        """Fetch document summaries either from the history server or for an explicit id list."""
+        params: Dict[str, Any] = {"db": db, "retmode": "json"}
+        if webenv and query_key:
+            params.update({"WebEnv": webenv, "query_key": query_key, "retstart": retstart, "retmax": retmax})
+        elif ids:
+            params["id"] = ",".join(str(i) for i in ids)
+        else:
+            return []
+
+        data = await self._get("esummary.fcgi", params)
+        if "error" in data:
+            raise EUtilsError(str(data["error"]))
+        result = data.get("result") or {}
+        return [result[uid] for uid in result.get("uids", []) if isinstance(result.get(uid), dict)]
+
+    @staticmethod
+    def to_geo_dataset(doc: Dict[str, Any]) -> GEODataset:
+        """Map a gds esummary document onto the GEODataset model."""
+        accession = doc.get("accession") or ""
+        if not accession and doc.get("gse"):
+            accession = f"GSE{doc['gse']}"
+
+        modalities = [m.strip() for m in str(doc.get("gdstype") or "").split(";") if m.strip()]
+
+        pubmed_ids = [str(p) for p in (doc.get("pubmedids") or []) if p]
+        pubmed_id = pubmed_ids[0] if pubmed_ids else None
+
+        sample_size = doc.get("n_samples")
+        try:
+            sample_size = int(sample_size) if sample_size not in (None, "") else None
+        except (TypeError, ValueError):
+            sample_size = None
+
+        return GEODataset(
+            accession=accession,
+            title=doc.get("title") or "",
+            description=doc.get("summary") or None,
+            organism=doc.get("taxon") or None,
+            modalities=modalities,
+            sample_size=sample_size,
+            access_type="public",
+            pubmed_id=pubmed_id,
+            publication_url=PUBMED_URL.format(pubmed_id=pubmed_id) if pubmed_id else None,
+            download_url=doc.get("ftplink") or None,
+            link=GEO_ACC_URL.format(accession=accession) if accession else None,
+        )
+
+    async def _enrich_from_soft(self, datasets: List[Dict[str, Any]]) -> None:
+        """Complete series records from the cache, fetching SOFT headers only for misses."""
+        series = [d for d in datasets if str(d.get("accession", "")).upper().startswith("GSE")]
+        if not series:
+            return
+
+        cached = await self.cache.get_many(d["accession"] for d in series) if self.cache is not None else {}
+        misses: List[Dict[str, Any]] = []
+        for ds in series:
+            entry = cached.get(ds["accession"])
+            if entry is not None:
+                self.cache.apply(ds, entry)
+            else:
+                misses.append(ds)
+
+        stale = [acc for acc, entry in cached.items() if not entry.fresh]
+        if stale:
+            self.cache.revalidate_in_background(stale)
+
+        if misses:
+            headers = await self.fetch_soft_headers([d["accession"] for d in misses])
+            for ds in misses:
+                merge_soft_header(ds, headers.get(ds["accession"], {}))
+            if self.cache is not None:
+                # Accessions whose header could not be fetched stay uncached and are retried
+                await self.cache.put_many(ds for ds in misses if ds["accession"] in headers)
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def _get(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET an E-utilities endpoint and decode its JSON payload."""
+        params = dict(params)
+        params["tool"] = self.tool
+        if self.email:
+            params["email"] = self.email
+        if self.api_key:
+            params["api_key"] = self.api_key
+        return await self._request(f"{self.base_url}/{endpoint}", params, as_json=True)
+
+    async def _request(self, url: str, params: Dict[str, Any], as_json: bool = True) -> Any:
+        """GET with throttling and retry on 429/5xx."""
+        session = await self._get_session()
+        name = url.rsplit("/", 1)[-1]
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self.max_retries):
+            await self._throttle()
+            try:
+                async with session.get(url, params=params) as response:
+                    if response.status == 429 or response.status >= 500:
+                        last_error = EUtilsError(f"{name} returned HTTP {response.status}")
+                    elif response.status != 200:
+                        raise EUtilsError(f"{name} returned HTTP {response.status}")
+                    elif as_json:
+                        return await response.json(content_type=None)
+                    else:
+                        return await response.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = e
+
+            if attempt < self.max_retries - 1:
+                await asyncio.sleep(0.5 * (2 ** attempt))
+
+        raise EUtilsError(f"{name} failed after {self.max_retries} attempts: {last_error}")
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+            )
+            self._session_loop = loop
+            self._throttle_lock = asyncio.Lock()
+        return self._session
+
+    async def _throttle(self) -> None:
+        if self.min_interval <= 0 or self._throttle_lock is None:
+            return
+        async with self._throttle_lock:
+            wait = self._last_request + self.min_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_request = time.monotonic()
+
+
+def parse_soft_header(text: str) -> Dict[str, Any]:
+    """
+    Parse a GEO SOFT header (series or dataset) into GEODataset enrichment fields.
+    Attribute lines look like `!Series_contact_email = someone@lab.org`.
+    """
+    attrs: Dict[str, List[str]] = {}
+    for line in text.splitlines():
+        if not line.startswith("!") or "=" not in line:
+            continue
+        key, _, value = line[1:].partition("=")
+        key = key.strip()
+        if "_" in key:
+            key = key.split("_", 1)[1]
+        value = value.strip()
+        if value:
+            attrs.setdefault(key.lower(), []).append(value)
+
+    def first(*keys: str) -> Optional[str]:
+        for k in keys:
+            if attrs.get(k):
+                return attrs[k][0]
+        return None
+
+    contact_name = None
+    name = first("contact_name")
+    if name:
+        contact_name = " ".join(p.strip() for p in name.split(",") if p.strip()) or None
+
+    contact_email = None
+    email = first("contact_email")
+    if email:
+        m = _EMAIL_RE.search(email)
+        contact_email = m.group(0) if m else None
+
+    pubmed_id = first("pubmed_id")
+    supplementary = [f for f in attrs.get("supplementary_file", []) if f.upper() != "NONE"]
+
+    sample_size: Optional[int] = None
+    if attrs.get("sample_id"):
+        sample_size = len(attrs["sample_id"])
+    else:
+        count = first("sample_count")
+        if count and count.isdigit():
+            sample_size = int(count)
+
+    return {
+        "description": first("summary", "description"),
+        "organism": first("sample_organism", "platform_organism", "organism"),
+        "sample_size": sample_size,
+        "contact_name": contact_name,
+        "contact_email": contact_email,
+        "pubmed_id": pubmed_id,
+        "publication_url": PUBMED_URL.format(pubmed_id=pubmed_id) if pubmed_id else None,
+        "download_url": supplementary[0] if supplementary else None,
+    }
+
+
+def merge_soft_header(dataset: Dict[str, Any], header: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill empty dataset fields from a parsed SOFT header (never overwrites existing values)."""
+    for key, value in header.items():
+        if value not in (None, "", []) and not dataset.get(key):
+            dataset[key] = value
+    return dataset
+
+
+_eutils_client: Optional[EUtilsGEOClient] = None
+
+
+def get_eutils_client() -> EUtilsGEOClient:
+    """Return the process-wide E-utilities client (shares one HTTP connection pool)."""
+    global _eutils_client
+    if _eutils_client is None:
+        from app.core.scrapers.geo_cache import get_geo_cache
+
+        _eutils_client = EUtilsGEOClient(cache=get_geo_cache())
+    return _eutils_client
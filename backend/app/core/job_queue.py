@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+
+from pydantic import BaseModel, Field
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Job(BaseModel):
+    """A delivered (leased) queue entry."""
+    id: str  # Idempotency key: Task.id for search jobs
+    kind: str
+    payload: Dict[str, Any] = Field(default_factory=dict)
+    attempts: int = 0  # Deliveries including this one
+    max_attempts: int = 3
+    lease_token: Optional[str] = None  # Proves the lease when acking/retrying
+
+
+class JobQueue(ABC):
+    """
+    At-least-once job queue with leases.
+
+    A claimed job is invisible to other workers until its visibility timeout passes; it is
+    then delivered again unless the worker acked it, rescheduled it (retry) or dead-lettered
+    it. Workers renew long leases with extend(). Operations carrying a stale lease token are
+    ignored, so a worker that lost its lease cannot ack or retry someone else's delivery.
+    Enqueueing an id that is already queued is a no-op.
+    """
+
+    @abstractmethod
+    async def enqueue(self, job_id: str, kind: str, payload: Dict[str, Any], max_attempts: Optional[int] = None) -> bool:
+        """Queue a job; returns False if a job with this id is already queued."""
+
+    @abstractmethod
+    async def claim(self, worker_id: str, visibility_timeout: float) -> Optional[Job]:
+        """Lease the next due job, or None if there is none."""
+
+    @abstractmethod
+    async def extend(self, job: Job, visibility_timeout: float) -> bool:
+        """Renew the lease; False if it was lost (the job may be redelivered)."""
+
+    @abstractmethod
+    async def ack(self, job: Job) -> None:
+        """Remove a completed job."""
+
+    @abstractmethod
+    async def retry(self, job: Job, delay: float, error: str) -> None:
+        """Release the job for redelivery after `delay` seconds."""
+
+    @abstractmethod
+    async def dead(self, job: Job, error: str) -> None:
+        """Stop delivering the job (kept for inspection)."""
+
+    @abstractmethod
+    async def stats(self) -> Dict[str, Any]:
+        """Backend name and job counts, for monitoring."""
+
+    async def close(self) -> None:
+        pass
+
+
+class SQLJobQueue(JobQueue):
+    """
+    Job queue in the application database (job_queue table), meant for development and
+    single-host deployments. Claims are a compare-and-set UPDATE on the due row, so
+    concurrent workers (threads or processes) never lease the same delivery twice.
+    """
+
+    def __init__(self, name: Optional[str] = None, session_factory: Optional[Callable[[], Any]] = None) -> None:
+        self.name = name or settings.JOB_QUEUE_NAME
+        self.session_factory = session_factory
+
+    def _session(self):
+        if self.session_factory is None:
+            from app.core.database import get_async_session_factory
+            self.session_factory = get_async_session_factory()
+        return self.session_factory()
+
+    async def enqueue(self, job_id: str, kind: str, payload: Dict[str, Any], max_attempts: Optional[int] = None) -> bool:
+        from app.models.database import QueuedJob
+
+        async with self._session() as session:
+            session.add(QueuedJob(
+                id=job_id,
+                queue=self.name,
+                kind=kind,
+                payload=payload,
+                status="queued",
+                attempts=0,
+                max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+                available_at=datetime.utcnow(),
+            ))
+            try:
+                await session.commit()
+                return True
+            except IntegrityError:
+                await session.rollback()
+                return False
+
+    async def claim(self, worker_id: str, visibility_timeout: float) -> Optional[Job]:
+        from app.models.database import QueuedJob
+
+        now = datetime.utcnow()
+        due = or_(
+            and_(QueuedJob.status == "queued", QueuedJob.available_at <= now),
+            and_(QueuedJob.status == "leased", QueuedJob.leased_until <= now),  # lease expired
+        )
+        async with self._session() as session:
+            candidates = (await session.scalars(
+                select(QueuedJob.id).where(QueuedJob.queue == self.name, due).order_by(QueuedJob.available_at).limit(5)
+            )).all()
+            for job_id in candidates:
+                token = uuid.uuid4().hex
+                claimed = await session.execute(
+                    update(QueuedJob)
+                    .where(QueuedJob.id == job_id, due)
+                    .values(
+                        status="leased",
+                        attempts=QueuedJob.attempts + 1,
+                        leased_until=now + timedelta(seconds=visibility_timeout),
+                        lease_owner=worker_id,
+                        lease_token=token,
+                    )
+                )
+                await session.commit()
+                if claimed.rowcount != 1:
+                    continue  # another worker won the race
+                row = await session.get(QueuedJob, job_id, populate_existing=True)
+                return Job(id=row.id, kind=row.kind, payload=row.payload or {}, attempts=row.attempts,
+                           max_attempts=row.max_attempts, lease_token=token)
+        return None
+
+    async def _update_leased(self, job: Job, **values: Any) -> bool:
+        from app.models.database import QueuedJob
+
+        async with self._session() as session:
+            result = await session.execute(
+                update(QueuedJob).where(QueuedJob.id == job.id, QueuedJob.lease_token == job.lease_token).values(**values)
+            )
+            await session.commit()
+            return result.rowcount == 1
+
+    async def extend(self, job: Job, visibility_timeout: float) -> bool:
+        return await self._update_leased(job, leased_until=datetime.utcnow() + timedelta(seconds=visibility_timeout))
+
+    async def ack(self, job: Job) -> None:
+        from app.models.database import QueuedJob
+
+        async with self._session() as session:
+            await session.execute(delete(QueuedJob).where(QueuedJob.id == job.id, QueuedJob.lease_token == job.lease_token))
+            await session.commit()
+
+    async def retry(self, job: Job, delay: float, error: str) -> None:
+        await self._update_leased(
+            job,
+            status="queued",
+            available_at=datetime.utcnow() + timedelta(seconds=delay),
+            leased_until=None,
+            lease_owner=None,
+            lease_token=None,
+            last_error=error,
+        )
+
+    async def dead(self, job: Job, error: str) -> None:
+        await self._update_leased(job, status="dead", leased_until=None, lease_token=None, last_error=error)
+
+    async def stats(self) -> Dict[str, Any]:
+        from app.models.database import QueuedJob
+
+        async with self._session() as session:
+            rows = (await session.execute(
+                select(QueuedJob.status, func.count()).where(QueuedJob.queue == self.name).group_by(QueuedJob.status)
+            )).all()
+        return {"backend": "sqlite", "queue": self.name, **{status: count for status, count in rows}}
+
+
+# Creates the job hash and its stream entry atomically: KEYS = (job hash, stream),
+# ARGV = (kind, payload, max_attempts, job id). Returns 0 if the job already exists.
+_REDIS_ENQUEUE_SCRIPT = """
+if redis.call('HSETNX', KEYS[1], 'kind', ARGV[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'payload', ARGV[2], 'attempts', 0, 'max_attempts', ARGV[3], 'status', 'queued')
+redis.call('XADD', KEYS[2], '*', 'id', ARGV[4])
+return 1
+"""
+
+
+class RedisJobQueue(JobQueue):
+    """
+    Job queue on a Redis stream with a consumer group.
+
+    Each delivery is a stream entry {id}; job data and attempt counts live in a hash per
+    job. Unacked entries idle longer than the visibility timeout are taken over with
+    XAUTOCLAIM, extend() resets the idle time with XCLAIM, and retries wait in a sorted set
+    until due. The lease token is "<entry id>|<consumer>": a delivery is held while the
+    entry is pending for that consumer.
+    """
+
+    GROUP = "workers"
+
+    def __init__(self, url: Optional[str] = None, name: Optional[str] = None, client: Any = None) -> None:
+        self.name = name or settings.JOB_QUEUE_NAME
+        if client is None:
+            try:
+                import redis.asyncio as aioredis
+            except ImportError as e:
+                raise RuntimeError("JOB_QUEUE_BACKEND=redis requires the 'redis' package") from e
+            client = aioredis.from_url(url or settings.REDIS_URL, decode_responses=True)
+        self.redis = client
+        self.stream = f"{self.name}:stream"
+        self.delayed = f"{self.name}:delayed"
+        self.dead_letters = f"{self.name}:dead"
+        self._enqueue_script = self.redis.register_script(_REDIS_ENQUEUE_SCRIPT)
+        self._group_ready = False
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.name}:job:{job_id}"
+
+    async def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            await self.redis.xgroup_create(self.stream, self.GROUP, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    async def enqueue(self, job_id: str, kind: str, payload: Dict[str, Any], max_attempts: Optional[int] = None) -> bool:
+        await self._ensure_group()
+        # One script, so a crash between the writes cannot leave a hash without a stream entry
+        created = await self._enqueue_script(
+            keys=[self._job_key(job_id), self.stream],
+            args=[kind, json.dumps(payload, default=str), max_attempts or settings.JOB_MAX_ATTEMPTS, job_id],
+        )
+        return bool(created)
+
+    async def _promote_due_retries(self) -> None:
+        for job_id in await self.redis.zrangebyscore(self.delayed, 0, time.time(), start=0, num=50):
+            if await self.redis.zrem(self.delayed, job_id):  # only the worker that removed it re-adds it
+                await self.redis.hset(self._job_key(job_id), "status", "queued")
+                await self.redis.xadd(self.stream, {"id": job_id})
+
+    async def claim(self, worker_id: str, visibility_timeout: float) -> Optional[Job]:
+        await self._ensure_group()
+        await self._promote_due_retries()
+
+        entries = []
+        expired = await self.redis.xautoclaim(
+            self.stream, self.GROUP, worker_id, min_idle_time=int(visibility_timeout * 1000), start_id="0-0", count=1
+        )
+        if expired and expired[1]:
+            entries = expired[1]
+        else:
+            response = await self.redis.xreadgroup(self.GROUP, worker_id, {self.stream: ">"}, count=1)
+            if response:
+                entries = response[0][1]
+        if not entries:
+            return None
+
+        entry_id, fields = entries[0]
+        job_id = fields["id"]
+        key = self._job_key(job_id)
+        data = await self.redis.hgetall(key)
+        if not data:  # acked meanwhile (stale entry)
+            await self.redis.xack(self.stream, self.GROUP, entry_id)
+            await self.redis.xdel(self.stream, entry_id)
+            return None
+        attempts = await self.redis.hincrby(key, "attempts", 1)
+        await self.redis.hset(key, mapping={"status": "leased", "lease_owner": worker_id})
+        return Job(id=job_id, kind=data["kind"], payload=json.loads(data.get("payload") or "{}"), attempts=attempts,
+                   max_attempts=int(data.get("max_attempts") or settings.JOB_MAX_ATTEMPTS),
+                   lease_token=f"{entry_id}|{worker_id}")
+
+    async def _held_entry(self, job: Job) -> Optional[str]:
+        """The job's stream entry id if its delivery is still pending for the leasing consumer."""
+        entry_id, consumer = (job.lease_token or "|").split("|", 1)
+        if not entry_id:
+            return None
+        pending = await self.redis.xpending_range(self.stream, self.GROUP, min=entry_id, max=entry_id, count=1)
+        return entry_id if pending and pending[0]["consumer"] == consumer else None
+
+    async def _release_entry(self, job: Job) -> bool:
+        entry_id = await self._held_entry(job)
+        if entry_id is None:
+            return False
+        await self.redis.xack(self.stream, self.GROUP, entry_id)
+        await self.redis.xdel(self.stream, entry_id)
+        return True
+
+    async def extend(self, job: Job, visibility_timeout: float) -> bool:
+        entry_id = await self._held_entry(job)
+        if entry_id is None:
+            return False
+        # Re-claiming for the same consumer resets the entry's idle time
+        consumer = job.lease_token.split("|", 1)[1]
+        claimed = await self.redis.xclaim(self.stream, self.GROUP, consumer, min_idle_time=0,
+                                          message_ids=[entry_id], justid=True)
+        return bool(claimed)
+
+    async def ack(self, job: Job) -> None:
+        if await self._release_entry(job):
+            await self.redis.delete(self._job_key(job.id))
+
+    async def retry(self, job: Job, delay: float, error: str) -> None:
+        if await self._release_entry(job):
+            await self.redis.hset(self._job_key(job.id), mapping={"status": "delayed", "last_error": error})
+            await self.redis.zadd(self.delayed, {job.id: time.time() + delay})
+
+    async def dead(self, job: Job, error: str) -> None:
+        if await self._release_entry(job):
+            await self.redis.hset(self._job_key(job.id), mapping={"status": "dead", "last_error": error})
+            await self.redis.lpush(self.dead_letters, job.id)
+
+    async def stats(self) -> Dict[str, Any]:
+        await self._ensure_group()
+        pending = await self.redis.xpending(self.stream, self.GROUP)
+        return {
+            "backend": "redis",
+            "queue": self.name,
+            "stream_length": await self.redis.xlen(self.stream),
+            "leased": pending.get("pending", 0) if isinstance(pending, dict) else 0,
+            "delayed": await self.redis.zcard(self.delayed),
+            "dead": await self.redis.llen(self.dead_letters),
+        }
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+_job_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Return the process-wide queue for JOB_QUEUE_BACKEND ('sqlite' or 'redis')."""
+    global _job_queue
+    if _job_queue is None:
+        backend = settings.JOB_QUEUE_BACKEND.lower()
+        if backend == "redis":
+            _job_queue = RedisJobQueue()
+        elif backend == "sqlite":
+            _job_queue = SQLJobQueue()
+        else:
+            raise ValueError(f"No job queue for JOB_QUEUE_BACKEND={settings.JOB_QUEUE_BACKEND!r}")
+    return _job_queue
+
+
+async def close_job_queue() -> None:
+    global _job_queue
+    if _job_queue is not None:
+        await _job_queue.close()
+    _job_queue = None
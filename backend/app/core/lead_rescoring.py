@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import select, update
+
+from app.utils.scoring import ScoringWeights
+
+logger = logging.getLogger(__name__)
+
+# Keys written by extract_signals; rows whose signals hold none of them (e.g. AI-only
+# qualification data) cannot be rescored and keep their stored heuristic score
+SCORING_SIGNAL_KEYS = ("keywords", "labels", "issue_body_length", "code_blocks_present", "punctuation_excess")
+
+
+def rescore_leads(
+    weights: Optional[ScoringWeights] = None,
+    chunk_size: int = 1000,
+    dry_run: bool = False,
+    session_factory: Optional[Callable[[], Any]] = None,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Recompute the heuristic score of stored leads from their signals without re-scraping.
+
+    The score is written to signals["heuristic_score"], where lead qualification stores it;
+    Lead.novice_score holds the AI qualification confidence and is left alone.
+    Rows are read in primary-key order, `chunk_size` at a time (only id and signals are
+    loaded), scored with the vectorized scorer and written back with one bulk UPDATE
+    per chunk in its own transaction, so memory stays bounded by the chunk and an
+    interrupted run keeps the chunks already committed. Only changed scores are written.
+
+    Returns run statistics, including rows per second.
+    """
+    from app.core.database import SessionLocal
+    from app.models.database import Lead
+    from app.utils.bulk_scoring import SignalColumns, score_columns
+
+    session_factory = session_factory or SessionLocal
+    chunk_size = max(1, chunk_size)
+    stats: Dict[str, Any] = {"scanned": 0, "rescored": 0, "updated": 0, "skipped": 0, "chunks": 0, "dry_run": dry_run}
+    started = time.perf_counter()
+    last_id: Optional[str] = None
+
+    while True:
+        session = session_factory()
+        try:
+            query = select(Lead.id, Lead.signals).order_by(Lead.id).limit(chunk_size)
+            if last_id is not None:
+                query = query.where(Lead.id > last_id)
+            rows = session.execute(query.execution_options(yield_per=chunk_size)).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            scorable = [row for row in rows if any(key in (row.signals or {}) for key in SCORING_SIGNAL_KEYS)]
+            scores = score_columns(SignalColumns([row.signals for row in scorable]), weights)
+            changes = [
+                {"id": row.id, "signals": {**row.signals, "heuristic_score": float(score)}}
+                for row, score in zip(scorable, scores)
+                if row.signals.get("heuristic_score") is None or abs(row.signals["heuristic_score"] - score) > 1e-9
+            ]
+            if changes and not dry_run:
+                session.execute(update(Lead), changes)
+                session.commit()
+
+            stats["scanned"] += len(rows)
+            stats["rescored"] += len(scorable)
+            stats["skipped"] += len(rows) - len(scorable)
+            stats["updated"] += len(changes)
+            stats["chunks"] += 1
+            if progress:
+                progress(dict(stats))
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        if len(rows) < chunk_size:
+            break
+
+    elapsed = time.perf_counter() - started
+    stats["elapsed_seconds"] = round(elapsed, 3)
+    stats["rows_per_second"] = round(stats["scanned"] / elapsed, 1) if elapsed > 0 else None
+    logger.info(f"Rescored leads: {stats}")
+    return stats
+
+
+def _load_weights(value: Optional[str]) -> Optional[ScoringWeights]:
+    """ScoringWeights from a JSON string or a path to a JSON file."""
+    if not value:
+        return None
+    text = value
+    if not value.lstrip().startswith("{"):
+        with open(value) as fh:
+            text = fh.read()
+    return ScoringWeights(**json.loads(text))
+
+
+def main(argv: Optional[list] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description="Recompute lead heuristic scores from stored signals")
+    parser.add_argument("--weights", help="ScoringWeights overrides as JSON or a path to a JSON file")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Rows per read/update batch")
+    parser.add_argument("--dry-run", action="store_true", help="Score without writing")
+    args = parser.parse_args(argv)
+
+    def _report(stats: Dict[str, Any]) -> None:
+        print(f"chunk {stats['chunks']}: scanned={stats['scanned']} updated={stats['updated']}", flush=True)
+
+    stats = rescore_leads(
+        weights=_load_weights(args.weights),
+        chunk_size=args.chunk_size,
+        dry_run=args.dry_run,
+        progress=_report,
+    )
+    print(json.dumps(stats))
+    return stats
+
+
+if __name__ == "__main__":
+    main()
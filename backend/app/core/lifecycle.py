@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def close_shared_resources() -> None:
+    """
+    Release the process-wide pools and clients: browser pool, E-utilities and GitHub clients,
+    provenance writer and task event bus (flushed before the engine closes), job queue and
+    async engine.
+    Shared by the API lifespan and worker processes; a resource failing to close is logged
+    and does not keep the others open.
+    """
+    from app.core.database import close_async_engine
+    from app.core.integrations.github_api import get_github_client
+    from app.core.integrations.ncbi_eutils import get_eutils_client
+    from app.core.job_queue import close_job_queue
+    from app.core.scrapers.browser_pool import get_browser_pool
+    from app.core.task_events import close_task_event_bus
+    from app.core.utils.provenance import get_provenance_writer
+
+    closers = [
+        ("browser pool", lambda: get_browser_pool().close()),
+        ("E-utilities client", lambda: get_eutils_client().close()),
+        ("GitHub client", lambda: get_github_client().close()),
+        ("provenance writer", lambda: get_provenance_writer().close()),
+        ("task event bus", close_task_event_bus),
+        ("job queue", close_job_queue),
+        ("async engine", close_async_engine),
+    ]
+    for name, close in closers:
+        try:
+            await close()
+        except Exception as e:
+            logger.warning(f"Failed to close {name}: {e}")
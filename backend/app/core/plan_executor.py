@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from app.config import settings
+from app.core.agents.planner_agent import WorkflowStep
+from app.core.utils.query_cache import QueryCache
+
+logger = logging.getLogger(__name__)
+
+# Step statuses; only "completed" steps have an output
+STEP_COMPLETED = "completed"
+STEP_FAILED = "failed"
+STEP_TIMED_OUT = "timed_out"
+STEP_SKIPPED = "skipped"
+
+
+class PlanValidationError(ValueError):
+    """The plan's steps do not form a DAG (duplicate step, unknown dependency or cycle)."""
+
+
+class StepResult(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    step_number: int
+    action: str
+    status: str
+    output: Any = None
+    error: Optional[str] = None
+    cached: bool = False
+    duration_seconds: float = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """The result without its output (for task results and progress events)."""
+        return self.model_dump(exclude={"output"})
+
+
+# handler(step, results) -> output; `results` holds every step finished so far, by step number
+StepHandler = Callable[[WorkflowStep, Dict[int, StepResult]], Awaitable[Any]]
+
+
+def topological_order(steps: Iterable[WorkflowStep]) -> List[WorkflowStep]:
+    """Steps ordered so each comes after its dependencies (plan order among ready steps)."""
+    steps = list(steps)
+    by_number: Dict[int, WorkflowStep] = {}
+    for step in steps:
+        if step.step_number in by_number:
+            raise PlanValidationError(f"Duplicate step number {step.step_number}")
+        by_number[step.step_number] = step
+    for step in steps:
+        unknown = [dep for dep in step.dependencies if dep not in by_number]
+        if unknown:
+            raise PlanValidationError(f"Step {step.step_number} depends on unknown step(s) {unknown}")
+
+    ordered: List[WorkflowStep] = []
+    placed: set = set()
+    remaining = list(steps)
+    while remaining:
+        ready = [step for step in remaining if all(dep in placed for dep in step.dependencies)]
+        if not ready:
+            raise PlanValidationError(f"Dependency cycle among steps {sorted(s.step_number for s in remaining)}")
+        for step in ready:
+            ordered.append(step)
+            placed.add(step.step_number)
+        remaining = [step for step in remaining if step.step_number not in placed]
+    return ordered
+
+
+def step_fingerprint(step: WorkflowStep, inputs: Dict[int, StepResult], context: Optional[Dict[str, Any]] = None) -> str:
+    """Stable cache key of a step: its action and parameters, its dependencies' outputs and `context`."""
+    payload = {
+        "ns": "workflow_step",
+        "action": step.action,
+        "parameters": step.parameters,
+        "inputs": [inputs[dep].output for dep in sorted(step.dependencies) if dep in inputs],
+        "context": context or {},
+    }
+    raw = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class PlanExecutor:
+    """
+    Runs WorkflowPlan steps as a DAG: each step starts as soon as all of its dependencies
+    have finished, so independent steps run concurrently.
+
+    Each step is bounded by its `timeout_seconds` parameter, else WORKFLOW_STEP_TIMEOUT_SECONDS
+    (0 disables); a step that times out or raises is recorded as timed_out/failed rather than
+    aborting the run. Its dependents are skipped, or with `skip_on_failed_dependency=False`
+    still run (handlers see which inputs are missing). Outputs of `cacheable_actions` are kept
+    in `cache` keyed on step_fingerprint(), so an identical step in a later run is not
+    recomputed; only non-empty outputs are cached. Steps whose action has no handler run
+    `default_handler`, or fail if there is none.
+    """
+
+    def __init__(
+        self,
+        handlers: Dict[str, StepHandler],
+        default_handler: Optional[StepHandler] = None,
+        default_timeout: Optional[float] = None,
+        cache: Optional[QueryCache] = None,
+        cacheable_actions: Iterable[str] = (),
+        cache_context: Optional[Dict[str, Any]] = None,
+        skip_on_failed_dependency: bool = True,
+        on_event: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> None:
+        self.handlers = handlers
+        self.default_handler = default_handler
+        self.default_timeout = default_timeout if default_timeout is not None else settings.WORKFLOW_STEP_TIMEOUT_SECONDS
+        self.cache = cache
+        self.cacheable_actions = set(cacheable_actions)
+        self.cache_context = cache_context or {}
+        self.skip_on_failed_dependency = skip_on_failed_dependency
+        self.on_event = on_event
+
+    async def run(self, steps: Iterable[WorkflowStep]) -> Dict[int, StepResult]:
+        """Run every step; returns their results by step number. Raises PlanValidationError first if not a DAG."""
+        waiting = topological_order(steps)
+        results: Dict[int, StepResult] = {}
+        running: Dict[asyncio.Task, WorkflowStep] = {}
+        try:
+            while waiting or running:
+                for step in [s for s in waiting if all(dep in results for dep in s.dependencies)]:
+                    waiting.remove(step)
+                    unmet = [dep for dep in step.dependencies if results[dep].status != STEP_COMPLETED]
+                    if unmet and self.skip_on_failed_dependency:
+                        self._finish(results, StepResult(
+                            step_number=step.step_number, action=step.action, status=STEP_SKIPPED,
+                            error=f"Dependencies did not complete: {unmet}",
+                        ))
+                        continue
+                    self._emit("step_started", {"step_number": step.step_number, "action": step.action})
+                    running[asyncio.create_task(self._run_step(step, dict(results)))] = step
+                if not running:
+                    continue  # skipped steps may have made others ready
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    running.pop(finished)
+                    self._finish(results, finished.result())
+        finally:
+            for pending in running:
+                pending.cancel()
+        return results
+
+    async def _run_step(self, step: WorkflowStep, results: Dict[int, StepResult]) -> StepResult:
+        started = time.perf_counter()
+        outcome = StepResult(step_number=step.step_number, action=step.action, status=STEP_COMPLETED)
+        key = None
+        if self.cache is not None and step.action in self.cacheable_actions:
+            key = step_fingerprint(step, results, self.cache_context)
+            cached = self.cache.get(key)
+            if cached is not None:
+                outcome.output, outcome.cached = cached, True
+                return outcome
+
+        handler = self.handlers.get(step.action, self.default_handler)
+        timeout = float(step.parameters.get("timeout_seconds") or self.default_timeout or 0)
+        try:
+            if handler is None:
+                raise LookupError(f"No handler for action {step.action!r}")
+            running = handler(step, results)
+            outcome.output = await (asyncio.wait_for(running, timeout=timeout) if timeout > 0 else running)
+        except asyncio.TimeoutError:
+            outcome.status, outcome.error = STEP_TIMED_OUT, f"Timed out after {timeout:g}s"
+        except Exception as e:
+            outcome.status, outcome.error = STEP_FAILED, str(e)
+        outcome.duration_seconds = round(time.perf_counter() - started, 3)
+
+        if key is not None and outcome.status == STEP_COMPLETED and outcome.output:
+            self.cache.set(key, outcome.output)
+        return outcome
+
+    def _finish(self, results: Dict[int, StepResult], outcome: StepResult) -> None:
+        results[outcome.step_number] = outcome
+        if outcome.status != STEP_COMPLETED:
+            logger.warning(f"Workflow step {outcome.step_number} ({outcome.action}) {outcome.status}: {outcome.error}")
+        self._emit("step_finished", outcome.summary())
+
+    def _emit(self, event: str, data: Dict[str, Any]) -> None:
+        if self.on_event is None:
+            return
+        try:
+            self.on_event(event, data)
+        except Exception as e:
+            logger.warning(f"Progress listener failed on {event}: {e}")
+
+
+_step_cache: Optional[QueryCache] = None
+
+
+def get_step_cache() -> QueryCache:
+    """Return the process-wide cache of workflow step outputs."""
+    global _step_cache
+    if _step_cache is None:
+        _step_cache = QueryCache(
+            max_entries=settings.WORKFLOW_STEP_CACHE_MAX_ENTRIES,
+            ttl=settings.WORKFLOW_STEP_CACHE_TTL_SECONDS,
+            enabled=settings.WORKFLOW_STEP_CACHE_ENABLED,
+        )
+    return _step_cache
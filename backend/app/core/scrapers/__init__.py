@@ -1,4 +1,7 @@
 # Scrapers package for external integrations (Browser-Use)
 # Modules:
 # - geo_scraper: NCBI/GEO scraping
+# - github_issues_scraper: GitHub issue prospecting
 # - linkedin_scraper: LinkedIn employee discovery
+# - browser_pool: shared warm Browser-Use sessions leased by all scrapers
+# - geo_cache: accession-level GEO metadata cache (TTL + stale-while-revalidate)
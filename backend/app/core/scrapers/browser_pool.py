@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Browser-Use imports
+from browser_use import Browser
+
+
+class PooledBrowser:
+    """A warm Browser-Use session owned by the pool and leased to one scraper at a time."""
+
+    def __init__(self, site: str, slot: int, browser: Any, headless: bool) -> None:
+        self.site = site
+        self.slot = slot
+        self.browser = browser
+        self.headless = headless
+        self.uses = 0
+        self.in_use = False
+        self.started = False
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class BrowserPool:
+    """
+    Process-wide pool of warm Chromium sessions shared by the Browser-Use scrapers.
+
+    - Each site ("geo", "github", "linkedin") gets up to `size` browsers, each with its own
+      persistent profile directory (temp-profile-<site>, temp-profile-<site>-<slot>).
+    - Browsers are health-checked before being handed out, recycled after `max_uses`
+      leases and evicted after `idle_timeout` seconds without a lease (on the next lease,
+      or by the background task started with start_idle_eviction()).
+    - Browsers are launched with keep_alive=True so Browser-Use agents never close them.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        max_uses: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        profile_root: Optional[str] = None,
+        site_sizes: Optional[Dict[str, int]] = None,
+        health_check_timeout: float = 5.0,
+    ) -> None:
+        self.size = max(1, size if size is not None else settings.BROWSER_POOL_SIZE)
+        self.max_uses = max(1, max_uses if max_uses is not None else settings.BROWSER_POOL_MAX_USES)
+        self.idle_timeout = idle_timeout if idle_timeout is not None else settings.BROWSER_POOL_IDLE_TIMEOUT_SECONDS
+        self.profile_root = profile_root if profile_root is not None else settings.BROWSER_POOL_PROFILE_ROOT
+        self.site_sizes = dict(site_sizes or {})
+        self.health_check_timeout = health_check_timeout
+
+        self._entries: Dict[str, List[PooledBrowser]] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._lock = asyncio.Lock()
+        self._eviction_task: Optional[asyncio.Task] = None
+        self._killing: Set[asyncio.Task] = set()
+
+    def site_size(self, site: str) -> int:
+        """Max concurrent browsers for a site."""
+        return max(1, self.site_sizes.get(site, self.size))
+
+    def profile_dir(self, site: str, slot: int) -> str:
+        """Persistent user_data_dir for a site slot (slot 0 keeps the historical path)."""
+        name = f"temp-profile-{site}" if slot == 0 else f"temp-profile-{site}-{slot}"
+        return os.path.join(self.profile_root, name)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Snapshot of pool occupancy per site."""
+        return {
+            site: {
+                "size": self.site_size(site),
+                "open": len(entries),
+                "in_use": sum(1 for e in entries if e.in_use),
+            }
+            for site, entries in self._entries.items()
+        }
+
+    async def acquire(
+        self,
+        site: str,
+        headless: bool = True,
+        browser_profile: Optional[Any] = None,
+    ) -> PooledBrowser:
+        """
+        Lease a started, healthy browser for `site`, waiting if all of the site's browsers are busy.
+        Callers must hand the lease back with release().
+        """
+        semaphore = self._semaphores.setdefault(site, asyncio.Semaphore(self.site_size(site)))
+        await semaphore.acquire()
+
+        try:
+            stale: List[PooledBrowser] = []
+            async with self._lock:
+                stale.extend(self._pop_idle_locked())
+                entries = self._entries.setdefault(site, [])
+                entry = next((e for e in entries if not e.in_use), None)
+                if entry is not None and (entry.headless != headless or entry.uses >= self.max_uses):
+                    entries.remove(entry)
+                    stale.append(entry)
+                    entry = None
+                if entry is None:
+                    entry = self._create_locked(site, headless, browser_profile)
+                entry.in_use = True
+
+            for old in stale:
+                await self._kill(old)
+
+            if entry.started and not await self._is_healthy(entry):
+                logger.info(f"Pooled {site} browser (slot {entry.slot}) failed health check; relaunching")
+                await self._kill(entry)
+                async with self._lock:
+                    if entry in self._entries.get(site, []):
+                        self._entries[site].remove(entry)
+                    entry = self._create_locked(site, headless, browser_profile)
+                    entry.in_use = True
+
+            if not entry.started:
+                try:
+                    await entry.browser.start()  # type: ignore[func-returns-value]
+                    entry.started = True
+                except Exception:
+                    async with self._lock:
+                        if entry in self._entries.get(site, []):
+                            self._entries[site].remove(entry)
+                    await self._kill(entry)
+                    raise
+
+            entry.uses += 1
+            entry.last_used = time.monotonic()
+            entry.semaphore = semaphore
+            return entry
+        except BaseException:
+            semaphore.release()
+            raise
+
+    async def release(self, entry: PooledBrowser, discard: bool = False) -> None:
+        """
+        Return a leased browser; `discard=True` closes it instead of keeping it warm.
+        A browser released while its task is being cancelled is killed as well: it may be
+        mid-navigation or still driven by an agent, so the slot gets a fresh browser.
+        """
+        entry.last_used = time.monotonic()
+        current = asyncio.current_task()
+        cancelled = current is not None and current.cancelling() > 0
+        retire = discard or cancelled or entry.uses >= self.max_uses
+        semaphore, entry.semaphore = entry.semaphore, None
+        try:
+            async with self._lock:
+                entry.in_use = False
+                if retire and entry in self._entries.get(entry.site, []):
+                    self._entries[entry.site].remove(entry)
+            if retire:
+                await self._kill(entry)
+        finally:
+            # A further cancel can interrupt the lock or the kill: the permit must still be
+            # returned, or the site loses the slot for good
+            if entry.in_use:
+                # Interrupted before the entry was handed back: drop it rather than reuse it
+                entry.in_use = False
+                if entry in self._entries.get(entry.site, []):
+                    self._entries[entry.site].remove(entry)
+                self._kill_in_background(entry)
+            if semaphore is not None:
+                semaphore.release()
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        site: str,
+        headless: bool = True,
+        browser_profile: Optional[Any] = None,
+    ) -> AsyncIterator[Any]:
+        """Context manager yielding a pooled Browser and returning it on exit."""
+        entry = await self.acquire(site, headless=headless, browser_profile=browser_profile)
+        try:
+            yield entry.browser
+        finally:
+            await self.release(entry)
+
+    async def evict_idle(self) -> int:
+        """Close browsers that have been idle longer than idle_timeout. Returns the number evicted."""
+        async with self._lock:
+            stale = self._pop_idle_locked()
+        for entry in stale:
+            await self._kill(entry)
+        return len(stale)
+
+    def start_idle_eviction(self, interval: Optional[float] = None) -> Optional[asyncio.Task]:
+        """
+        Run evict_idle() every `interval` seconds (default: half of idle_timeout) in the
+        background, so idle browsers are closed even when no more leases come in. No-op if
+        idle eviction is disabled or already running; close() stops it.
+        """
+        if not self.idle_timeout or self.idle_timeout <= 0:
+            return None
+        if self._eviction_task is None or self._eviction_task.done():
+            period = interval if interval is not None else max(1.0, self.idle_timeout / 2)
+            self._eviction_task = asyncio.create_task(self._evict_periodically(period))
+        return self._eviction_task
+
+    async def _evict_periodically(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                evicted = await self.evict_idle()
+                if evicted:
+                    logger.info(f"Evicted {evicted} idle pooled browser(s)")
+            except Exception as e:
+                logger.warning(f"Idle browser eviction failed: {e}")
+
+    async def close(self) -> None:
+        """Stop idle eviction, close every pooled browser and reset the pool (called on shutdown)."""
+        task, self._eviction_task = self._eviction_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        async with self._lock:
+            entries = [e for site_entries in self._entries.values() for e in site_entries]
+            self._entries = {}
+            self._semaphores = {}
+        for entry in entries:
+            await self._kill(entry)
+
+    def _create_locked(self, site: str, headless: bool, browser_profile: Optional[Any]) -> PooledBrowser:
+        entries = self._entries.setdefault(site, [])
+        used_slots = {e.slot for e in entries}
+        slot = next(i for i in range(self.site_size(site) + len(entries)) if i not in used_slots)
+
+        kwargs: Dict[str, Any] = {
+            "user_data_dir": self.profile_dir(site, slot),
+            "headless": headless,
+            "keep_alive": True,
+        }
+        if browser_profile is not None:
+            browser = Browser(browser_profile=browser_profile, **kwargs)  # type: ignore[arg-type]
+        else:
+            browser = Browser(**kwargs)
+
+        entry = PooledBrowser(site=site, slot=slot, browser=browser, headless=headless)
+        entries.append(entry)
+        return entry
+
+    def _pop_idle_locked(self) -> List[PooledBrowser]:
+        if not self.idle_timeout or self.idle_timeout <= 0:
+            return []
+        now = time.monotonic()
+        stale: List[PooledBrowser] = []
+        for entries in self._entries.values():
+            for entry in list(entries):
+                if not entry.in_use and now - entry.last_used > self.idle_timeout:
+                    entries.remove(entry)
+                    stale.append(entry)
+        return stale
+
+    async def _is_healthy(self, entry: PooledBrowser) -> bool:
+        """Cheap CDP round trip to confirm the browser is still connected."""
+        browser = entry.browser
+        if getattr(browser, "_cdp_client_root", None) is None:
+            return False
+        try:
+            await asyncio.wait_for(browser.get_current_page_url(), timeout=self.health_check_timeout)
+            return True
+        except Exception:
+            return False
+
+    def _kill_in_background(self, entry: PooledBrowser) -> None:
+        task = asyncio.create_task(self._kill(entry))
+        self._killing.add(task)
+        task.add_done_callback(self._killing.discard)
+
+    async def _kill(self, entry: PooledBrowser) -> None:
+        try:
+            await entry.browser.kill()  # type: ignore[func-returns-value]
+        except Exception as e:
+            logger.debug(f"Failed to kill pooled {entry.site} browser (slot {entry.slot}): {e}")
+
+
+_browser_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide browser pool, creating it from settings on first use."""
+    global _browser_pool
+    if _browser_pool is None:
+        # LinkedIn keeps its login in a single persistent profile, so it gets one browser.
+        _browser_pool = BrowserPool(site_sizes={"linkedin": 1})
+    return _browser_pool
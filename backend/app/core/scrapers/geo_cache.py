@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.database import GEOAccessionCache
+
+logger = logging.getLogger(__name__)
+
+# Fields persisted per accession (mirrors GEODataset)
+CACHED_FIELDS = (
+    "accession",
+    "title",
+    "description",
+    "organism",
+    "modalities",
+    "cancer_types",
+    "sample_size",
+    "access_type",
+    "publication_url",
+    "pubmed_id",
+    "download_url",
+    "contact_name",
+    "contact_email",
+    "link",
+)
+
+
+class CachedAccession:
+    """A cache hit: the stored dataset fields plus whether they are still within the TTL."""
+
+    def __init__(self, accession: str, data: Dict[str, Any], fetched_at: datetime, fresh: bool) -> None:
+        self.accession = accession
+        self.data = data
+        self.fetched_at = fetched_at
+        self.fresh = fresh
+
+
+class GEOMetadataCache:
+    """
+    Accession-level cache of enriched GEO metadata, stored in the geo_accession_cache table
+    (created by init_db) through the async database session, so lookups never block the
+    event loop.
+
+    - Entries younger than `ttl` are fresh and served as-is.
+    - Entries older than `ttl` but within `ttl + stale_ttl` are served (stale-while-revalidate)
+      and refreshed in the background from the GEO SOFT header.
+    - Older entries are treated as misses.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[int] = None,
+        stale_ttl: Optional[int] = None,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        self.ttl = timedelta(seconds=ttl if ttl is not None else settings.GEO_CACHE_TTL_SECONDS)
+        self.stale_ttl = timedelta(seconds=stale_ttl if stale_ttl is not None else settings.GEO_CACHE_STALE_SECONDS)
+        self.session_factory = session_factory
+        self.enabled = settings.GEO_CACHE_ENABLED if enabled is None else enabled
+
+        self._revalidating: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _session(self) -> AsyncSession:
+        if self.session_factory is None:
+            from app.core.database import get_async_session_factory
+            self.session_factory = get_async_session_factory()
+        return self.session_factory()
+
+    async def get_many(self, accessions: Iterable[Optional[str]]) -> Dict[str, CachedAccession]:
+        """Look up accessions in one query; expired entries are omitted."""
+        keys = list(dict.fromkeys(a for a in accessions if a))
+        if not self.enabled or not keys:
+            return {}
+
+        now = datetime.utcnow()
+        hits: Dict[str, CachedAccession] = {}
+        try:
+            async with self._session() as session:
+                rows = (await session.scalars(
+                    select(GEOAccessionCache).where(GEOAccessionCache.accession.in_(keys))
+                )).all()
+            for row in rows:
+                age = now - row.fetched_at
+                if age > self.ttl + self.stale_ttl:
+                    continue
+                hits[row.accession] = CachedAccession(
+                    accession=row.accession,
+                    data=dict(row.data or {}),
+                    fetched_at=row.fetched_at,
+                    fresh=age <= self.ttl,
+                )
+        except Exception as e:
+            logger.warning(f"GEO cache lookup failed: {e}")
+        return hits
+
+    async def get(self, accession: str) -> Optional[CachedAccession]:
+        return (await self.get_many([accession])).get(accession)
+
+    async def put_many(self, datasets: Iterable[Dict[str, Any]], replace: bool = False) -> int:
+        """
+        Upsert enriched datasets. Existing values are kept where the new record is empty,
+        unless `replace` is set. Returns the number of accessions written.
+        """
+        records: Dict[str, Dict[str, Any]] = {}
+        for ds in datasets:
+            acc = (ds or {}).get("accession")
+            if acc:
+                records[acc] = {k: ds.get(k) for k in CACHED_FIELDS}
+        if not self.enabled or not records:
+            return 0
+
+        now = datetime.utcnow()
+        try:
+            async with self._session() as session:
+                existing = {
+                    row.accession: row
+                    for row in (await session.scalars(
+                        select(GEOAccessionCache).where(GEOAccessionCache.accession.in_(list(records)))
+                    )).all()
+                }
+                for acc, data in records.items():
+                    row = existing.get(acc)
+                    if row is None:
+                        session.add(GEOAccessionCache(accession=acc, data=data, fetched_at=now))
+                        continue
+                    merged = dict(row.data or {})
+                    for key, value in data.items():
+                        if replace or value not in (None, "", []):
+                            merged[key] = value
+                    row.data = merged
+                    row.fetched_at = now
+                await session.commit()
+            return len(records)
+        except Exception as e:
+            logger.warning(f"GEO cache write failed: {e}")
+            return 0
+
+    async def invalidate(self, accession: str) -> None:
+        try:
+            async with self._session() as session:
+                await session.execute(delete(GEOAccessionCache).where(GEOAccessionCache.accession == accession))
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"GEO cache invalidate failed for {accession}: {e}")
+
+    def revalidate_in_background(self, accessions: Iterable[str]) -> Optional[asyncio.Task]:
+        """Schedule a SOFT-header refresh for stale accessions (deduplicated across callers)."""
+        pending = [a for a in dict.fromkeys(accessions) if a and a not in self._revalidating]
+        if not self.enabled or not pending:
+            return None
+        self._revalidating.update(pending)
+        task = asyncio.create_task(self.refresh(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def refresh(self, accessions: List[str]) -> int:
+        """Re-fetch SOFT headers for accessions and overwrite the cached fields they provide."""
+        try:
+            from app.core.integrations.ncbi_eutils import get_eutils_client
+
+            headers = await get_eutils_client().fetch_soft_headers(accessions)
+            current = await self.get_many(accessions)
+            updated: List[Dict[str, Any]] = []
+            for acc, header in headers.items():
+                data = dict(current[acc].data) if acc in current else {"accession": acc}
+                data.update({k: v for k, v in header.items() if v not in (None, "", [])})
+                updated.append(data)
+            return await self.put_many(updated)
+        except Exception as e:
+            logger.debug(f"GEO cache revalidation failed: {e}")
+            return 0
+        finally:
+            self._revalidating.difference_update(accessions)
+
+    @staticmethod
+    def apply(dataset: Dict[str, Any], entry: CachedAccession) -> Dict[str, Any]:
+        """Fill empty dataset fields from a cache entry."""
+        for key, value in entry.data.items():
+            if value not in (None, "", []) and not dataset.get(key):
+                dataset[key] = value
+        return dataset
+
+
+_geo_cache: Optional[GEOMetadataCache] = None
+
+
+def get_geo_cache() -> GEOMetadataCache:
+    """Return the process-wide GEO accession cache."""
+    global _geo_cache
+    if _geo_cache is None:
+        _geo_cache = GEOMetadataCache()
+    return _geo_cache
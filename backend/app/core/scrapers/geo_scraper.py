@@ -9,6 +9,8 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
 
 from app.config import settings
+from app.core.scrapers.browser_pool import get_browser_pool
+from app.core.scrapers.geo_cache import CachedAccession, get_geo_cache
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,7 @@ class GEODataset(BaseModel):
     """Structured output for GEO dataset"""
     accession: str
     title: str
+    description: Optional[str] = None
     organism: Optional[str] = None
     modalities: List[str] = []
     cancer_types: List[str] = []
@@ -42,6 +45,15 @@ class GEODatasets(BaseModel):
     items: List[GEODataset]
 
 
+class GEOEnrichment(BaseModel):
+    """Structured output for the per-accession detail task."""
+    contact_name: Optional[str] = None
+    contact_email: Optional[str] = None
+    download_url: Optional[str] = None
+    pubmed_id: Optional[str] = None
+    publication_url: Optional[str] = None
+
+
 class GEOScraper:
     """
     NCBI GEO scraper using Browser-Use
@@ -69,21 +81,13 @@ class GEOScraper:
             except Exception:
                 self.browser_profile = None
 
-        # Dedicated browser profile directory for GEO
+        # Warm browsers are leased from the shared pool (profile dir: temp-profile-geo)
+        self.pool = get_browser_pool()
         self.browser = None
-        if Browser is not None:
-            try:
-                # Prefer passing browser_profile if supported, else fallback to args
-                if self.browser_profile is not None:
-                    self.browser = Browser(browser_profile=self.browser_profile)  # type: ignore[arg-type]
-                else:
-                    self.browser = Browser(
-                        user_data_dir="./temp-profile-geo",
-                        headless=self.headless,
-                    )
-            except Exception as e:
-                logger.warning(f"Failed to initialize Browser: {e}")
-                self.browser = None
+
+        # Accession-level metadata cache (consulted by _needs_enrichment)
+        self.cache = get_geo_cache()
+        self._cached: Dict[str, CachedAccession] = {}
 
         # Speed optimization instructions
         self.speed_prompt = """
@@ -101,7 +105,7 @@ Speed optimization instructions:
         Returns a list of dicts (ready to be normalized by agents if needed).
         """
         # If Browser-Use is not available, return mock results for MVP/demo
-        if BrowserAgent is None or self.browser is None or ChatOpenAI is None:
+        if BrowserAgent is None or Browser is None or ChatOpenAI is None:
             logger.warning("browser_use not available; returning mock GEO results")
             results = []
             await self._log_provenance(
@@ -110,13 +114,11 @@ Speed optimization instructions:
             )
             return results
 
-        # Keep browser alive for chained enrichment tasks
+        # Lease a warm browser for the search step
+        lease = None
         try:
-            # Some versions require explicit start
-            try:
-                await self.browser.start()  # type: ignore[func-returns-value]
-            except Exception:
-                pass
+            lease = await self.pool.acquire("geo", headless=self.headless, browser_profile=self.browser_profile)
+            self.browser = lease.browser
 
             # Task: use the GDS portal which routes GEO/GDS series
             search_task = f"""
@@ -151,19 +153,14 @@ You are a world class bioinformatician. You think and navigate the tools like on
 
             result = await agent.run(max_steps=15)  # type: ignore[func-returns-value]
 
-            datasets = self._parse_search_results(result)
-            enriched: List[Dict[str, Any]] = []
+            datasets = self._parse_search_results(result)[: max_results]
 
-            for ds in datasets[: max_results]:
-                if self._needs_enrichment(ds):
-                    try:
-                        enriched_ds = await self._enrich_dataset(ds, agent)
-                        enriched.append(enriched_ds)
-                    except Exception as e:
-                        logger.debug(f"Enrichment failed for {ds.get('accession')}: {e}")
-                        enriched.append(ds)
-                else:
-                    enriched.append(ds)
+            # Return the search browser now so enrichment workers can lease it
+            await self.pool.release(lease)
+            lease = None
+            self.browser = None
+
+            enriched = await self._enrich_datasets(datasets)
 
             await self._log_provenance(
                 action="searched_geo",
@@ -180,20 +177,66 @@ You are a world class bioinformatician. You think and navigate the tools like on
             )
             return []
         finally:
-            # If not keeping session, ensure shutdown
-            try:
-                if getattr(self.browser_profile, "keep_alive", False):
-                    # don't kill if caller wants to reuse; this scraper manages its own lifecycle though
-                    await self.browser.kill()  # type: ignore[func-returns-value]
-                else:
-                    await self.browser.kill()  # type: ignore[func-returns-value]
-            except Exception:
-                pass
+            # Hand the warm browser back to the pool instead of killing it
+            if lease is not None:
+                await self.pool.release(lease)
+            self.browser = None
+
+    async def _enrich_datasets(self, datasets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fill contact, download and publication details for datasets that lack them.
+        0) Cached accessions are served from the metadata cache (stale ones are revalidated
+           in the background).
+        1) One batched pass over GEO SOFT headers (plain HTTP, no LLM).
+        2) Browser agents only for what SOFT could not fill, run concurrently on pooled
+           browsers under GEO_ENRICHMENT_CONCURRENCY.
+        """
+        self._cached = await self.cache.get_many(ds.get("accession") for ds in datasets)
+        stale = [acc for acc, entry in self._cached.items() if not entry.fresh]
+        if stale:
+            self.cache.revalidate_in_background(stale)
+
+        pending = [ds for ds in datasets if self._needs_enrichment(ds)]
+        if not pending:
+            return datasets
+
+        headers: Dict[str, Dict[str, Any]] = {}
+        try:
+            from app.core.integrations.ncbi_eutils import get_eutils_client, merge_soft_header
+
+            headers = await get_eutils_client().fetch_soft_headers(
+                [ds.get("accession") or "" for ds in pending]
+            )
+            for ds in pending:
+                merge_soft_header(ds, headers.get(ds.get("accession") or "", {}))
+        except Exception as e:
+            logger.debug(f"Batch SOFT enrichment failed: {e}")
+
+        remaining = [ds for ds in pending if self._needs_enrichment(ds)]
+        if remaining and BrowserAgent is not None and ChatOpenAI is not None:
+            semaphore = asyncio.Semaphore(max(1, settings.GEO_ENRICHMENT_CONCURRENCY))
+            llm = ChatOpenAI(model="gpt-4.1")
+
+            async def _worker(ds: Dict[str, Any]) -> None:
+                async with semaphore:
+                    try:
+                        await self._enrich_dataset(ds, llm)
+                    except Exception as e:
+                        logger.debug(f"Enrichment failed for {ds.get('accession')}: {e}")
+
+            await asyncio.gather(*(_worker(ds) for ds in remaining))
+
+        # Only cache what was actually fetched; failed lookups are retried next time
+        await self.cache.put_many(
+            ds for ds in pending
+            if ds.get("accession") in headers or (ds.get("contact_email") and ds.get("download_url"))
+        )
+        return datasets
 
-    async def _enrich_dataset(self, dataset: Dict[str, Any], agent: Any) -> Dict[str, Any]:
+    async def _enrich_dataset(self, dataset: Dict[str, Any], llm: Any) -> Dict[str, Any]:
         """
-        Enrich dataset with detailed contact, download, and publication info.
-        Uses agent.add_new_task to chain tasks within the same session.
+        Enrich one dataset with contact, download, and publication info using a browser agent
+        on its own pooled browser. Only fills fields that are still empty.
         """
         acc = dataset.get("accession") or ""
         detail_task = f"""
@@ -205,26 +248,10 @@ Extract:
 Return strictly as a JSON object with keys: contact_name, contact_email, download_url, pubmed_id, publication_url
 """
         try:
-            # Prefer a dedicated agent with structured output for enrichment
-            if BrowserAgent is not None and ChatOpenAI is not None and self.browser is not None:
-                from pydantic import BaseModel as _BM  # alias to avoid shadowing
-
-                class GEOEnrichment(_BM):
-                    contact_name: Optional[str] = None
-                    contact_email: Optional[str] = None
-                    download_url: Optional[str] = None
-                    pubmed_id: Optional[str] = None
-                    publication_url: Optional[str] = None
-
-                llm = ChatOpenAI(
-                    model="us.anthropic.claude-sonnet-4-20250514-v1:0",
-                    aws_region="us-east-1",
-                    aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-                    aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-                )
+            async with self.pool.lease("geo", headless=self.headless, browser_profile=self.browser_profile) as browser:
                 enrich_agent = BrowserAgent(
                     task=detail_task,
-                    browser=self.browser,
+                    browser=browser,
                     llm=llm,
                     flash_mode=True,
                     browser_profile=self.browser_profile,
@@ -232,34 +259,24 @@ Return strictly as a JSON object with keys: contact_name, contact_email, downloa
                 )
                 detail_result = await enrich_agent.run(max_steps=6)  # type: ignore[func-returns-value]
 
-                enrichment_obj: Dict[str, Any] = {}
-                if hasattr(detail_result, "structured_output") and getattr(detail_result, "structured_output"):
-                    so = getattr(detail_result, "structured_output")
-                    if isinstance(so, _BM):
-                        enrichment_obj = so.model_dump()
-                    elif isinstance(so, dict):
-                        enrichment_obj = so
-                    else:
-                        try:
-                            enrichment_obj = json.loads(str(so))
-                        except Exception:
-                            enrichment_obj = {}
+            enrichment_obj: Dict[str, Any] = {}
+            if hasattr(detail_result, "structured_output") and getattr(detail_result, "structured_output"):
+                so = getattr(detail_result, "structured_output")
+                if isinstance(so, BaseModel):
+                    enrichment_obj = so.model_dump()
+                elif isinstance(so, dict):
+                    enrichment_obj = so
                 else:
-                    enrichment_obj = self._parse_detail_result(detail_result)
-
-                dataset.update({
-                    "contact_name": enrichment_obj.get("contact_name"),
-                    "contact_email": enrichment_obj.get("contact_email"),
-                    "download_url": enrichment_obj.get("download_url"),
-                    "pubmed_id": enrichment_obj.get("pubmed_id"),
-                    "publication_url": enrichment_obj.get("publication_url"),
-                })
+                    try:
+                        enrichment_obj = json.loads(str(so))
+                    except Exception:
+                        enrichment_obj = {}
             else:
-                # Fallback to chaining task on existing agent
-                agent.add_new_task(detail_task)
-                detail_result = await agent.run(max_steps=6)  # type: ignore[func-returns-value]
-                enrichment = self._parse_detail_result(detail_result)
-                dataset.update(enrichment)
+                enrichment_obj = self._parse_detail_result(detail_result)
+
+            for key in ("contact_name", "contact_email", "download_url", "pubmed_id", "publication_url"):
+                if enrichment_obj.get(key) and not dataset.get(key):
+                    dataset[key] = enrichment_obj[key]
         except Exception as e:
             logger.debug(f"Detail task failed for {acc}: {e}")
 
@@ -309,6 +326,7 @@ Return strictly as a JSON object with keys: contact_name, contact_email, downloa
                     {
                         "accession": item.get("accession") or item.get("id") or "",
                         "title": item.get("title") or "",
+                        "description": item.get("description") or item.get("summary"),
                         "organism": item.get("organism"),
                         "modalities": item.get("modalities") or item.get("experiment_type") or [],
                         "cancer_types": item.get("cancer_types") or [],
@@ -328,7 +346,10 @@ Return strictly as a JSON object with keys: contact_name, contact_email, downloa
         return normalized
 
     def _needs_enrichment(self, dataset: Dict[str, Any]) -> bool:
-        """Check if dataset needs additional details."""
+        """Check if dataset needs additional details, after filling what the cache has for it."""
+        entry = self._cached.get(dataset.get("accession") or "")
+        if entry is not None:
+            self.cache.apply(dataset, entry)
         return not dataset.get("contact_email") or not dataset.get("download_url")
 
     def _parse_detail_result(self, result: Any) -> Dict[str, Any]:
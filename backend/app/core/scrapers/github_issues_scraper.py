@@ -6,10 +6,13 @@ import logging
 import re
 from typing import Any, Dict, List, Optional
 from datetime import datetime
+from urllib.parse import quote_plus
 
 from pydantic import BaseModel
 
 from app.config import settings
+from app.core.integrations.github_api import get_github_client
+from app.core.scrapers.browser_pool import get_browser_pool
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +41,7 @@ class DetailedIssue(BaseModel):
     issue_body: str = ""
     issue_labels: List[str] = []
     issue_created_at: Optional[str] = None
+    issue_updated_at: Optional[str] = None
     author_profile_url: str = ""
     author_email: Optional[str] = None
     author_website: Optional[str] = None
@@ -87,36 +91,38 @@ class GitHubIssuesScraper:
             except Exception:
                 self.browser_profile = None
 
-        # Dedicated browser profile directory for GitHub
+        # Warm browsers are leased from the shared pool (profile dir: temp-profile-github)
+        self.pool = get_browser_pool()
         self.browser = None
-        if Browser is not None:
-            try:
-                # Prefer passing browser_profile if supported, else fallback to args
-                if self.browser_profile is not None:
-                    self.browser = Browser(browser_profile=self.browser_profile)  # type: ignore[arg-type]
-                else:
-                    self.browser = Browser(
-                        user_data_dir="./temp-profile-github",
-                        headless=self.headless,
-                    )
-            except Exception as e:
-                logger.warning(f"Failed to initialize Browser: {e}")
-                self.browser = None
 
-    async def fetch_issue_list(self, repo: str, max_issues: int = 25, profile_enrichment: str = "browser") -> List[Dict[str, Any]]:
+    async def fetch_issue_list(
+        self,
+        repo: str,
+        max_issues: int = 25,
+        profile_enrichment: str = "browser",
+        since: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Fetch a list of GitHub issues from the specified repository.
         
         Args:
             repo: Repository in format "owner/repo" (e.g., "scverse/scanpy")
             max_issues: Maximum number of issues to fetch (default 25)
-            profile_enrichment: Enrichment strategy for contact info: "none" | "simple" | "browser" (default "simple")
+            profile_enrichment: Enrichment strategy for contact info: "none" | "simple" | "browser" | "api" (default "simple").
+                "api" skips the browser entirely: issues come from the GitHub REST API and author
+                profiles (email, website, account age, followers, public repos) from GraphQL.
+            since: Incremental sync cursor (ISO 8601); only issues updated at or after it are
+                returned, least recently updated first, so the caller can advance the cursor to
+                the last issue it processed without skipping older changes.
             
         Returns:
             List of issue dictionaries with basic info and author details
         """
+        if profile_enrichment == "api":
+            return await self._fetch_issue_list_api(repo, max_issues, since=since)
+
         # If Browser-Use is not available, return mock results for MVP/demo
-        if BrowserAgent is None or self.browser is None or ChatOpenAI is None:
+        if BrowserAgent is None or Browser is None or ChatOpenAI is None:
             logger.warning("browser_use not available; returning mock GitHub issues")
             results = self._mock_issues(repo, max_issues)
             await self._log_provenance(
@@ -129,17 +135,17 @@ class GitHubIssuesScraper:
             )
             return results
 
-        # Use Browser with keep_alive for proper session management
-        browser = Browser(
-            user_data_dir="./temp-profile-github",
-            headless=self.headless,
-            keep_alive=True,  # Keep browser alive for task chaining
-        )
-        
+        # Pooled browsers are launched with keep_alive so tasks can be chained
+        lease = None
         try:
-            await browser.start()
-            
+            lease = await self.pool.acquire("github", headless=self.headless, browser_profile=self.browser_profile)
+            browser = self.browser = lease.browser
+
             url = f"https://github.com/{repo}/issues"
+            if since:
+                # Incremental: oldest changes first, only issues updated since the cursor
+                query = f"is:issue is:open updated:>={since} sort:updated-asc"
+                url = f"{url}?q={quote_plus(query)}"
             
             # Step 1: Get issue list from main page
             issues_list_task = f"""
@@ -172,6 +178,10 @@ Focus on open issues only. Skip pull requests.
             
             logger.info(f"Parsed {len(basic_issues)} basic issues from {repo}")
             
+            if since and not basic_issues:
+                logger.info(f"No issues updated on {repo} since {since}")
+                return []
+
             if not basic_issues:
                 logger.warning(f"No issues found on {repo} issues page")
                 # Return mock data for testing if no real issues found
@@ -184,6 +194,7 @@ For each issue page, extract:
 - issue_body (the full description/content of the issue)
 - issue_labels (array of all label names)
 - issue_created_at (creation date)
+- issue_updated_at (date of the latest activity on the issue)
 - author_profile_url (author's GitHub profile URL - click on the username to get the profile link)
 
 Click on each issue URL from the list, then extract the detailed info.
@@ -305,11 +316,60 @@ Return as JSON: {{"profiles": [{{"user_login": "username", "email": "email@examp
             )
             return []
         finally:
-            # Cleanup browser session
-            try:
-                await browser.kill()  # type: ignore[func-returns-value]
-            except Exception:
-                pass
+            # Hand the warm browser back to the pool instead of killing it
+            if lease is not None:
+                await self.pool.release(lease)
+            self.browser = None
+
+    async def _fetch_issue_list_api(self, repo: str, max_issues: int, since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Fetch issues and author profiles through the GitHub API (no Browser-Use)."""
+        client = get_github_client()
+        try:
+            if since:
+                # Incremental: oldest changes first, so a capped page never skips past older updates
+                issues = await client.list_issues(repo, max_issues, since=since, sort="updated", direction="asc")
+            else:
+                issues = await client.list_issues(repo, max_issues)
+            profiles = await client.fetch_user_profiles([i.get("user_login") for i in issues])
+
+            for issue in issues:
+                profile = profiles.get(issue.get("user_login") or "") or {}
+                for key in ("user_created_at", "account_age_days", "followers", "public_repos"):
+                    issue[key] = profile.get(key)
+                issue["email"] = issue.get("email") or profile.get("email")
+                issue["website"] = issue.get("website") or profile.get("website")
+
+            # Public profile email is often empty; try the listed website (plain HTTP)
+            missing = [i for i in issues if not i.get("email") and i.get("website")]
+            if missing:
+                emails = await asyncio.gather(
+                    *(self._extract_email_from_website(i["website"]) for i in missing),
+                    return_exceptions=True,
+                )
+                for issue, email in zip(missing, emails):
+                    if isinstance(email, str):
+                        issue["email"] = email
+
+            await self._log_provenance(
+                action="fetched_issues_api",
+                details={
+                    "repo": repo,
+                    "max_issues": max_issues,
+                    "results_found": len(issues),
+                    "profiles_found": len(profiles),
+                    "since": since,
+                    "rate_limit_remaining": client.rate_limit.get("remaining"),
+                },
+            )
+            return issues
+
+        except Exception as e:
+            logger.error(f"GitHub API issue fetch error for {repo}: {e}")
+            await self._log_provenance(
+                action="fetch_issues_error",
+                details={"repo": repo, "error": str(e), "backend": "api"},
+            )
+            return []
 
     async def enrich_author_contacts(self, issue: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -526,6 +586,9 @@ Look in the profile sidebar, bio section, and README for contact info.
                 "issue_created_at": "2024-09-01",
                 "user_login": "biouser123",
                 "profile_url": "https://github.com/biouser123",
+                "account_age_days": 90,
+                "followers": 2,
+                "public_repos": 1,
                 "issue_url": f"https://github.com/{repo}/issues/1234",
                 "email": None,
                 "website": None,
@@ -537,6 +600,9 @@ Look in the profile sidebar, bio section, and README for contact info.
                 "issue_created_at": "2024-09-02",
                 "user_login": "newbie_scientist",
                 "profile_url": "https://github.com/newbie_scientist",
+                "account_age_days": 180,
+                "followers": 8,
+                "public_repos": 3,
                 "issue_url": f"https://github.com/{repo}/issues/1235",
                 "email": "scientist@university.edu",
                 "website": "https://scientist-blog.example.com",
@@ -548,6 +614,9 @@ Look in the profile sidebar, bio section, and README for contact info.
                 "issue_created_at": "2024-09-03",
                 "user_login": "confused_researcher",
                 "profile_url": "https://github.com/confused_researcher",
+                "account_age_days": 45,
+                "followers": 1,
+                "public_repos": 0,
                 "issue_url": f"https://github.com/{repo}/issues/1236",
                 "email": None,
                 "website": None,
@@ -779,6 +848,7 @@ Look in the profile sidebar, bio section, and README for contact info.
                         "issue_body": detail.get("issue_body", ""),
                         "issue_labels": detail.get("issue_labels", []),
                         "issue_created_at": detail.get("issue_created_at"),
+                        "issue_updated_at": detail.get("issue_updated_at"),
                         "profile_url": detail.get("author_profile_url") or basic_issue.get("profile_url", f"https://github.com/{basic_issue.get('user_login', '')}"),
                         "email": detail.get("author_email"),
                         "website": detail.get("author_website"),
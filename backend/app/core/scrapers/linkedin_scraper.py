@@ -11,6 +11,7 @@ import os
 from pydantic import BaseModel
 
 from app.config import settings
+from app.core.scrapers.browser_pool import get_browser_pool
 
 logger = logging.getLogger(__name__)
 
@@ -73,17 +74,29 @@ class LinkedInScraper:
             except Exception:
                 self.browser_profile = None
 
+        # The pool keeps one warm LinkedIn browser on the fixed temp-profile-linkedin
+        # user_data_dir, so the login session persists across separate scraper instances
+        self.pool = get_browser_pool()
         self.browser = None
-        if Browser is not None:
-            try:
-                # Always use a fixed user_data_dir to persist session across separate instances
-                self.browser = Browser(
-                    user_data_dir="./temp-profile-linkedin",
-                    headless=self.headless,
-                )
-            except Exception as e:
-                logger.warning(f"Failed to initialize Browser: {e}")
-                self.browser = None
+        self._lease = None
+
+    async def _acquire_browser(self) -> bool:
+        """
+        Lease the pooled LinkedIn browser unless this scraper already holds it.
+        Returns True when this call took the lease and is responsible for releasing it.
+        """
+        if self._lease is not None:
+            return False
+        self._lease = await self.pool.acquire("linkedin", headless=self.headless, browser_profile=self.browser_profile)
+        self.browser = self._lease.browser
+        return True
+
+    async def _release_browser(self, owned: bool, discard: bool = False) -> None:
+        """Return the leased browser to the pool (or close it when discard=True)."""
+        if not owned or self._lease is None:
+            return
+        lease, self._lease, self.browser = self._lease, None, None
+        await self.pool.release(lease, discard=discard)
 
     async def open_login_page(self, keep_open: bool = True) -> Dict[str, Any]:
         """
@@ -91,11 +104,9 @@ class LinkedInScraper:
         Returns {"ok": True, "status": "opened"} on success, otherwise {"ok": False, "status": "unavailable"|"error", "error": "..."}.
         """
 
+        owned = False
         try:
-            try:
-                await self.browser.start()  # type: ignore[func-returns-value]
-            except Exception:
-                pass
+            owned = await self._acquire_browser()
 
             llm = ChatOpenAI(
                 model="gpt-4.1",
@@ -116,16 +127,13 @@ class LinkedInScraper:
             result = await agent.run(max_steps=4)  # type: ignore[func-returns-value]
             text = self._stringify_result(result).lower()
             ok = "successful" in text
-            # Keep the browser open so the user can log in manually
-            if not keep_open:
-                try:
-                    await self.browser.kill()  # type: ignore[func-returns-value]
-                except Exception:
-                    pass
             return {"ok": ok, "status": "successful" if ok else "error"}
         except Exception as e:
             logger.error(f"open_login_page error: {e}")
             return {"ok": False, "status": "error", "error": str(e)}
+        finally:
+            # Returning the lease keeps the browser warm in the pool so the user can log in manually
+            await self._release_browser(owned, discard=not keep_open)
 
     async def ensure_logged_in(self) -> tuple[bool, str]:
         """
@@ -135,14 +143,12 @@ class LinkedInScraper:
         """
         if self.logged_in:
             return True, "success"
-        if BrowserAgent is None or self.browser is None or ChatOpenAI is None:
+        if BrowserAgent is None or Browser is None or ChatOpenAI is None:
             return False, "unavailable"
 
+        owned = False
         try:
-            try:
-                await self.browser.start()  # type: ignore[func-returns-value]
-            except Exception:
-                pass
+            owned = await self._acquire_browser()
             status = await self._ensure_login()
             ok = status == "success"
             if ok:
@@ -151,6 +157,8 @@ class LinkedInScraper:
         except Exception as e:
             logger.error(f"ensure_logged_in error: {e}")
             return False, "error"
+        finally:
+            await self._release_browser(owned)
 
     async def get_logged_in_contacts(
         self,
@@ -165,14 +173,12 @@ class LinkedInScraper:
         without performing any connect/message actions.
         Returns a list of LinkedInContact-shaped dicts.
         """
-        if BrowserAgent is None or self.browser is None or ChatOpenAI is None:
+        if BrowserAgent is None or Browser is None or ChatOpenAI is None:
             return []
 
+        owned = False
         try:
-            try:
-                await self.browser.start()  # type: ignore[func-returns-value]
-            except Exception:
-                pass
+            owned = await self._acquire_browser()
 
             if not skip_login_check and not self.logged_in:
                 ok, _status = await self.ensure_logged_in()
@@ -216,10 +222,7 @@ Notes: {filter_info}
             logger.error(f"get_logged_in_contacts error: {e}")
             return []
         finally:
-            try:
-                await self.browser.kill()  # type: ignore[func-returns-value]
-            except Exception:
-                pass
+            await self._release_browser(owned)
 
     async def find_company_employees(
         self,
@@ -257,7 +260,7 @@ Notes: {filter_info}
             List of LinkedInActionResult dicts if login=True, else LinkedInContact dicts
         """
         # If Browser-Use is not available, return mock results for MVP/demo
-        if BrowserAgent is None or self.browser is None or ChatOpenAI is None:
+        if BrowserAgent is None or Browser is None or ChatOpenAI is None:
             logger.warning("browser_use not available; returning mock LinkedIn results")
             results = self._mock_results(company, departments, keywords, max_results)
             await self._log_provenance(
@@ -304,12 +307,10 @@ Notes: {filter_info}
         dry_run: bool,
     ) -> List[Dict[str, Any]]:
         """Execute the full logged-in LinkedIn workflow"""
+        owned = False
         try:
-            await self.browser.start()  # type: ignore[func-returns-value]
-        except Exception:
-            pass
+            owned = await self._acquire_browser()
 
-        try:
             # Step 1: Login
             login_result = await self._ensure_login()
             if login_result != "success":
@@ -360,10 +361,7 @@ Notes: {filter_info}
             )
             return [{"error": str(e), "action": "workflow_error"}]
         finally:
-            try:
-                await self.browser.kill()  # type: ignore[func-returns-value]
-            except Exception:
-                pass
+            await self._release_browser(owned)
 
     async def _ensure_login(self) -> str:
         """
@@ -564,12 +562,10 @@ IMPORTANT: Respect the max_actions limit of {max_actions}. Add small delays betw
         max_results: int,
     ) -> List[Dict[str, Any]]:
         """Execute public LinkedIn search (original implementation)"""
+        owned = False
         try:
-            await self.browser.start()  # type: ignore[func-returns-value]
-        except Exception:
-            pass
+            owned = await self._acquire_browser()
 
-        try:
             dept_filter = " OR ".join([f'"{d}"' for d in departments]) if departments else ""
             keyword_filter = " OR ".join([f'"{k}"' for k in keywords]) if keywords else ""
 
@@ -626,10 +622,7 @@ LinkedIn employee search task:
             )
             return []
         finally:
-            try:
-                await self.browser.kill()  # type: ignore[func-returns-value]
-            except Exception:
-                pass
+            await self._release_browser(owned)
 
     def _parse_action_results(self, result: Any) -> List[Dict[str, Any]]:
         """Parse LinkedIn action results from agent output."""
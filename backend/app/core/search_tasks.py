@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import update
+
+from app.config import settings
+from app.core.agent_orchestrator import AgentOrchestrator
+from app.core.database import get_async_session_factory
+from app.core.task_events import get_task_event_bus
+from app.models.database import Task
+from app.models.enums import TaskStatus
+from app.models.schemas import SearchRequest
+
+logger = logging.getLogger(__name__)
+
+orchestrator = AgentOrchestrator()
+
+# A delivery of a task in one of these states is a duplicate (at-least-once queues)
+FINISHED_STATUSES = (TaskStatus.COMPLETED.value, TaskStatus.FAILED.value, TaskStatus.CANCELLED.value)
+
+# Workflows running in this process, by task id
+_running_workflows: Dict[str, asyncio.Task] = {}
+
+
+def cancel_running_search(task_id: str) -> bool:
+    """Cancel the task's workflow if it runs in this process; returns whether one was found."""
+    workflow = _running_workflows.get(task_id)
+    if workflow is None or workflow.done():
+        return False
+    workflow.cancel()
+    return True
+
+
+async def _watch_for_cancellation(task_id: str, workflow: asyncio.Task, interval: float) -> None:
+    """Cancel `workflow` once the task is marked cancelled (by an API process elsewhere)."""
+    while not workflow.done():
+        await asyncio.sleep(interval)
+        try:
+            async with get_async_session_factory()() as db:
+                task = await db.get(Task, task_id)
+                if task is not None and task.status == TaskStatus.CANCELLED.value:
+                    workflow.cancel()
+                    return
+        except Exception as e:
+            logger.debug(f"Cancellation check for task {task_id} failed: {e}")
+
+
+async def execute_search_task(task_id: str, req_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Run the multi-agent workflow for a search Task and store its result.
+    Skips tasks that no longer exist or already finished. Raises if the workflow fails,
+    leaving the task for the caller to retry or fail. If the task is cancelled while
+    running (cancel_running_search, or its status turning 'cancelled'), the workflow is
+    stopped, the task ends as cancelled and None is returned.
+
+    Progress is published on the task event bus (GET /search/{task_id}/events): a status
+    event, the orchestrator's step events, then an end event with the final status.
+    """
+    async with get_async_session_factory()() as db:
+        task = await db.get(Task, task_id)
+        if task is None:
+            logger.warning(f"Search task {task_id} not found; skipping")
+            return None
+        # Conditional update: a cancel landing between the read and the write must win
+        started = await db.execute(
+            update(Task)
+            .where(Task.id == task_id, Task.status.not_in(FINISHED_STATUSES))
+            .values(status=TaskStatus.RUNNING.value, started_at=datetime.utcnow())
+        )
+        await db.commit()
+        if started.rowcount != 1:
+            logger.info(f"Search task {task_id} already finished or cancelled; skipping")
+            return None
+
+        bus = get_task_event_bus()
+        bus.publish(task_id, "status", {"status": TaskStatus.RUNNING.value})
+        request = SearchRequest(**req_data)
+        workflow = asyncio.create_task(orchestrator.execute_workflow(
+            request,
+            user_email=task.user_email or "",
+            on_event=lambda event, data: bus.publish(task_id, event, data),
+        ))
+        _running_workflows[task_id] = workflow
+        watcher = asyncio.create_task(_watch_for_cancellation(task_id, workflow, settings.TASK_CANCEL_CHECK_INTERVAL_SECONDS))
+        try:
+            result = await workflow
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                raise  # we are being cancelled ourselves (shutdown), not the task
+            await _mark_cancelled(db, task_id)
+            bus.close(task_id, {"status": TaskStatus.CANCELLED.value})
+            return None
+        except Exception as e:
+            bus.publish(task_id, "error", {"error": str(e)})
+            raise
+        finally:
+            watcher.cancel()
+            if _running_workflows.get(task_id) is workflow:
+                del _running_workflows[task_id]
+
+        # Compare-and-set again: a cancel landing after the workflow returned must win
+        completed = await db.execute(
+            update(Task)
+            .where(Task.id == task_id, Task.status == TaskStatus.RUNNING.value)
+            .values(status=TaskStatus.COMPLETED.value, output_data=result, completed_at=datetime.utcnow())
+        )
+        await db.commit()
+        status = TaskStatus.COMPLETED.value
+        if completed.rowcount != 1:
+            task = await db.get(Task, task_id, populate_existing=True)
+            status = task.status if task else "deleted"
+            logger.info(f"Search task {task_id} became {status} while finishing; result not stored")
+        bus.close(task_id, {"status": status})
+        return result
+
+
+async def _mark_cancelled(db, task_id: str) -> None:
+    task = await db.get(Task, task_id, populate_existing=True)
+    if task is not None and (task.status != TaskStatus.CANCELLED.value or task.completed_at is None):
+        task.status = TaskStatus.CANCELLED.value
+        task.error_message = task.error_message or "Task cancelled"
+        task.completed_at = task.completed_at or datetime.utcnow()
+        await db.commit()
+    logger.info(f"Search task {task_id} cancelled")
+
+
+async def update_search_task_after_error(task_id: str, error: str, final: bool) -> None:
+    """Record a failed attempt: the task fails for good if `final`, otherwise waits for a retry."""
+    try:
+        async with get_async_session_factory()() as db:
+            task = await db.get(Task, task_id)
+            if task is None or task.status in FINISHED_STATUSES:
+                return
+            task.error_message = error
+            if final:
+                task.status = TaskStatus.FAILED.value
+                task.completed_at = datetime.utcnow()
+            else:
+                task.status = TaskStatus.PENDING.value
+            await db.commit()
+        if final:
+            get_task_event_bus().close(task_id, {"status": TaskStatus.FAILED.value, "error": error})
+        else:
+            get_task_event_bus().publish(task_id, "status", {"status": TaskStatus.PENDING.value, "error": error})
+    except Exception as e:
+        logger.error(f"Could not update search task {task_id} after error: {e}")
+
+
+async def run_search_task(task_id: str, req_data: Dict[str, Any]) -> None:
+    """Run a search Task in this process (JOB_QUEUE_BACKEND=inline); failures mark it failed."""
+    try:
+        await execute_search_task(task_id, req_data)
+    except Exception as e:
+        logger.error(f"Agent workflow failed for task {task_id}: {e}")
+        await update_search_task_after_error(task_id, str(e), final=True)
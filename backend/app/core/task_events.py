@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Set
+
+from pydantic import BaseModel, Field
+from sqlalchemy import delete, select
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Event published last on a task's channel; subscribers stop after it
+END_EVENT = "end"
+
+
+class TaskEvent(BaseModel):
+    id: int
+    task_id: str
+    event: str
+    data: Dict[str, Any] = Field(default_factory=dict)
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+    def to_sse(self) -> str:
+        """Server-sent events frame."""
+        payload = json.dumps({"task_id": self.task_id, "timestamp": self.timestamp.isoformat(), **self.data}, default=str)
+        return f"id: {self.id}\nevent: {self.event}\ndata: {payload}\n\n"
+
+
+class TaskEventBus(ABC):
+    """
+    Pub/sub of workflow progress events, one channel per task id.
+
+    Workflows publish from wherever they run; GET /search/{task_id}/events subscribes in the
+    API process. Subscribers replay the events after their Last-Event-ID, then follow live
+    ones until close() publishes END_EVENT. Finished tasks' events stay available for
+    `retention_seconds`. publish() never blocks the workflow.
+    """
+
+    def __init__(self, history_limit: Optional[int] = None, retention_seconds: Optional[float] = None) -> None:
+        self.history_limit = max(1, history_limit or settings.TASK_EVENTS_HISTORY_LIMIT)
+        self.retention_seconds = retention_seconds if retention_seconds is not None else settings.TASK_EVENTS_RETENTION_SECONDS
+
+    @abstractmethod
+    def publish(self, task_id: str, event: str, data: Optional[Dict[str, Any]] = None) -> None:
+        """Record and fan out one event."""
+
+    def close(self, task_id: str, data: Optional[Dict[str, Any]] = None) -> None:
+        """Publish END_EVENT, the task's last event."""
+        self.publish(task_id, END_EVENT, data)
+
+    @abstractmethod
+    async def has_events(self, task_id: str) -> bool:
+        """Whether the task has published events that are still retained."""
+
+    @abstractmethod
+    def subscribe(
+        self,
+        task_id: str,
+        last_event_id: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+    ) -> AsyncIterator[Optional[TaskEvent]]:
+        """
+        Replay retained events after `last_event_id`, then follow live ones until END_EVENT.
+        Yields None after `idle_timeout` seconds without an event (for keepalives).
+        """
+
+    async def flush(self) -> None:
+        """Wait until published events are visible to subscribers."""
+
+    async def shutdown(self) -> None:
+        """Flush and release the backend's connections."""
+        await self.flush()
+
+
+class _Channel:
+    def __init__(self, history_limit: int) -> None:
+        self.history: deque = deque(maxlen=history_limit)
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.next_id = 1
+        self.closed_at: Optional[float] = None
+
+
+class LocalTaskEventBus(TaskEventBus):
+    """
+    Task events in this process's memory, for workflows run by the API itself
+    (JOB_QUEUE_BACKEND=inline).
+
+    Each channel keeps its last `history_limit` events for late or reconnecting subscribers;
+    closed channels are dropped after `retention_seconds`. Subscriber queues are unbounded
+    and a subscriber that goes away just stops reading. Events after close() are ignored.
+    """
+
+    def __init__(self, history_limit: Optional[int] = None, retention_seconds: Optional[float] = None) -> None:
+        super().__init__(history_limit, retention_seconds)
+        self._channels: Dict[str, _Channel] = {}
+
+    async def has_events(self, task_id: str) -> bool:
+        self._purge()
+        return task_id in self._channels
+
+    def publish(self, task_id: str, event: str, data: Optional[Dict[str, Any]] = None) -> Optional[TaskEvent]:
+        channel = self._channels.get(task_id)
+        if channel is None:
+            self._purge()
+            channel = self._channels[task_id] = _Channel(self.history_limit)
+        if channel.closed_at is not None:
+            return None
+        item = TaskEvent(id=channel.next_id, task_id=task_id, event=event, data=data or {})
+        channel.next_id += 1
+        channel.history.append(item)
+        for queue in channel.subscribers:
+            queue.put_nowait(item)
+        return item
+
+    def close(self, task_id: str, data: Optional[Dict[str, Any]] = None) -> None:
+        if self.publish(task_id, END_EVENT, data) is not None:
+            self._channels[task_id].closed_at = time.monotonic()
+
+    async def subscribe(
+        self,
+        task_id: str,
+        last_event_id: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+    ) -> AsyncIterator[Optional[TaskEvent]]:
+        channel = self._channels.get(task_id)
+        if channel is None:
+            return
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in channel.history:
+            if last_event_id is None or item.id > last_event_id:
+                queue.put_nowait(item)
+        channel.subscribers.add(queue)
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=idle_timeout)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                yield item
+                if item.event == END_EVENT:
+                    return
+        finally:
+            channel.subscribers.discard(queue)
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        expired = [
+            task_id
+            for task_id, channel in self._channels.items()
+            if channel.closed_at is not None and now - channel.closed_at > self.retention_seconds and not channel.subscribers
+        ]
+        for task_id in expired:
+            del self._channels[task_id]
+
+
+class _StoredTaskEventBus(TaskEventBus):
+    """
+    Base for buses shared between processes (queue workers publish, the API subscribes).
+    publish() schedules the write and returns; a task's writes run one after another, so
+    subscribers see its events in publish order. A failed write is logged and skipped.
+    """
+
+    def __init__(self, history_limit: Optional[int] = None, retention_seconds: Optional[float] = None) -> None:
+        super().__init__(history_limit, retention_seconds)
+        self._writes: Dict[str, asyncio.Task] = {}  # task id -> its latest scheduled write
+
+    def publish(self, task_id: str, event: str, data: Optional[Dict[str, Any]] = None) -> None:
+        previous = self._writes.get(task_id)
+        write = asyncio.get_running_loop().create_task(
+            self._write_after(previous, task_id, event, data or {}, datetime.utcnow())
+        )
+        self._writes[task_id] = write
+        write.add_done_callback(lambda done: self._writes.get(task_id) is done and self._writes.pop(task_id))
+
+    async def flush(self) -> None:
+        pending = [write for write in self._writes.values() if write.get_loop() is asyncio.get_running_loop()]
+        if pending:
+            await asyncio.wait(pending)
+
+    async def _write_after(
+        self, previous: Optional[asyncio.Task], task_id: str, event: str, data: Dict[str, Any], published_at: datetime
+    ) -> None:
+        if previous is not None and not previous.done():
+            await asyncio.wait([previous])
+        try:
+            await self._append(task_id, event, data, published_at)
+        except Exception as e:
+            logger.warning(f"Could not store {event} event of task {task_id}: {e}")
+
+    @abstractmethod
+    async def _append(self, task_id: str, event: str, data: Dict[str, Any], published_at: datetime) -> None:
+        """Store one event."""
+
+
+class SQLTaskEventBus(_StoredTaskEventBus):
+    """
+    Task events in the application database (task_events table), for JOB_QUEUE_BACKEND=sqlite.
+    Row ids are the event ids; subscribers poll for rows after the last one they read every
+    TASK_EVENTS_POLL_SECONDS. Storing a task's END_EVENT deletes the events of tasks that
+    ended more than `retention_seconds` ago.
+    """
+
+    def __init__(
+        self,
+        history_limit: Optional[int] = None,
+        retention_seconds: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        super().__init__(history_limit, retention_seconds)
+        self.poll_interval = poll_interval or settings.TASK_EVENTS_POLL_SECONDS
+        self.session_factory = session_factory
+
+    def _session(self):
+        if self.session_factory is None:
+            from app.core.database import get_async_session_factory
+            self.session_factory = get_async_session_factory()
+        return self.session_factory()
+
+    async def _append(self, task_id: str, event: str, data: Dict[str, Any], published_at: datetime) -> None:
+        from app.models.database import TaskEventRecord
+
+        async with self._session() as session:
+            session.add(TaskEventRecord(task_id=task_id, event=event, data=data, published_at=published_at))
+            if event == END_EVENT:
+                cutoff = published_at - timedelta(seconds=self.retention_seconds)
+                ended = select(TaskEventRecord.task_id).where(
+                    TaskEventRecord.event == END_EVENT, TaskEventRecord.published_at < cutoff
+                )
+                await session.execute(delete(TaskEventRecord).where(TaskEventRecord.task_id.in_(ended)))
+            await session.commit()
+
+    async def has_events(self, task_id: str) -> bool:
+        from app.models.database import TaskEventRecord
+
+        async with self._session() as session:
+            found = await session.scalar(select(TaskEventRecord.id).where(TaskEventRecord.task_id == task_id).limit(1))
+        return found is not None
+
+    async def subscribe(
+        self,
+        task_id: str,
+        last_event_id: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+    ) -> AsyncIterator[Optional[TaskEvent]]:
+        from app.models.database import TaskEventRecord
+
+        last_seen = last_event_id or 0
+        idle = 0.0
+        while True:
+            async with self._session() as session:
+                rows = (await session.scalars(
+                    select(TaskEventRecord)
+                    .where(TaskEventRecord.task_id == task_id, TaskEventRecord.id > last_seen)
+                    .order_by(TaskEventRecord.id)
+                    .limit(self.history_limit)
+                )).all()
+            for row in rows:
+                last_seen = row.id
+                yield TaskEvent(id=row.id, task_id=task_id, event=row.event, data=row.data or {}, timestamp=row.published_at)
+                if row.event == END_EVENT:
+                    return
+            if rows:
+                idle = 0.0
+                continue
+            await asyncio.sleep(self.poll_interval)
+            idle += self.poll_interval
+            if idle_timeout is not None and idle >= idle_timeout:
+                yield None
+                idle = 0.0
+
+
+# Assigns the task's next event id and appends the event: KEYS = (stream, id counter),
+# ARGV = (event, data, timestamp, max stream length, ttl or ""). Returns the event id.
+_REDIS_PUBLISH_SCRIPT = """
+local id = redis.call('INCR', KEYS[2])
+redis.call('XADD', KEYS[1], 'MAXLEN', '~', ARGV[4], id .. '-0', 'event', ARGV[1], 'data', ARGV[2], 'timestamp', ARGV[3])
+if ARGV[5] ~= '' then
+    redis.call('EXPIRE', KEYS[1], ARGV[5])
+    redis.call('EXPIRE', KEYS[2], ARGV[5])
+end
+return id
+"""
+
+
+class RedisTaskEventBus(_StoredTaskEventBus):
+    """
+    Task events on a Redis stream per task, for JOB_QUEUE_BACKEND=redis.
+
+    Event n is stream entry "n-0", so subscribers resume with XREAD after their Last-Event-ID
+    and block until the next event. Streams are trimmed to about `history_limit` entries and
+    expire `retention_seconds` after END_EVENT.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        name: Optional[str] = None,
+        client: Any = None,
+        history_limit: Optional[int] = None,
+        retention_seconds: Optional[float] = None,
+    ) -> None:
+        super().__init__(history_limit, retention_seconds)
+        self.name = name or settings.JOB_QUEUE_NAME
+        if client is None:
+            try:
+                import redis.asyncio as aioredis
+            except ImportError as e:
+                raise RuntimeError("JOB_QUEUE_BACKEND=redis requires the 'redis' package") from e
+            client = aioredis.from_url(url or settings.REDIS_URL, decode_responses=True)
+        self.redis = client
+        self._publish_script = self.redis.register_script(_REDIS_PUBLISH_SCRIPT)
+
+    def _stream(self, task_id: str) -> str:
+        return f"{self.name}:events:{task_id}"
+
+    async def _append(self, task_id: str, event: str, data: Dict[str, Any], published_at: datetime) -> None:
+        stream = self._stream(task_id)
+        ttl = max(1, int(self.retention_seconds)) if event == END_EVENT else ""
+        await self._publish_script(
+            keys=[stream, f"{stream}:seq"],
+            args=[event, json.dumps(data, default=str), published_at.isoformat(), self.history_limit, ttl],
+        )
+
+    async def has_events(self, task_id: str) -> bool:
+        return bool(await self.redis.exists(self._stream(task_id)))
+
+    async def subscribe(
+        self,
+        task_id: str,
+        last_event_id: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+    ) -> AsyncIterator[Optional[TaskEvent]]:
+        stream = self._stream(task_id)
+        cursor = f"{last_event_id or 0}-0"
+        block = int(idle_timeout * 1000) if idle_timeout else 0  # 0 blocks until an event arrives
+        while True:
+            response = await self.redis.xread({stream: cursor}, count=self.history_limit, block=block)
+            if not response:
+                yield None
+                continue
+            for entry_id, fields in response[0][1]:
+                cursor = entry_id
+                item = TaskEvent(
+                    id=int(entry_id.split("-", 1)[0]),
+                    task_id=task_id,
+                    event=fields["event"],
+                    data=json.loads(fields.get("data") or "{}"),
+                    timestamp=datetime.fromisoformat(fields["timestamp"]),
+                )
+                yield item
+                if item.event == END_EVENT:
+                    return
+
+    async def shutdown(self) -> None:
+        await super().shutdown()
+        await self.redis.aclose()
+
+
+_task_event_bus: Optional[TaskEventBus] = None
+
+
+def get_task_event_bus() -> TaskEventBus:
+    """
+    Return the process-wide task event bus for JOB_QUEUE_BACKEND: in memory for 'inline',
+    the task_events table for 'sqlite', Redis streams for 'redis'.
+    """
+    global _task_event_bus
+    if _task_event_bus is None:
+        backend = settings.JOB_QUEUE_BACKEND.lower()
+        if backend == "redis":
+            _task_event_bus = RedisTaskEventBus()
+        elif backend == "sqlite":
+            _task_event_bus = SQLTaskEventBus()
+        else:
+            _task_event_bus = LocalTaskEventBus()
+    return _task_event_bus
+
+
+async def close_task_event_bus() -> None:
+    global _task_event_bus
+    if _task_event_bus is not None:
+        await _task_event_bus.shutdown()
+    _task_event_bus = None
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Callable
+from collections import deque
 from datetime import datetime
+import asyncio
+import atexit
 import logging
+import threading
 
+from sqlalchemy import insert
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import StaticPool
+from app.config import settings
 from app.core.database import SessionLocal
 from app.models.database import Provenance
 
@@ -21,9 +28,11 @@ async def log_provenance(
     user_agent: Optional[str] = None,
 ) -> None:
     """
-    Async-friendly provenance logger with auto-init fallback.
-    If the provenance table is missing, attempt to initialize the DB and retry once.
-    Never raises; provenance must not break primary workflows.
+    Async-friendly provenance logger.
+    Records are queued on the process-wide ProvenanceWriter and inserted in batches by its
+    background flusher, so callers do not wait on the database (unless the buffer is full and
+    the overflow policy is "block"). With PROVENANCE_BUFFER_ENABLED off the row is written
+    immediately. Never raises; provenance must not break primary workflows.
     """
     payload: Dict[str, Any] = {
         "actor": actor,
@@ -36,48 +45,203 @@ async def log_provenance(
         "created_at": datetime.utcnow(),
     }
 
-    session = SessionLocal()
     try:
-        record = Provenance(**payload)
-        session.add(record)
-        session.commit()
-        return
+        writer = get_provenance_writer()
+        if writer.enabled:
+            await writer.submit(payload)
+        else:
+            _write_records([payload], SessionLocal)
     except Exception as e:
-        # Detect "no such table" and attempt auto-init + single retry
-        msg = ""
-        try:
-            msg = str(e).lower()
-        except Exception:
-            msg = ""
-        missing_table = ("no such table" in msg) or isinstance(e, OperationalError)
-
-        if missing_table:
-            try:
-                from app.core.database import init_db
-                await init_db()
-                try:
-                    # retry once with a fresh record
-                    record = Provenance(**payload)
-                    session.add(record)
-                    session.commit()
-                    return
-                except Exception as e2:
-                    logger.error(f"Provenance retry failed after init: {e2}")
-                    try:
-                        session.rollback()
-                    except Exception:
-                        pass
-            except Exception as init_err:
-                logger.error(f"DB init failed during provenance logging: {init_err}")
-
-        # Final fallback: log and swallow
         logger.error(f"Failed to write provenance: {e}")
+
+
+def _write_records(records: List[Dict[str, Any]], session_factory: Callable[[], Any]) -> None:
+    """
+    Insert provenance rows in one statement and commit.
+    If the provenance table is missing, create the tables and retry once.
+    """
+    session = session_factory()
+    try:
+        try:
+            session.execute(insert(Provenance), records)
+            session.commit()
+        except OperationalError as e:
+            session.rollback()
+            if "no such table" not in str(e).lower() and "does not exist" not in str(e).lower():
+                raise
+            from app.core.database import Base
+            from app.models import database  # noqa: F401  (register models)
+            Base.metadata.create_all(bind=session.get_bind())
+            session.execute(insert(Provenance), records)
+            session.commit()
+    except Exception:
         try:
             session.rollback()
         except Exception:
             pass
+        raise
     finally:
         try:
             session.close()
         except Exception:
             pass
+
+
+class ProvenanceWriter:
+    """
+    In-process buffer for provenance rows with a background flusher.
+
+    Records are flushed in one INSERT when `batch_size` are queued or `flush_interval` seconds
+    after the first queued record, whichever comes first, and on close() (FastAPI shutdown),
+    when the event loop running the flusher shuts down, and at interpreter exit. At most
+    `max_queue` records are held; beyond that the "drop" policy discards new records (counted
+    in stats) and the "block" policy makes the caller flush first. With a single shared
+    connection (SQLite StaticPool) batches are written on the event loop thread, otherwise
+    in a worker thread.
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_queue: Optional[int] = None,
+        overflow_policy: Optional[str] = None,
+        session_factory: Optional[Callable[[], Any]] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        self.batch_size = max(1, batch_size or settings.PROVENANCE_BATCH_SIZE)
+        self.flush_interval = flush_interval if flush_interval is not None else settings.PROVENANCE_FLUSH_INTERVAL_SECONDS
+        self.max_queue = max(self.batch_size, max_queue or settings.PROVENANCE_MAX_QUEUE)
+        self.overflow_policy = (overflow_policy or settings.PROVENANCE_OVERFLOW_POLICY).lower()
+        if self.overflow_policy not in ("drop", "block"):
+            raise ValueError(f"Unknown provenance overflow policy: {self.overflow_policy}")
+        self.session_factory = session_factory
+        self.enabled = settings.PROVENANCE_BUFFER_ENABLED if enabled is None else enabled
+
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+
+        self._buffer: deque = deque()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def submit(self, record: Dict[str, Any]) -> None:
+        """Queue one record; returns without touching the database unless the buffer is full."""
+        if len(self._buffer) >= self.max_queue:
+            if self.overflow_policy == "drop":
+                self.dropped += 1
+                return
+            await self.flush()
+        with self._lock:
+            self._buffer.append(record)
+            pending = len(self._buffer)
+        self._ensure_flusher()
+        if pending >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Write everything queued so far."""
+        while self._buffer:
+            batch = self._take_batch()
+            if self._writes_inline():
+                self._write(batch)
+            else:
+                await asyncio.to_thread(self._write, batch)
+
+    async def close(self) -> None:
+        """Stop the flusher and write whatever is still queued."""
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None and not flusher.done() and flusher.get_loop() is asyncio.get_running_loop():
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    def flush_sync(self) -> None:
+        """Blocking flush for shutdown paths without a running event loop."""
+        while self._buffer:
+            self._write(self._take_batch())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "queued": len(self._buffer),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+            "batch_size": self.batch_size,
+            "flush_interval_seconds": self.flush_interval,
+            "max_queue": self.max_queue,
+            "overflow_policy": self.overflow_policy,
+        }
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        if not batch:
+            return
+        with self._write_lock:
+            try:
+                _write_records(batch, self.session_factory or SessionLocal)
+                self.written += len(batch)
+                self.batches += 1
+            except Exception as e:
+                self.failed += len(batch)
+                logger.error(f"Failed to write {len(batch)} provenance record(s): {e}")
+
+    def _writes_inline(self) -> bool:
+        """True when the engine shares one connection, which must stay on one thread."""
+        try:
+            session = (self.session_factory or SessionLocal)()
+            try:
+                return isinstance(session.get_bind().pool, StaticPool)
+            finally:
+                session.close()
+        except Exception:
+            return True
+
+    def _ensure_flusher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._flusher is not None and not self._flusher.done() and self._loop is loop:
+            return
+        # First use, or a new event loop (e.g. successive asyncio.run calls in scripts)
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._flusher = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        wakeup = self._wakeup
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                wakeup.clear()
+                await self.flush()
+        except asyncio.CancelledError:
+            # Loop shutting down (or close()): do not lose what is queued
+            self.flush_sync()
+            raise
+
+
+_provenance_writer: Optional[ProvenanceWriter] = None
+
+
+def get_provenance_writer() -> ProvenanceWriter:
+    """Return the process-wide provenance writer."""
+    global _provenance_writer
+    if _provenance_writer is None:
+        _provenance_writer = ProvenanceWriter()
+        atexit.register(_provenance_writer.flush_sync)
+    return _provenance_writer
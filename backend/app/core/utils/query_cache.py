@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(value: Any) -> Any:
+    """Canonical form for fingerprinting: case/whitespace-insensitive strings, order-insensitive lists."""
+    if isinstance(value, str):
+        return " ".join(value.lower().split())
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple, set)):
+        items = [_normalize(v) for v in value]
+        return sorted(items, key=lambda v: json.dumps(v, sort_keys=True, default=str))
+    return value
+
+
+def query_fingerprint(
+    query: str,
+    database: str,
+    filters: Optional[Dict[str, Any]] = None,
+    max_results: int = 20,
+    namespace: str = "search",
+) -> str:
+    """Stable hash of a search request; equivalent requests map to the same key."""
+    payload = {
+        "ns": namespace,
+        "query": _normalize(query or ""),
+        "database": _normalize(database or ""),
+        "filters": _normalize(filters or {}),
+        "max_results": int(max_results),
+    }
+    raw = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class QueryCache:
+    """
+    In-process TTL + LRU cache for search results keyed by query fingerprint.
+
+    Concurrent misses for the same key share one computation (single flight), so a
+    re-submitted query that is still running does not start a second LLM/browser pipeline.
+    Values are deep-copied on the way in and out so callers cannot mutate cached results.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        self.max_entries = max(1, max_entries if max_entries is not None else settings.QUERY_CACHE_MAX_ENTRIES)
+        self.ttl = ttl if ttl is not None else settings.QUERY_CACHE_TTL_SECONDS
+        self.enabled = settings.QUERY_CACHE_ENABLED if enabled is None else enabled
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a cached value (counting a hit) or None (counting a miss)."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, value = entry
+            if self.ttl <= 0 or time.monotonic() - stored_at <= self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(value)
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        if not self.enabled:
+            return
+        self._entries[key] = (time.monotonic(), copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one key, or everything when key is None."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        bypass: bool = False,
+        cache_empty: bool = False,
+    ) -> Any:
+        """
+        Return the cached value for `key`, or await `compute()` and cache its result.
+        `bypass` forces a fresh computation (the result still refreshes the cache).
+        Empty results are not cached unless `cache_empty` is set.
+        """
+        if not self.enabled:
+            return await compute()
+
+        if not bypass:
+            cached = self.get(key)
+            if cached is not None:
+                return cached
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                return copy.deepcopy(await asyncio.shield(inflight))
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+                future.exception()  # mark retrieved so waiter-less failures are not logged
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+        if value or cache_empty:
+            self.set(key, value)
+        if not future.done():
+            future.set_result(copy.deepcopy(value))
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+_query_cache: Optional[QueryCache] = None
+
+
+def get_query_cache() -> QueryCache:
+    """Return the process-wide search result cache."""
+    global _query_cache
+    if _query_cache is None:
+        _query_cache = QueryCache()
+    return _query_cache
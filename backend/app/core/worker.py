@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from app.config import settings
+from app.core.job_queue import Job, JobQueue, get_job_queue
+
+logger = logging.getLogger(__name__)
+
+
+async def run_search_job(job: Job) -> None:
+    """Queue handler for search tasks; the job id is the Task id."""
+    from app.core.search_tasks import execute_search_task, update_search_task_after_error
+
+    try:
+        await execute_search_task(job.id, job.payload.get("request") or {})
+    except Exception as e:
+        await update_search_task_after_error(job.id, str(e), final=job.attempts >= job.max_attempts)
+        raise
+
+
+async def fail_search_job(job: Job, error: str) -> None:
+    from app.core.search_tasks import update_search_task_after_error
+
+    await update_search_task_after_error(job.id, error, final=True)
+
+
+# Job kind -> handler; a handler raising means the attempt failed
+JOB_HANDLERS: Dict[str, Callable[[Job], Awaitable[None]]] = {
+    "search": run_search_job,
+}
+
+# Job kind -> cleanup for jobs dead-lettered without their handler finishing
+# (e.g. leases that kept expiring because the worker process died)
+DEAD_JOB_HANDLERS: Dict[str, Callable[[Job, str], Awaitable[None]]] = {
+    "search": fail_search_job,
+}
+
+
+class Worker:
+    """
+    Pulls jobs from a JobQueue and runs up to `concurrency` of them at once.
+
+    Leases are renewed every third of the visibility timeout while a handler runs. A
+    failed attempt is retried after an exponential backoff (JOB_RETRY_BACKOFF_SECONDS,
+    doubling per attempt, capped at JOB_RETRY_BACKOFF_MAX_SECONDS) until the job's
+    max_attempts, then dead-lettered. stop() stops claiming and lets running jobs finish.
+    """
+
+    def __init__(
+        self,
+        queue: Optional[JobQueue] = None,
+        concurrency: Optional[int] = None,
+        visibility_timeout: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+        backoff: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+        handlers: Optional[Dict[str, Callable[[Job], Awaitable[None]]]] = None,
+        dead_handlers: Optional[Dict[str, Callable[[Job, str], Awaitable[None]]]] = None,
+        worker_id: Optional[str] = None,
+    ) -> None:
+        self.queue = queue or get_job_queue()
+        self.concurrency = max(1, concurrency or settings.JOB_WORKER_CONCURRENCY)
+        self.visibility_timeout = visibility_timeout or settings.JOB_VISIBILITY_TIMEOUT_SECONDS
+        self.poll_interval = poll_interval if poll_interval is not None else settings.JOB_POLL_INTERVAL_SECONDS
+        self.backoff = backoff if backoff is not None else settings.JOB_RETRY_BACKOFF_SECONDS
+        self.backoff_max = backoff_max if backoff_max is not None else settings.JOB_RETRY_BACKOFF_MAX_SECONDS
+        self.handlers = JOB_HANDLERS if handlers is None else handlers
+        self.dead_handlers = DEAD_JOB_HANDLERS if dead_handlers is None else dead_handlers
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+        self.completed = 0
+        self.retried = 0
+        self.dead = 0
+        self._stopping = asyncio.Event()
+        self._running: Set[asyncio.Task] = set()
+
+    def retry_delay(self, attempts: int) -> float:
+        """Backoff before the next delivery after `attempts` failed deliveries."""
+        return min(self.backoff_max, self.backoff * (2 ** max(0, attempts - 1)))
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run(self) -> None:
+        """Claim and run jobs until stop(); then wait for running jobs."""
+        slots = asyncio.Semaphore(self.concurrency)
+        logger.info(f"Worker {self.worker_id} started (concurrency={self.concurrency})")
+        while not self._stopping.is_set():
+            await slots.acquire()
+            job = None
+            if not self._stopping.is_set():
+                try:
+                    job = await self.queue.claim(self.worker_id, self.visibility_timeout)
+                except Exception as e:
+                    logger.error(f"Worker {self.worker_id} could not claim a job: {e}")
+            if job is None:
+                slots.release()
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            running = asyncio.create_task(self._process(job))
+            self._running.add(running)
+            running.add_done_callback(lambda t: (self._running.discard(t), slots.release()))
+
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+        logger.info(f"Worker {self.worker_id} stopped: {self.stats()}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "running": len(self._running),
+            "completed": self.completed,
+            "retried": self.retried,
+            "dead": self.dead,
+        }
+
+    async def _process(self, job: Job) -> None:
+        if job.attempts > job.max_attempts:
+            # Redelivered after its last attempt's lease expired (worker crashed or hung)
+            await self._dead_letter(job, f"Lease expired on final attempt {job.max_attempts}", run_cleanup=True)
+            return
+        handler = self.handlers.get(job.kind)
+        if handler is None:
+            await self._dead_letter(job, f"No handler for job kind {job.kind!r}", run_cleanup=False)
+            return
+
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            await handler(job)
+        except Exception as e:
+            if job.attempts >= job.max_attempts:
+                await self._dead_letter(job, str(e), run_cleanup=False)
+            else:
+                delay = self.retry_delay(job.attempts)
+                logger.warning(f"Job {job.id} attempt {job.attempts} failed ({e}); retrying in {delay:.1f}s")
+                await self.queue.retry(job, delay, str(e))
+                self.retried += 1
+            return
+        finally:
+            heartbeat.cancel()
+        try:
+            await self.queue.ack(job)
+        except Exception as e:
+            logger.error(f"Could not ack job {job.id}; it will be delivered again: {e}")
+        self.completed += 1
+
+    async def _dead_letter(self, job: Job, error: str, run_cleanup: bool) -> None:
+        logger.error(f"Job {job.id} ({job.kind}) dead-lettered after {job.attempts} attempt(s): {error}")
+        await self.queue.dead(job, error)
+        self.dead += 1
+        cleanup = self.dead_handlers.get(job.kind) if run_cleanup else None
+        if cleanup is not None:
+            try:
+                await cleanup(job, error)
+            except Exception as e:
+                logger.error(f"Dead-letter cleanup failed for job {job.id}: {e}")
+
+    async def _heartbeat(self, job: Job) -> None:
+        interval = max(0.05, self.visibility_timeout / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await self.queue.extend(job, self.visibility_timeout):
+                    logger.warning(f"Job {job.id} lost its lease; it may be delivered again")
+                    return
+            except Exception as e:
+                logger.warning(f"Could not extend lease of job {job.id}: {e}")
+
+
+async def _serve(concurrency: Optional[int]) -> None:
+    from app.core.database import init_db
+    from app.core.scrapers.browser_pool import get_browser_pool
+
+    await init_db()
+    get_browser_pool().start_idle_eviction()
+    worker = Worker(concurrency=concurrency)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:  # Windows
+            pass
+    try:
+        await worker.run()
+    finally:
+        from app.core.lifecycle import close_shared_resources
+
+        await close_shared_resources()
+
+
+def _worker_process(concurrency: Optional[int]) -> None:
+    from app.core.logging import setup_logging
+
+    setup_logging()
+    asyncio.run(_serve(concurrency))
+
+
+def run_workers(processes: int = 1, concurrency: Optional[int] = None) -> None:
+    """Run `processes` worker processes (each with `concurrency` job slots) until interrupted."""
+    if settings.JOB_QUEUE_BACKEND.lower() == "inline":
+        raise SystemExit("JOB_QUEUE_BACKEND=inline runs searches in the API process; set it to 'sqlite' or 'redis'")
+    if processes <= 1:
+        _worker_process(concurrency)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    children = [context.Process(target=_worker_process, args=(concurrency,), name=f"worker-{n}") for n in range(processes)]
+    for child in children:
+        child.start()
+
+    def _forward(signum, frame):
+        for child in children:
+            if child.is_alive():
+                os.kill(child.pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGINT, _forward)
+    signal.signal(signal.SIGTERM, _forward)
+    for child in children:
+        child.join()
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run search workers for the job queue")
+    parser.add_argument("--processes", type=int, default=1, help="Worker processes")
+    parser.add_argument("--concurrency", type=int, default=None, help="Jobs per process (default JOB_WORKER_CONCURRENCY)")
+    args = parser.parse_args(argv)
+    run_workers(args.processes, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,13 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 import logging
 
+from app.api.pagination import NEXT_CURSOR_HEADER
 from app.api.v1.router import api_router
 from app.config import settings
 from app.core.database import init_db
+from app.core.lifecycle import close_shared_resources
 from app.core.logging import setup_logging
+from app.core.scrapers.browser_pool import get_browser_pool
 from app.utils.exceptions import BiodataException
 
 # Setup logging
@@ -26,11 +29,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         raise
+    get_browser_pool().start_idle_eviction()
     
     yield
     
     # Shutdown
     logger.info("Shutting down application")
+    await close_shared_resources()
 
 # Create FastAPI app
 app = FastAPI(
@@ -47,6 +52,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Include API router
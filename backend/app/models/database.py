@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, JSON, ForeignKey, Text, Float
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, JSON, ForeignKey, Text, Float, Index
 from sqlalchemy.sql import func
 from app.core.database import Base
 import uuid
@@ -37,6 +37,22 @@ class Dataset(Base):
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now())
 
+    # list_datasets filters on source and/or access_type and sorts by created_at
+    __table_args__ = (
+        Index("ix_datasets_created_at", "created_at"),
+        Index("ix_datasets_source_access_type", "source", "access_type"),
+        Index("ix_datasets_access_type", "access_type"),
+    )
+
+class GEOAccessionCache(Base):
+    __tablename__ = "geo_accession_cache"
+    
+    accession = Column(String, primary_key=True)  # e.g., GSE12345
+    data = Column(JSON, nullable=False)  # Normalized GEODataset fields (incl. contact/download)
+    fetched_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, onupdate=func.now())
+
 class OutreachRequest(Base):
     __tablename__ = "outreach_requests"
     
@@ -60,6 +76,17 @@ class OutreachRequest(Base):
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now())
 
+    # Webhooks look outreach up by thread/message/dataset id; list_outreach_requests filters
+    # on status or requester and sorts by created_at
+    __table_args__ = (
+        Index("ix_outreach_requests_thread_id", "thread_id"),
+        Index("ix_outreach_requests_message_id", "message_id"),
+        Index("ix_outreach_requests_dataset_id", "dataset_id"),
+        Index("ix_outreach_requests_created_at", "created_at"),
+        Index("ix_outreach_requests_status_created_at", "status", "created_at"),
+        Index("ix_outreach_requests_requester_email_created_at", "requester_email", "created_at"),
+    )
+
 class Provenance(Base):
     __tablename__ = "provenance"
     
@@ -78,7 +105,7 @@ class Task(Base):
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     type = Column(String, nullable=False)  # 'search'|'find_contact'|'send_email'
-    status = Column(String, nullable=False, default="pending")  # 'pending'|'running'|'completed'|'failed'
+    status = Column(String, nullable=False, default="pending")  # 'pending'|'running'|'completed'|'failed'|'cancelled'
     user_email = Column(String)
     input_data = Column(JSON)
     output_data = Column(JSON)
@@ -88,6 +115,14 @@ class Task(Base):
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now())
 
+    # list_tasks filters on type, status and/or user_email and sorts by created_at
+    __table_args__ = (
+        Index("ix_tasks_created_at", "created_at"),
+        Index("ix_tasks_status_created_at", "status", "created_at"),
+        Index("ix_tasks_type_created_at", "type", "created_at"),
+        Index("ix_tasks_user_email_created_at", "user_email", "created_at"),
+    )
+
 
 class Lead(Base):
     __tablename__ = "leads"
@@ -109,3 +144,61 @@ class Lead(Base):
     stage = Column(String, nullable=False, default="new")  # LeadStage values
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now())
+
+    # Lead review works per repository and pipeline stage
+    __table_args__ = (
+        Index("ix_leads_repo_stage", "repo", "stage"),
+        Index("ix_leads_stage", "stage"),
+    )
+
+
+class QueuedJob(Base):
+    __tablename__ = "job_queue"
+    
+    id = Column(String, primary_key=True)  # Task.id for search jobs (one queue entry per task)
+    queue = Column(String, nullable=False)
+    kind = Column(String, nullable=False)  # 'search'
+    payload = Column(JSON, default=lambda: {})
+    status = Column(String, nullable=False, default="queued")  # 'queued'|'leased'|'dead'
+    attempts = Column(Integer, nullable=False, default=0)  # Deliveries so far
+    max_attempts = Column(Integer, nullable=False)
+    available_at = Column(DateTime, nullable=False)  # Not delivered before (retry backoff)
+    leased_until = Column(DateTime, nullable=True)  # Visibility timeout of the current delivery
+    lease_owner = Column(String, nullable=True)
+    lease_token = Column(String, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, onupdate=func.now())
+
+    # Workers claim due queued jobs and expired leases
+    __table_args__ = (
+        Index("ix_job_queue_queue_status_available_at", "queue", "status", "available_at"),
+        Index("ix_job_queue_queue_status_leased_until", "queue", "status", "leased_until"),
+    )
+
+
+class TaskEventRecord(Base):
+    __tablename__ = "task_events"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)  # SSE event id (Last-Event-ID)
+    task_id = Column(String, nullable=False)
+    event = Column(String, nullable=False)  # 'status'|'plan_ready'|...|'end'
+    data = Column(JSON, default=lambda: {})
+    published_at = Column(DateTime, nullable=False)
+
+    # Subscribers read a task's events after the last id they saw
+    __table_args__ = (
+        Index("ix_task_events_task_id_id", "task_id", "id"),
+        Index("ix_task_events_event_published_at", "event", "published_at"),
+    )
+
+
+class GitHubSyncState(Base):
+    __tablename__ = "github_sync_state"
+    
+    repo = Column(String, primary_key=True)  # 'owner/repo'
+    last_issue_number = Column(Integer, nullable=False, default=0)  # Highest issue number seen
+    last_updated_at = Column(String, nullable=True)  # ISO 8601 high-water mark of issue updated_at
+    last_synced_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, onupdate=func.now())
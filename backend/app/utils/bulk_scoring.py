@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from app.utils.scoring import DEFAULT_SCORING_WEIGHTS, ScoringWeights
+
+
+def _numeric(value: Any, types: tuple = (int, float)) -> float:
+    """Float for values calculate_novice_score compares numerically; NaN (never scores) otherwise."""
+    return float(value) if isinstance(value, types) else np.nan
+
+
+class SignalColumns:
+    """
+    Scoring signals of many leads as NumPy columns (one row per lead).
+
+    Numeric columns hold NaN where calculate_novice_score would skip the signal. Label
+    membership depends on the weights, so labels are kept as a small vocabulary plus a
+    boolean row x label matrix and resolved at scoring time.
+    """
+
+    def __init__(self, signals: Sequence[Dict[str, Any]], has_email: Optional[Sequence[bool]] = None) -> None:
+        n = len(signals)
+        self.account_age_days = np.empty(n)
+        self.followers = np.empty(n)
+        self.public_repos = np.empty(n)
+        self.issue_body_length = np.empty(n)
+        self.has_keywords = np.zeros(n, dtype=bool)
+        self.no_code_blocks = np.zeros(n, dtype=bool)
+        self.punctuation_excess = np.zeros(n, dtype=bool)
+        self.has_email = np.ones(n, dtype=bool) if has_email is None else np.asarray(has_email, dtype=bool)
+
+        label_index: Dict[str, int] = {}
+        label_rows: List[int] = []
+        label_cols: List[int] = []
+        for i, s in enumerate(signals):
+            s = s or {}
+            self.account_age_days[i] = _numeric(s.get("account_age_days"))
+            self.followers[i] = _numeric(s.get("followers"))
+            self.public_repos[i] = _numeric(s.get("public_repos"))
+            self.issue_body_length[i] = _numeric(s.get("issue_body_length"), (int,))
+            self.has_keywords[i] = len(s.get("keywords") or []) > 0
+            self.no_code_blocks[i] = s.get("code_blocks_present") is False
+            self.punctuation_excess[i] = bool(s.get("punctuation_excess"))
+            for label in s.get("labels") or []:
+                label_rows.append(i)
+                label_cols.append(label_index.setdefault(label, len(label_index)))
+
+        self.labels = list(label_index)
+        self.label_matrix = np.zeros((n, len(self.labels)), dtype=bool)
+        self.label_matrix[label_rows, label_cols] = True
+
+    def __len__(self) -> int:
+        return len(self.has_keywords)
+
+    @classmethod
+    def from_leads(cls, leads: Iterable[Any]) -> "SignalColumns":
+        """Columns from Lead rows (or dicts) using their stored `signals` JSON and `email`."""
+        signals, has_email = [], []
+        for lead in leads:
+            get = lead.get if isinstance(lead, dict) else lambda key, _lead=lead: getattr(_lead, key, None)
+            signals.append(get("signals") or {})
+            has_email.append(bool(get("email")))
+        return cls(signals, has_email)
+
+
+def score_columns(columns: SignalColumns, weights: Optional[ScoringWeights] = None) -> np.ndarray:
+    """Novice scores for every row; equal to calculate_novice_score applied row by row."""
+    w = weights or DEFAULT_SCORING_WEIGHTS
+    score = np.zeros(len(columns))
+    # NaN comparisons are False, so missing values never score (same order of additions as the scalar path)
+    with np.errstate(invalid="ignore"):
+        score += np.where(columns.account_age_days < w.account_age_days_below, w.account_age, 0.0)
+        score += np.where(columns.followers < w.followers_below, w.followers, 0.0)
+        score += np.where(columns.public_repos < w.public_repos_below, w.public_repos, 0.0)
+        score += np.where(columns.has_keywords, w.keywords, 0.0)
+        score += np.where(columns.no_code_blocks, w.no_code_blocks, 0.0)
+        novice = np.isin(np.asarray(columns.labels, dtype=object), list(w.novice_label_names))
+        has_novice_label = columns.label_matrix[:, novice].any(axis=1) if novice.any() else np.zeros(len(columns), dtype=bool)
+        score += np.where(has_novice_label, w.novice_labels, 0.0)
+        score += np.where(columns.issue_body_length < w.short_body_below, w.short_body, 0.0)
+        score += np.where(columns.punctuation_excess, w.punctuation_excess, 0.0)
+    return np.clip(score, 0.0, 1.0)
+
+
+def select_leads(
+    scores: np.ndarray,
+    columns: SignalColumns,
+    threshold: Optional[float] = None,
+    require_email: bool = True,
+) -> np.ndarray:
+    """
+    Row indices passing the threshold (and having an email), best first; ties keep row order,
+    as in filter_high_scoring_leads.
+    """
+    cutoff = DEFAULT_SCORING_WEIGHTS.threshold if threshold is None else threshold
+    mask = scores >= cutoff
+    if require_email:
+        mask &= columns.has_email
+    selected = np.flatnonzero(mask)
+    return selected[np.argsort(-scores[selected], kind="stable")]
+
+
+def rescore(
+    signals: Sequence[Dict[str, Any]],
+    weights: Optional[ScoringWeights] = None,
+) -> np.ndarray:
+    """Convenience wrapper: scores for a list of signal dicts."""
+    return score_columns(SignalColumns(signals), weights)
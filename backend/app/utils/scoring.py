@@ -1,13 +1,168 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 import logging
 
+from pydantic import BaseModel, Field
+
 logger = logging.getLogger(__name__)
 
 
+# Look for novice keywords in BOTH title AND body (more comprehensive)
+NOVICE_KEYWORDS = (
+    "beginner", "new", "help", "install", "installation", "error", "problem",
+    "stuck", "confused", "how to", "tutorial", "guide", "basic", "simple",
+    "start", "getting started", "first time", "newbie", "documentation",
+    "can't", "cannot", "unable", "fail", "failed", "wrong", "issue",
+    "struggling", "trouble", "difficulty", "please help", "need help",
+    "not working", "broken", "fix", "solve", "solution",
+)
+
+# Code blocks in the issue body (indicates technical sophistication)
+CODE_BLOCK_PATTERNS = (
+    r"```[\s\S]*?```",  # Triple backticks
+    r"`[^`\n]+`",       # Inline code
+    r"    [^\n]+",      # Indented code blocks
+    r"^\s*[a-zA-Z_][a-zA-Z0-9_]*\s*=",  # Variable assignments
+    r"import\s+\w+",    # Python imports
+    r"from\s+\w+\s+import",  # Python from imports
+)
+
+# Substrings at least one of which every code pattern requires
+CODE_BLOCK_MARKERS = ("`", "    ", "=", "import")
+
+# Stack traces/error messages (sign of struggle)
+ERROR_PHRASES = (
+    "traceback",
+    "error:",
+    "exception:",
+    "attributeerror",
+    "keyerror",
+    "valueerror",
+    "modulenotfounderror",
+    "importerror",
+)
+
+# Expressions of frustration
+FRUSTRATION_PHRASES = (
+    "frustrat",
+    "annoying",
+    "driving me crazy",
+    "pulling my hair",
+    "spent hours",
+    "been trying for",
+    "why is", "why does", "why doesn't", "why won't",
+    "this is work", "this doesn't work",
+)
+
+
+def _trie_pattern(words) -> str:
+    """Regex alternation factored by common prefixes; matches the longest word at a position."""
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def _render(node: Dict[str, Any]) -> str:
+        branches = [re.escape(ch) + _render(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return _render(trie)
+
+
+class SignalMatcher:
+    """
+    Text signals of an issue from regexes compiled once.
+    
+    Keywords, error phrases and frustration phrases share one prefix-trie regex scanned over
+    "title body": each search returns the longest phrase starting at a position, and phrases
+    contained in a hit are implied by it. The next search resumes at the earliest offset inside
+    the hit where another phrase could start and run past it (precomputed per phrase), so
+    overlapping phrases are still found. Code blocks are one combined MULTILINE search over the body. Results
+    equal the per-keyword substring scans and per-pattern re.search calls this replaces.
+    """
+    
+    def __init__(
+        self,
+        keywords=NOVICE_KEYWORDS,
+        error_phrases=ERROR_PHRASES,
+        frustration_phrases=FRUSTRATION_PHRASES,
+        code_patterns=CODE_BLOCK_PATTERNS,
+        code_markers=CODE_BLOCK_MARKERS,
+    ) -> None:
+        self.keywords = tuple(dict.fromkeys(keywords))
+        phrases = list(dict.fromkeys(self.keywords + tuple(error_phrases) + tuple(frustration_phrases)))
+        self._phrase_re = re.compile(_trie_pattern(phrases))
+        # phrase -> (keywords it contains, contains an error phrase, contains a frustration phrase)
+        self._hits = {
+            phrase: (
+                tuple(kw for kw in self.keywords if kw in phrase),
+                any(e in phrase for e in error_phrases),
+                any(f in phrase for f in frustration_phrases),
+            )
+            for phrase in phrases
+        }
+        # phrase -> offset of its earliest proper suffix that begins some phrase it does not contain
+        self._resume = {
+            phrase: next(
+                (
+                    i for i in range(1, len(phrase))
+                    if any(other.startswith(phrase[i:]) and other not in phrase for other in phrases)
+                ),
+                len(phrase),
+            )
+            for phrase in phrases
+        }
+        self._order = {kw: i for i, kw in enumerate(self.keywords)}
+        self.code_markers = tuple(code_markers)
+        self._code_re = re.compile("|".join(f"(?:{p})" for p in code_patterns), re.MULTILINE)
+        # Error/frustration checks are case-insensitive; that only matters beyond ASCII
+        self._error_re = re.compile("|".join(re.escape(p) for p in error_phrases), re.IGNORECASE)
+        self._frustration_re = re.compile("|".join(re.escape(p) for p in frustration_phrases), re.IGNORECASE)
+    
+    def scan(self, title: str, body: str) -> Dict[str, Any]:
+        """Keywords (in declaration order) over "title body"; body flags (None without a body)."""
+        text = f"{title} {body}"
+        body_start = len(title) + 1
+        found = set()
+        has_errors = has_frustration = False
+        search = self._phrase_re.search
+        m = search(text)
+        while m is not None:
+            phrase = m.group()
+            keywords, error, frustration = self._hits[phrase]
+            found.update(keywords)
+            if m.start() >= body_start:
+                has_errors = has_errors or error
+                has_frustration = has_frustration or frustration
+            m = search(text, m.start() + self._resume[phrase])
+        
+        signals: Dict[str, Any] = {"keywords": sorted(found, key=self._order.__getitem__)}
+        if not body:
+            signals.update(code_blocks_present=None, has_error_traces=None, shows_frustration=None)
+            return signals
+        if not body.isascii():
+            has_errors = self._error_re.search(body) is not None
+            has_frustration = self._frustration_re.search(body) is not None
+        # Every code pattern needs one of these substrings; most prose bodies skip the regex
+        signals["code_blocks_present"] = (
+            any(marker in body for marker in self.code_markers) and self._code_re.search(body) is not None
+        )
+        signals["has_error_traces"] = has_errors
+        signals["shows_frustration"] = has_frustration
+        return signals
+
+
+_signal_matcher = SignalMatcher()
+
+
 def extract_signals(issue: Dict[str, Any], profile_meta: Dict[str, Any]) -> Dict[str, Any]:
     """
     Extract scoring signals from an issue and profile metadata.
@@ -27,79 +182,17 @@ def extract_signals(issue: Dict[str, Any], profile_meta: Dict[str, Any]) -> Dict
     issue_labels = [str(label).lower() for label in (issue.get("issue_labels") or [])]
     
     # Calculate issue body length (important for scoring)
-    signals["issue_body_length"] = len(str(issue_body)) if issue_body else None
+    signals["issue_body_length"] = len(issue_body) if issue_body else None
     
     # Extract labels
     signals["labels"] = issue_labels
     
-    # Look for novice keywords in BOTH title AND body (more comprehensive)
-    novice_keywords = [
-        "beginner", "new", "help", "install", "installation", "error", "problem",
-        "stuck", "confused", "how to", "tutorial", "guide", "basic", "simple",
-        "start", "getting started", "first time", "newbie", "documentation",
-        "can't", "cannot", "unable", "fail", "failed", "wrong", "issue",
-        "struggling", "trouble", "difficulty", "please help", "need help",
-        "not working", "broken", "fix", "solve", "solution"
-    ]
-    
-    matched_keywords = []
-    combined_text = f"{issue_title} {issue_body}"
-    
-    for keyword in novice_keywords:
-        if keyword in combined_text:
-            matched_keywords.append(keyword)
-    
-    signals["keywords"] = matched_keywords
-    
-    # Check for code blocks in issue body (indicates technical sophistication)
-    if issue_body:
-        code_block_patterns = [
-            r"```[\s\S]*?```",  # Triple backticks
-            r"`[^`\n]+`",       # Inline code
-            r"    [^\n]+",      # Indented code blocks
-            r"^\s*[a-zA-Z_][a-zA-Z0-9_]*\s*=",  # Variable assignments
-            r"import\s+\w+",    # Python imports
-            r"from\s+\w+\s+import",  # Python from imports
-        ]
-        has_code = any(re.search(pattern, str(issue_body), re.MULTILINE) for pattern in code_block_patterns)
-        signals["code_blocks_present"] = has_code
-        
-        # Look for stack traces/error messages (sign of struggle)
-        error_patterns = [
-            r"traceback",
-            r"error:",
-            r"exception:",
-            r"attributeerror",
-            r"keyerror", 
-            r"valueerror",
-            r"modulenotfounderror",
-            r"importerror",
-        ]
-        has_errors = any(re.search(pattern, str(issue_body), re.IGNORECASE) for pattern in error_patterns)
-        signals["has_error_traces"] = has_errors
-        
-        # Check for expressions of frustration
-        frustration_patterns = [
-            r"frustrat",
-            r"annoying",
-            r"driving me crazy",
-            r"pulling my hair",
-            r"spent hours",
-            r"been trying for",
-            r"why (is|does|doesn't|won't)",
-            r"this (is|doesn't) work",
-        ]
-        has_frustration = any(re.search(pattern, str(issue_body), re.IGNORECASE) for pattern in frustration_patterns)
-        signals["shows_frustration"] = has_frustration
-        
-    else:
-        signals["code_blocks_present"] = None
-        signals["has_error_traces"] = None
-        signals["shows_frustration"] = None
+    # Keywords, code blocks, error traces and frustration in one pass
+    signals.update(_signal_matcher.scan(issue_title, issue_body))
     
     # Check for excessive punctuation (sign of frustration/inexperience)
     if issue_title:
-        punctuation_count = len([c for c in issue_title if c in "!?"])
+        punctuation_count = issue_title.count("!") + issue_title.count("?")
         signals["punctuation_excess"] = punctuation_count > 2
     else:
         signals["punctuation_excess"] = None
@@ -112,58 +205,81 @@ def extract_signals(issue: Dict[str, Any], profile_meta: Dict[str, Any]) -> Dict
     return signals
 
 
-def calculate_novice_score(signals: Dict[str, Any]) -> float:
+class ScoringWeights(BaseModel):
+    """Weights and cut-offs of the novice score; the defaults are the original constants."""
+    account_age_days_below: float = Field(default=365, description="Accounts younger than this (days) score")
+    account_age: float = 0.2
+    followers_below: float = Field(default=5, description="Fewer followers than this scores")
+    followers: float = 0.2
+    public_repos_below: float = Field(default=5, description="Fewer public repos than this scores")
+    public_repos: float = 0.1
+    keywords: float = Field(default=0.2, description="Any novice keyword in title or body")
+    no_code_blocks: float = Field(default=0.1, description="Body present and without code")
+    novice_labels: float = 0.1
+    novice_label_names: List[str] = ["question", "help wanted", "usage", "documentation", "beginner"]
+    short_body_below: int = Field(default=400, description="Bodies shorter than this (chars) score")
+    short_body: float = 0.1
+    punctuation_excess: float = Field(default=0.05, description="More than two !/? in the title")
+    threshold: float = Field(default=0.6, description="Minimum score for a lead to be selected")
+
+
+DEFAULT_SCORING_WEIGHTS = ScoringWeights()
+
+
+def calculate_novice_score(signals: Dict[str, Any], weights: Optional[ScoringWeights] = None) -> float:
     """
     Calculate a novice likelihood score from extracted signals.
     
     Args:
         signals: Dict of scoring signals from extract_signals()
+        weights: Scoring weights (default: DEFAULT_SCORING_WEIGHTS)
         
     Returns:
         Float score between 0.0 and 1.0 (higher = more likely to be novice)
         Threshold for selection should be >= 0.6 as specified
     """
+    w = weights or DEFAULT_SCORING_WEIGHTS
     score = 0.0
     
     # Account age scoring (+0.2 if < 1 year)
     account_age = signals.get("account_age_days")
-    if isinstance(account_age, (int, float)) and account_age < 365:
-        score += 0.2
+    if isinstance(account_age, (int, float)) and account_age < w.account_age_days_below:
+        score += w.account_age
     
     # Followers scoring (+0.2 if < 5 followers)
     followers = signals.get("followers")
-    if isinstance(followers, (int, float)) and followers < 5:
-        score += 0.2
+    if isinstance(followers, (int, float)) and followers < w.followers_below:
+        score += w.followers
     
     # Public repos scoring (+0.1 if < 5 repos)
     public_repos = signals.get("public_repos")
-    if isinstance(public_repos, (int, float)) and public_repos < 5:
-        score += 0.1
+    if isinstance(public_repos, (int, float)) and public_repos < w.public_repos_below:
+        score += w.public_repos
     
     # Keyword matching (+0.2 for novice keywords)
     keywords = signals.get("keywords") or []
     if len(keywords) > 0:
-        score += 0.2
+        score += w.keywords
     
     # Code blocks absence (+0.1 if no code blocks)
     has_code = signals.get("code_blocks_present")
     if has_code is False:  # Explicitly False (None means we couldn't determine)
-        score += 0.1
+        score += w.no_code_blocks
     
     # Labels indicating novice status (+0.1)
     labels = signals.get("labels") or []
-    novice_labels = {"question", "help wanted", "usage", "documentation", "beginner"}
+    novice_labels = set(w.novice_label_names)
     if any(label in novice_labels for label in labels):
-        score += 0.1
+        score += w.novice_labels
     
     # Issue body length (+0.1 if very short < 400 chars)
     body_length = signals.get("issue_body_length")
-    if isinstance(body_length, int) and body_length < 400:
-        score += 0.1
+    if isinstance(body_length, int) and body_length < w.short_body_below:
+        score += w.short_body
     
     # Excessive punctuation (+0.05 for frustration indicators)
     if signals.get("punctuation_excess"):
-        score += 0.05
+        score += w.punctuation_excess
     
     # Clamp to [0, 1] range
     return max(0.0, min(1.0, score))
@@ -186,32 +302,32 @@ def is_novice_prospect(signals: Dict[str, Any], threshold: float = 0.6) -> bool:
 
 def enrich_with_github_profile_data(issue: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Placeholder for enriching issue with GitHub profile data.
-    In a real implementation, this would make GitHub API calls to get:
-    - Account creation date
-    - Follower count  
-    - Public repository count
-    - Contribution activity
+    Profile metadata used for novice scoring.
     
-    For now, returns mock data for demonstration.
-    """
-    user_login = issue.get("user_login", "")
+    Reads the profile fields the GitHub API fetcher (profile_enrichment="api") stores on each
+    issue:
+    - account_age_days (derived from user_created_at when only the creation date is present)
+    - followers
+    - public_repos
     
-    # Mock profile data based on username patterns
-    # In production, this would be replaced with actual GitHub API calls
-    mock_profiles = {
-        "biouser123": {"account_age_days": 90, "followers": 2, "public_repos": 1},
-        "newbie_scientist": {"account_age_days": 180, "followers": 8, "public_repos": 3},
-        "confused_researcher": {"account_age_days": 45, "followers": 1, "public_repos": 0},
+    Missing values stay None so they do not contribute to the score.
+    """
+    account_age_days = issue.get("account_age_days")
+    created_at = issue.get("user_created_at")
+    if account_age_days is None and created_at:
+        try:
+            created = datetime.fromisoformat(str(created_at).replace("Z", "+00:00"))
+            if created.tzinfo is None:
+                created = created.replace(tzinfo=timezone.utc)
+            account_age_days = (datetime.now(timezone.utc) - created).days
+        except ValueError:
+            account_age_days = None
+    
+    return {
+        "account_age_days": account_age_days,
+        "followers": issue.get("followers"),
+        "public_repos": issue.get("public_repos"),
     }
-    
-    profile_data = mock_profiles.get(user_login, {
-        "account_age_days": None,
-        "followers": None, 
-        "public_repos": None,
-    })
-    
-    return profile_data
 
 
 def score_issue_for_outreach(issue: Dict[str, Any]) -> Dict[str, Any]:
@@ -225,7 +341,7 @@ def score_issue_for_outreach(issue: Dict[str, Any]) -> Dict[str, Any]:
         Issue dict enhanced with signals and novice_score
     """
     try:
-        # Get profile data (mock for now)
+        # Get profile data (filled by the GitHub API fetcher)
         profile_data = enrich_with_github_profile_data(issue)
         
         # Extract scoring signals
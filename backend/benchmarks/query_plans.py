@@ -0,0 +1,117 @@
+"""
+Query plans and latency of the hot list/webhook queries before and after ensure_indexes().
+
+Builds a SQLite database with the previous schema (tables without the secondary indexes),
+fills it with synthetic rows, then prints EXPLAIN QUERY PLAN and the median latency of each
+query, adds the indexes the way init_db does on an existing database, and repeats.
+
+Run from backend/:  python -m benchmarks.query_plans --rows 50000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+from sqlalchemy import insert, select, text
+
+from app.core.database import Base, create_database_engine, ensure_indexes
+from app.models.database import Dataset, OutreachRequest, Task
+
+# Indexes the schema had before the secondary ones (column-level index=True)
+PREVIOUS_INDEXES = {"ix_datasets_accession", "ix_geo_accession_cache_fetched_at", "ix_leads_issue_url", "ix_users_email"}
+
+
+def _queries(rows: int) -> Dict[str, Any]:
+    last = rows - 1  # webhook lookups for the newest outreach, the worst case for a scan
+    return {
+        "tasks by status": select(Task).where(Task.status == "running").order_by(Task.created_at.desc()).limit(20),
+        "tasks by user": select(Task).where(Task.user_email == "user7@lab.org").order_by(Task.created_at.desc()).limit(20),
+        "tasks latest": select(Task).order_by(Task.created_at.desc()).limit(20),
+        "outreach by status": select(OutreachRequest).where(OutreachRequest.status == "replied")
+        .order_by(OutreachRequest.created_at.desc()).limit(20),
+        "webhook by thread_id": select(OutreachRequest).where(OutreachRequest.thread_id == f"thread-{last}").limit(1),
+        "webhook by message_id": select(OutreachRequest).where(OutreachRequest.message_id == f"msg-{last}").limit(1),
+        "datasets by source+access": select(Dataset).where(Dataset.source == "PRIDE", Dataset.access_type == "request").limit(20),
+    }
+
+
+def _seed(engine, rows: int) -> None:
+    rng = random.Random(1)
+    start = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(Task), [
+            {"id": f"t{n}", "type": rng.choice(["search", "find_contact", "send_email"]),
+             "status": rng.choice(["pending", "running", "completed", "completed", "failed"]),
+             "user_email": f"user{rng.randrange(500)}@lab.org", "input_data": {"n": n},
+             "created_at": start + timedelta(seconds=n)}
+            for n in range(rows)
+        ])
+        conn.execute(insert(OutreachRequest), [
+            {"id": f"o{n}", "requester_email": "me@lab.org", "contact_email": f"pi{n}@lab.org",
+             "status": rng.choice(["draft", "sent", "delivered", "replied"]), "thread_id": f"thread-{n}",
+             "message_id": f"msg-{n}", "created_at": start + timedelta(seconds=n)}
+            for n in range(rows)
+        ])
+        conn.execute(insert(Dataset), [
+            {"id": f"d{n}", "source": rng.choice(["GEO", "PRIDE", "ENSEMBL", "INTERNAL"]), "title": f"Dataset {n}",
+             "access_type": rng.choice(["public", "request", "restricted"])}
+            for n in range(rows)
+        ])
+
+
+def _measure(engine, queries: Dict[str, Any], repeat: int) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    with engine.connect() as conn:
+        for name, query in queries.items():
+            sql = str(query.compile(engine, compile_kwargs={"literal_binds": True}))
+            plan = [row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                conn.execute(query).all()
+                timings.append(time.perf_counter() - started)
+            results[name] = {"plan": plan, "median_ms": round(statistics.median(timings) * 1000, 3)}
+    return results
+
+
+def main(argv: list | None = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description="Query plans before/after secondary indexes")
+    parser.add_argument("--rows", type=int, default=50000, help="Rows per table")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_database_engine(f"sqlite:///{os.path.join(tmp, 'plans.db')}")
+        # Previous schema: tables only
+        for table in Base.metadata.sorted_tables:
+            table.create(bind=engine)
+            for index in table.indexes:
+                if index.name not in PREVIOUS_INDEXES:
+                    index.drop(bind=engine)
+        _seed(engine, args.rows)
+
+        queries = _queries(args.rows)
+        before = _measure(engine, queries, args.repeat)
+        created = ensure_indexes(engine)
+        with engine.begin() as conn:
+            conn.execute(text("ANALYZE"))
+        after = _measure(engine, queries, args.repeat)
+        engine.dispose()
+
+    for name in queries:
+        print(f"{name}: {before[name]['median_ms']} ms -> {after[name]['median_ms']} ms")
+        print(f"  before: {'; '.join(before[name]['plan'])}")
+        print(f"  after:  {'; '.join(after[name]['plan'])}")
+    report = {"rows": args.rows, "indexes_created": created, "before": before, "after": after}
+    return report
+
+
+if __name__ == "__main__":
+    print(json.dumps(main()["indexes_created"]))
@@ -0,0 +1,128 @@
+"""
+Concurrent read/write throughput of the SQLite connection strategies.
+
+Writer threads insert tasks and update them inside short transactions (as background
+searches do) while reader threads page through the task list (as the API does). Each
+strategy runs against a fresh database file:
+
+  static    one shared connection, default journal (the previous setup)
+  rollback  connection per session, default journal, no PRAGMAs
+  wal       connection per session with the SQLITE_* PRAGMAs (WAL, synchronous=NORMAL, ...)
+
+Run from backend/:  python -m benchmarks.sqlite_concurrency --seconds 5 --readers 8 --writers 2
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import tempfile
+import threading
+import time
+import uuid
+from typing import Any, Dict, List
+
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base, create_database_engine
+from app.models import database as models
+
+STRATEGIES = {
+    "static": {"sqlite_pool": "static", "apply_pragmas": False},
+    "rollback": {"sqlite_pool": "queue", "apply_pragmas": False},
+    "wal": {"sqlite_pool": "queue", "apply_pragmas": True},
+}
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def run_strategy(name: str, seconds: float, readers: int, writers: int, seed_rows: int) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_database_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}", **STRATEGIES[name])
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+        with Session() as session:
+            session.add_all(models.Task(type="search", status="completed", input_data={"n": n}) for n in range(seed_rows))
+            session.commit()
+
+        stop = threading.Event()
+        lock = threading.Lock()
+        counts = {"reads": 0, "writes": 0, "errors": 0}
+        read_latencies: List[float] = []
+
+        def reader() -> None:
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    with Session() as session:
+                        session.scalars(select(models.Task).order_by(models.Task.created_at.desc()).limit(50)).all()
+                    with lock:
+                        counts["reads"] += 1
+                        read_latencies.append(time.perf_counter() - started)
+                except Exception:
+                    with lock:
+                        counts["errors"] += 1
+
+        def writer() -> None:
+            while not stop.is_set():
+                try:
+                    with Session() as session:
+                        task = models.Task(id=str(uuid.uuid4()), type="search", status="running", input_data={})
+                        session.add(task)
+                        session.flush()
+                        time.sleep(0.002)  # work done while the transaction is open
+                        task.status = "completed"
+                        session.commit()
+                    with lock:
+                        counts["writes"] += 1
+                except Exception:
+                    with lock:
+                        counts["errors"] += 1
+
+        threads = [threading.Thread(target=reader) for _ in range(readers)]
+        threads += [threading.Thread(target=writer) for _ in range(writers)]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        engine.dispose()
+
+    return {
+        "strategy": name,
+        "reads_per_second": round(counts["reads"] / seconds, 1),
+        "writes_per_second": round(counts["writes"] / seconds, 1),
+        "errors": counts["errors"],
+        "read_p50_ms": round(statistics.median(read_latencies) * 1000, 2) if read_latencies else None,
+        "read_p95_ms": round(_percentile(read_latencies, 0.95) * 1000, 2),
+    }
+
+
+def main(argv: list | None = None) -> List[Dict[str, Any]]:
+    parser = argparse.ArgumentParser(description="SQLite concurrent read/write benchmark")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seed-rows", type=int, default=2000)
+    parser.add_argument("--strategies", nargs="+", default=list(STRATEGIES), choices=list(STRATEGIES))
+    args = parser.parse_args(argv)
+    # The shared connection fails under concurrent sessions; errors are counted, not logged
+    logging.getLogger("sqlalchemy.pool").setLevel(logging.CRITICAL)
+
+    results = [run_strategy(name, args.seconds, args.readers, args.writers, args.seed_rows) for name in args.strategies]
+    for result in results:
+        print(json.dumps(result))
+    return results
+
+
+if __name__ == "__main__":
+    main()
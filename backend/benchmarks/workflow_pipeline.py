@@ -0,0 +1,122 @@
+"""
+Wall-clock time of the search workflow: the previous staged run versus the pipelined orchestrator.
+
+The agents are replaced with stand-ins that only sleep for a fixed latency, so the numbers
+show how much of the workflow overlaps, not agent quality. The staged baseline is the
+previous sequence: plan, then all searches, then one email at a time, then the summary.
+The pipelined run is AgentOrchestrator.execute_workflow running the planner's default plan,
+with searches started alongside planning and emails sent as each search returns,
+OUTREACH_CONCURRENCY at a time.
+
+Run from backend/:  python -m benchmarks.workflow_pipeline --sources 3 --requests-per-source 4
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+from app.config import settings
+from app.core import agent_orchestrator
+from app.core.agent_orchestrator import AgentOrchestrator
+from app.core.agents import DatasetCandidate
+from app.core.agents.email_agent import EmailResult
+from app.core.agents.planner_agent import create_workflow_plan
+from app.core.agents.summarizer_agent import ResearchSummary
+from app.models.schemas import SearchRequest
+
+SOURCES = ["GEO", "PRIDE", "ENSEMBL"]
+
+
+class _Agent:
+    def __init__(self, run):
+        self.run = run
+
+
+def _install_fakes(latency: Dict[str, float], requests_per_source: int) -> None:
+    async def plan(request):
+        await asyncio.sleep(latency["plan"])
+        return SimpleNamespace(output=await create_workflow_plan(request))
+
+    async def search(params):
+        # Later sources are slower, as real databases differ
+        await asyncio.sleep(latency["search"] * (1 + SOURCES.index(params.database)))
+        return [
+            DatasetCandidate(accession=f"{params.database}{n}", title=f"{params.database} {n}", access_type="request",
+                             contact_info={"name": "PI", "email": f"pi{n}@{params.database.lower()}.org"})
+            for n in range(requests_per_source)
+        ]
+
+    async def email(params):
+        await asyncio.sleep(latency["email"])
+        return SimpleNamespace(output=EmailResult(success=True, status="sent"))
+
+    async def summarize(summary_input):
+        await asyncio.sleep(latency["summary"])
+        return SimpleNamespace(output=ResearchSummary(executive_summary="", datasets_overview={}, outreach_status={},
+                                                      next_steps=[], export_ready=True, confidence_score=1.0))
+
+    async def no_provenance(*args, **kwargs):
+        return None
+
+    agent_orchestrator.planner_agent = _Agent(plan)
+    agent_orchestrator.run_database_search = search
+    agent_orchestrator.email_agent = _Agent(email)
+    agent_orchestrator.summarizer_agent = _Agent(summarize)
+    agent_orchestrator.log_provenance = no_provenance
+
+
+async def _staged(request: SearchRequest) -> int:
+    """The previous workflow shape, with hard barriers between stages."""
+    await agent_orchestrator.planner_agent.run(request)
+    results = await asyncio.gather(*[
+        agent_orchestrator.run_database_search(SimpleNamespace(database=source)) for source in request.sources
+    ])
+    outreach: List[Any] = []
+    for datasets in results:
+        for d in datasets:
+            outreach.append(await agent_orchestrator.email_agent.run(d))
+    await agent_orchestrator.summarizer_agent.run(None)
+    return len(outreach)
+
+
+async def _timed(coro) -> Dict[str, Any]:
+    started = time.perf_counter()
+    result = await coro
+    return {"seconds": round(time.perf_counter() - started, 3), "result": result}
+
+
+def main(argv: list | None = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description="Staged vs pipelined search workflow")
+    parser.add_argument("--sources", type=int, default=3, choices=range(1, len(SOURCES) + 1))
+    parser.add_argument("--requests-per-source", type=int, default=4, help="Request-only datasets per source")
+    parser.add_argument("--plan", type=float, default=0.5, help="Planner latency (s)")
+    parser.add_argument("--search", type=float, default=0.5, help="Fastest search latency (s)")
+    parser.add_argument("--email", type=float, default=0.3, help="Email latency (s)")
+    parser.add_argument("--summary", type=float, default=0.5, help="Summarizer latency (s)")
+    parser.add_argument("--concurrency", type=int, default=settings.OUTREACH_CONCURRENCY, help="OUTREACH_CONCURRENCY")
+    args = parser.parse_args(argv)
+
+    latency = {"plan": args.plan, "search": args.search, "email": args.email, "summary": args.summary}
+    _install_fakes(latency, args.requests_per_source)
+    settings.OUTREACH_CONCURRENCY = args.concurrency
+    request = SearchRequest(query="benchmark", sources=SOURCES[: args.sources], include_internal=False)
+
+    staged = asyncio.run(_timed(_staged(request)))
+    pipelined = asyncio.run(_timed(AgentOrchestrator().execute_workflow(request, "bench@lab.org")))
+    report = {
+        "emails": staged["result"],
+        "staged_seconds": staged["seconds"],
+        "pipelined_seconds": pipelined["seconds"],
+        "outreach_concurrency": args.concurrency,
+    }
+    print(f"staged {report['staged_seconds']} s -> pipelined {report['pipelined_seconds']} s "
+          f"({report['emails']} emails, concurrency {args.concurrency})")
+    return report
+
+
+if __name__ == "__main__":
+    print(json.dumps(main()))
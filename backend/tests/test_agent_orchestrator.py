@@ -0,0 +1,214 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import agent_orchestrator
+from app.core.agent_orchestrator import AgentOrchestrator
+from app.core.agents import DatasetCandidate, InternalContact
+from app.core.agents.email_agent import EmailResult
+from app.core.agents.planner_agent import WorkflowPlan, WorkflowStep, create_workflow_plan
+from app.core.agents.summarizer_agent import ResearchSummary
+from app.core.utils.query_cache import QueryCache
+from app.models.schemas import SearchRequest
+
+
+def _dataset(accession, access_type="public"):
+    contact = {"name": "PI", "email": f"{accession.lower()}@lab.org"} if access_type == "request" else None
+    return DatasetCandidate(accession=accession, title=f"Dataset {accession}", access_type=access_type, contact_info=contact)
+
+
+class _Agent:
+    def __init__(self, run):
+        self.run = run
+
+
+@pytest.fixture
+def fake_agents(monkeypatch):
+    """Replace the LLM agents with fakes; `calls` records the order agent calls started and ended in."""
+    fakes = SimpleNamespace(calls=[], sending=0, peak_sending=0)
+    calls = fakes.calls
+    found = fakes.found = {
+        "GEO": [_dataset("GSE1"), _dataset("GSE2", "request")],
+        "PRIDE": [_dataset("PXD3", "request")],
+    }
+
+    async def plan(request):
+        calls.append("plan")
+        return SimpleNamespace(output=await create_workflow_plan(request))
+
+    async def search(params):
+        calls.append(f"search:{params.database}")
+        await asyncio.sleep(0.01 if params.database == "GEO" else 0.05)
+        calls.append(f"found:{params.database}")
+        return list(found[params.database])
+
+    async def colleagues(params):
+        calls.append("colleagues")
+        return SimpleNamespace(output=[InternalContact(name="Ana", job_title="Scientist", linkedin_url="https://linkedin.com/in/ana",
+                                                               relevance_score=0.9, reason_for_contact="proteomics")])
+
+    async def email(params):
+        calls.append(f"email:{params.dataset_id}")
+        fakes.sending += 1
+        fakes.peak_sending = max(fakes.peak_sending, fakes.sending)
+        await asyncio.sleep(0.02)
+        fakes.sending -= 1
+        return SimpleNamespace(output=EmailResult(success=True, status="sent", message_id=params.dataset_id))
+
+    async def summarize(summary_input):
+        calls.append("summary")
+        return SimpleNamespace(output=ResearchSummary(
+            executive_summary=f"{len(summary_input.datasets_found)} datasets", datasets_overview={},
+            outreach_status={"sent": len(summary_input.outreach_sent)}, next_steps=[], export_ready=True,
+            confidence_score=0.5,
+        ))
+
+    async def no_provenance(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(agent_orchestrator, "planner_agent", _Agent(plan))
+    monkeypatch.setattr(agent_orchestrator, "run_database_search", search)
+    monkeypatch.setattr(agent_orchestrator, "colleagues_agent", _Agent(colleagues))
+    monkeypatch.setattr(agent_orchestrator, "email_agent", _Agent(email))
+    monkeypatch.setattr(agent_orchestrator, "summarizer_agent", _Agent(summarize))
+    monkeypatch.setattr(agent_orchestrator, "log_provenance", no_provenance)
+    step_cache = fakes.step_cache = QueryCache(max_entries=16, ttl=60, enabled=True)
+    monkeypatch.setattr(agent_orchestrator, "get_step_cache", lambda: step_cache)
+    return fakes
+
+
+@pytest.mark.asyncio
+async def test_workflow_reports_progress_events(fake_agents):
+    events = []
+    request = SearchRequest(query="lung cancer proteomics", sources=["GEO", "PRIDE"])
+    result = await AgentOrchestrator().execute_workflow(request, "me@lab.org", on_event=lambda e, d: events.append((e, d)))
+
+    names = [name for name, _ in events if not name.startswith("step_")]
+    assert names[0] == "plan_ready" and names[-1] == "summary_ready"
+    finished = [d for name, d in events if name == "step_finished"]
+    assert [d["action"] for d in finished][-1] == "summarize" and all(d["status"] == "completed" for d in finished)
+    # Each source reports as soon as its own search returns (GEO is faster)
+    sources = [d["source"] for name, d in events if name == "source_results"]
+    assert sources == ["GEO", "PRIDE"]
+    assert [d["dataset"]["accession"] for name, d in events if name == "dataset_found"] == ["GSE1", "GSE2", "PXD3"]
+    assert [d["count"] for name, d in events if name == "contacts_found"] == [1]
+    assert sorted(d["dataset_id"] for name, d in events if name == "outreach_sent") == ["GSE2", "PXD3"]
+    assert [d["summary"] for name, d in events if name == "summary_ready"] == [result["summary"]]
+
+
+@pytest.mark.asyncio
+async def test_failing_listener_does_not_break_the_workflow(fake_agents):
+    def listener(event, data):
+        raise RuntimeError("listener gone")
+
+    result = await AgentOrchestrator().execute_workflow(SearchRequest(query="q", include_internal=False), "", on_event=listener)
+    assert [d["accession"] for d in result["datasets"]] == ["GSE1", "GSE2"]
+
+
+@pytest.mark.asyncio
+async def test_outreach_starts_per_search_and_runs_concurrently(fake_agents, monkeypatch):
+    monkeypatch.setattr(agent_orchestrator.settings, "OUTREACH_CONCURRENCY", 2)
+    fake_agents.found["PRIDE"] += [_dataset(f"PXD{n}", "request") for n in range(4, 8)]
+    request = SearchRequest(query="q", sources=["GEO", "PRIDE"], include_internal=False)
+    result = await AgentOrchestrator().execute_workflow(request, "me@lab.org")
+
+    calls = fake_agents.calls
+    # GEO's request-only dataset is emailed while the PRIDE search is still running
+    assert calls.index("email:GSE2") < calls.index("found:PRIDE")
+    assert calls[-1] == "summary"
+    assert fake_agents.peak_sending == 2
+    assert len(result["outreach"]) == 6 and all(o["status"] == "sent" for o in result["outreach"])
+    assert [d["accession"] for d in result["datasets"]][:3] == ["GSE1", "GSE2", "PXD3"]
+
+
+@pytest.mark.asyncio
+async def test_failed_planning_cancels_running_searches(fake_agents, monkeypatch):
+    async def failing_plan(request):
+        await asyncio.sleep(0.005)
+        raise RuntimeError("planner down")
+
+    monkeypatch.setattr(agent_orchestrator, "planner_agent", _Agent(failing_plan))
+    with pytest.raises(RuntimeError):
+        await AgentOrchestrator().execute_workflow(SearchRequest(query="q", sources=["PRIDE"]), "")
+    await asyncio.sleep(0.1)
+    assert "found:PRIDE" not in fake_agents.calls
+
+
+def _plan(request, *steps):
+    return SimpleNamespace(output=WorkflowPlan(research_question=request.query, confirmed_requirements={},
+                                               steps=list(steps), estimated_duration_minutes=1))
+
+
+@pytest.mark.asyncio
+async def test_the_plan_shapes_execution(fake_agents, monkeypatch):
+    async def plan_without_outreach(request):
+        return _plan(
+            request,
+            WorkflowStep(step_number=1, action="search_public", description="", parameters={}),
+            WorkflowStep(step_number=2, action="summarize", description="", parameters={}, dependencies=[1]),
+        )
+
+    monkeypatch.setattr(agent_orchestrator, "planner_agent", _Agent(plan_without_outreach))
+    result = await AgentOrchestrator().execute_workflow(SearchRequest(query="q", sources=["GEO"]), "me@lab.org")
+    assert result["outreach"] == [] and not any(c.startswith(("email:", "colleagues")) for c in fake_agents.calls)
+    assert [s["action"] for s in result["steps"]] == ["search_public", "summarize"]
+
+    async def cyclic_plan(request):
+        return _plan(
+            request,
+            WorkflowStep(step_number=1, action="search_public", description="", parameters={}, dependencies=[2]),
+            WorkflowStep(step_number=2, action="summarize", description="", parameters={}, dependencies=[1]),
+        )
+
+    # An unusable plan falls back to the default one
+    monkeypatch.setattr(agent_orchestrator, "planner_agent", _Agent(cyclic_plan))
+    result = await AgentOrchestrator().execute_workflow(SearchRequest(query="q", sources=["GEO"], include_internal=False), "")
+    assert [s["action"] for s in result["steps"]] == ["search_public", "evaluate_results", "send_outreach", "summarize"]
+    assert [o["message_id"] for o in result["outreach"]] == ["GSE2"]
+
+
+@pytest.mark.asyncio
+async def test_outreach_behind_another_step_is_not_started_early(fake_agents, monkeypatch):
+    async def plan_with_review(request):
+        return _plan(
+            request,
+            WorkflowStep(step_number=1, action="search_public", description="", parameters={"databases": ["GEO", "PRIDE"]}),
+            WorkflowStep(step_number=2, action="evaluate_results", description="", parameters={}, dependencies=[1]),
+            WorkflowStep(step_number=3, action="send_outreach", description="", parameters={}, dependencies=[2]),
+        )
+
+    monkeypatch.setattr(agent_orchestrator, "planner_agent", _Agent(plan_with_review))
+    request = SearchRequest(query="q", sources=["GEO", "PRIDE"], include_internal=False)
+    result = await AgentOrchestrator().execute_workflow(request, "me@lab.org")
+
+    calls = fake_agents.calls
+    assert calls.index("found:PRIDE") < calls.index("email:GSE2")
+    assert sorted(o["message_id"] for o in result["outreach"]) == ["GSE2", "PXD3"]
+
+
+@pytest.mark.asyncio
+async def test_colleague_search_is_cached_and_timed_out_steps_do_not_block_the_summary(fake_agents, monkeypatch):
+    request = SearchRequest(query="q", sources=["GEO"])
+    first = await AgentOrchestrator().execute_workflow(request, "")
+    second = await AgentOrchestrator().execute_workflow(request, "")
+    assert fake_agents.calls.count("colleagues") == 1
+    assert second["contacts"] == first["contacts"] and len(second["contacts"]) == 1
+    assert [s["cached"] for s in second["steps"] if s["action"] == "find_colleagues"] == [True]
+
+    async def slow_email(params):
+        await asyncio.sleep(5)
+
+    async def plan_with_timeout(request):
+        plan = await create_workflow_plan(request)
+        for step in plan.steps:
+            if step.action == "send_outreach":
+                step.parameters["timeout_seconds"] = 0.05
+        return SimpleNamespace(output=plan)
+
+    monkeypatch.setattr(agent_orchestrator, "email_agent", _Agent(slow_email))
+    monkeypatch.setattr(agent_orchestrator, "planner_agent", _Agent(plan_with_timeout))
+    result = await asyncio.wait_for(AgentOrchestrator().execute_workflow(request, "me@lab.org"), timeout=2)
+    statuses = {s["action"]: s["status"] for s in result["steps"]}
+    assert statuses["send_outreach"] == "timed_out" and statuses["summarize"] == "completed"
+    assert [(o["dataset_id"], o["status"]) for o in result["outreach"]] == [("GSE2", "failed")]
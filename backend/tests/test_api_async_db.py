@@ -0,0 +1,124 @@
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+pytest.importorskip("aiosqlite")
+
+from app.core import database
+from app.core.database import get_async_db
+from app.main import app
+from app.models.database import OutreachRequest, Task
+
+
+@pytest_asyncio.fixture
+async def client(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(database.Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override():
+        async with factory() as session:
+            yield session
+
+    app.dependency_overrides[get_async_db] = override
+    async with factory() as session:
+        session.add_all([
+            Task(id=f"t{n}", type="search", status="completed" if n % 2 else "running",
+                 input_data={"n": n}, created_at=datetime(2025, 1, 1, 0, n))
+            for n in range(5)
+        ])
+        session.add(OutreachRequest(id="o1", dataset_id="d1", requester_email="me@lab.org", requester_name="Me",
+                                    contact_email="pi@lab.org", status="sent", thread_id="thr-1"))
+        await session.commit()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        http.session_factory = factory
+        yield http
+    app.dependency_overrides.pop(get_async_db, None)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_task_routes_use_async_session(client):
+    listed = (await client.get("/api/v1/tasks", params={"status": "completed"})).json()
+    assert [t["id"] for t in listed] == ["t3", "t1"]
+
+    polled = await asyncio.gather(*(client.get("/api/v1/search/t0") for _ in range(10)))
+    assert all(r.status_code == 200 and r.json()["status"] == "running" for r in polled)
+
+    cancelled = await client.delete("/api/v1/tasks/t0")
+    assert cancelled.status_code == 200
+    task = (await client.get("/api/v1/tasks/t0")).json()
+    assert task["status"] == "cancelled" and task["completed_at"] is not None
+    assert (await client.get("/api/v1/tasks/missing")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_outreach_status_and_webhook_routes(client):
+    updated = await client.put("/api/v1/outreach/o1/status", params={"status": "replied"})
+    assert updated.status_code == 200
+
+    delivered = await client.post("/api/v1/webhooks/agentmail/webhook",
+                                  json={"event_type": "message.delivered", "thread_id": "thr-1"})
+    assert delivered.json() == {"status": "ok", "event_type": "message.delivered"}
+
+    async with client.session_factory() as session:
+        outreach = await session.get(OutreachRequest, "o1")
+        assert outreach.status == "delivered" and outreach.replied_at is not None
+
+
+@pytest.mark.asyncio
+async def test_task_list_cursor_pages_cover_offset_order(client):
+    from sqlalchemy import text
+
+    async with client.session_factory() as session:
+        # Rows written with CURRENT_TIMESTAMP-style text, tying with the seeded ones
+        for n in range(5, 9):
+            await session.execute(text(
+                "INSERT INTO tasks (id, type, status, created_at) VALUES (:id, 'search', 'pending', :created_at)"
+            ), {"id": f"t{n}", "created_at": f"2025-01-01 00:0{n % 3}:00"})
+        await session.commit()
+
+    everything = [t["id"] for t in (await client.get("/api/v1/tasks", params={"limit": 100})).json()]
+    assert len(everything) == 9
+
+    paged, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = await client.get("/api/v1/tasks", params=params)
+        paged += [t["id"] for t in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert paged == everything
+
+    offset_page = await client.get("/api/v1/tasks", params={"skip": 2, "limit": 2})
+    assert [t["id"] for t in offset_page.json()] == everything[2:4]
+    assert (await client.get("/api/v1/tasks", params={"cursor": "not-a-cursor"})).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_task_list_returns_summaries_unless_payloads_are_included(client):
+    from sqlalchemy import event
+
+    statements = []
+    engine = client.session_factory.kw["bind"].sync_engine
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        summary = (await client.get("/api/v1/tasks", params={"limit": 1})).json()
+        full = (await client.get("/api/v1/tasks", params={"limit": 1, "include": "input_data"})).json()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert summary[0]["input_data"] is None and summary[0]["output_data"] is None
+    assert "input_data" not in statements[0] and "output_data" not in statements[0]
+    assert full[0]["input_data"] == {"n": 4} and full[0]["output_data"] is None
+    assert (await client.get("/api/v1/tasks", params={"include": "plan"})).status_code == 400
@@ -0,0 +1,146 @@
+import pytest
+
+from app.core.scrapers import browser_pool
+from app.core.scrapers.browser_pool import BrowserPool
+
+
+class FakeBrowser:
+    """Stands in for browser_use.Browser so the pool can be exercised without Chromium."""
+
+    launched = 0
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.killed = False
+        self._cdp_client_root = None
+
+    async def start(self):
+        FakeBrowser.launched += 1
+        self._cdp_client_root = object()
+
+    async def kill(self):
+        self.killed = True
+        self._cdp_client_root = None
+
+    async def get_current_page_url(self):
+        return "about:blank"
+
+
+@pytest.fixture(autouse=True)
+def fake_browser(monkeypatch):
+    FakeBrowser.launched = 0
+    monkeypatch.setattr(browser_pool, "Browser", FakeBrowser)
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_warm_browser_and_recycles_after_max_uses():
+    pool = BrowserPool(size=1, max_uses=2, idle_timeout=0, profile_root="/tmp/pool")
+
+    async with pool.lease("geo") as b1:
+        assert b1.kwargs["keep_alive"] is True
+        assert b1.kwargs["user_data_dir"] == "/tmp/pool/temp-profile-geo"
+    async with pool.lease("geo") as b2:
+        assert b2 is b1
+    # Second lease hit max_uses, so the browser was retired on release
+    assert b1.killed
+    async with pool.lease("geo") as b3:
+        assert b3 is not b1
+    assert FakeBrowser.launched == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_replaces_unhealthy_browser_and_uses_per_slot_profiles():
+    pool = BrowserPool(size=2, max_uses=10, idle_timeout=0, profile_root="/tmp/pool")
+
+    first = await pool.acquire("github")
+    second = await pool.acquire("github")
+    assert first.browser.kwargs["user_data_dir"].endswith("temp-profile-github")
+    assert second.browser.kwargs["user_data_dir"].endswith("temp-profile-github-1")
+    await pool.release(first)
+    await pool.release(second)
+
+    # Simulate a crashed Chromium: the next lease must get a fresh, started browser
+    first.browser._cdp_client_root = None
+    again = await pool.acquire("github")
+    assert again.browser is not first.browser
+    assert again.started
+    await pool.release(again)
+
+    await pool.close()
+    assert pool.stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_browser_released_by_a_cancelled_task_is_killed():
+    import asyncio
+
+    pool = BrowserPool(size=1, max_uses=10, idle_timeout=0, profile_root="/tmp/pool")
+    leased = asyncio.Event()
+    browsers = []
+
+    async def scrape():
+        async with pool.lease("geo") as browser:
+            browsers.append(browser)
+            leased.set()
+            await asyncio.sleep(60)
+
+    scraping = asyncio.create_task(scrape())
+    await leased.wait()
+    scraping.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await scraping
+
+    assert browsers[0].killed
+    # The slot is free again and gets a fresh browser
+    async with pool.lease("geo") as browser:
+        assert browser is not browsers[0]
+
+
+@pytest.mark.asyncio
+async def test_idle_browsers_are_evicted_in_the_background():
+    import asyncio
+
+    pool = BrowserPool(size=1, max_uses=10, idle_timeout=0.05, profile_root="/tmp/pool")
+    eviction = pool.start_idle_eviction(interval=0.02)
+    assert pool.start_idle_eviction() is eviction
+
+    async with pool.lease("geo") as browser:
+        await asyncio.sleep(0.15)
+        assert not browser.killed  # leased browsers are never evicted
+    await asyncio.sleep(0.15)
+    assert browser.killed and pool.stats()["geo"]["open"] == 0
+
+    await pool.close()
+    assert eviction.cancelled()
+    assert BrowserPool(idle_timeout=0).start_idle_eviction() is None
+
+
+@pytest.mark.asyncio
+async def test_a_second_cancel_during_release_does_not_leak_the_slot(monkeypatch):
+    import asyncio
+
+    killing = asyncio.Event()
+
+    async def slow_kill(self):
+        killing.set()
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(FakeBrowser, "kill", slow_kill)
+    pool = BrowserPool(size=1, max_uses=10, idle_timeout=0, profile_root="/tmp/pool")
+    leased = asyncio.Event()
+
+    async def scrape():
+        async with pool.lease("geo"):
+            leased.set()
+            await asyncio.sleep(60)
+
+    scraping = asyncio.create_task(scrape())
+    await leased.wait()
+    scraping.cancel()
+    await killing.wait()
+    scraping.cancel()  # e.g. a timeout firing while the cancelled scrape releases its browser
+    with pytest.raises(asyncio.CancelledError):
+        await scraping
+
+    entry = await asyncio.wait_for(pool.acquire("geo"), timeout=1)
+    await pool.release(entry, discard=False)
@@ -0,0 +1,63 @@
+import threading
+
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from app.core.database import create_database_engine
+
+
+def test_sqlite_file_engine_pools_connections_and_applies_pragmas(tmp_path):
+    engine = create_database_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    assert isinstance(engine.pool, QueuePool)
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert conn.execute(text("PRAGMA cache_size")).scalar() == -64000
+
+    assert isinstance(create_database_engine("sqlite://").pool, StaticPool)
+    assert isinstance(create_database_engine(f"sqlite:///{tmp_path / 'b.db'}", sqlite_pool="static").pool, StaticPool)
+
+
+def test_readers_are_not_blocked_by_an_open_write_transaction(tmp_path):
+    engine = create_database_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (n INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+
+    with engine.connect() as writer:
+        writer.execute(text("BEGIN EXCLUSIVE"))
+        writer.execute(text("INSERT INTO t VALUES (2)"))
+        writer.execute(text("DELETE FROM t WHERE n = 1"))
+
+        seen = []
+
+        def read():
+            with engine.connect() as conn:
+                seen.append(conn.execute(text("SELECT n FROM t")).scalars().all())
+
+        # Under the rollback journal an exclusive lock blocks readers until busy_timeout
+        reader = threading.Thread(target=read)
+        reader.start()
+        reader.join(timeout=2)
+        assert seen == [[1]]  # last committed snapshot, read while the writer holds its lock
+        writer.execute(text("COMMIT"))
+
+
+def test_ensure_indexes_migrates_existing_tables(tmp_path):
+    from app.core.database import ensure_indexes
+    from app.models.database import OutreachRequest
+
+    engine = create_database_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    # A database created before the secondary indexes existed
+    OutreachRequest.__table__.create(bind=engine)
+    for index in OutreachRequest.__table__.indexes:
+        index.drop(bind=engine)
+
+    created = ensure_indexes(engine)
+    assert "ix_outreach_requests_thread_id" in created
+    assert ensure_indexes(engine) == []
+
+    with engine.connect() as conn:
+        plan = conn.execute(text("EXPLAIN QUERY PLAN SELECT * FROM outreach_requests WHERE thread_id = 'x'")).all()
+    assert "ix_outreach_requests_thread_id" in plan[0][-1]
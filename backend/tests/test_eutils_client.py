@@ -0,0 +1,136 @@
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.core.integrations.ncbi_eutils import EUtilsGEOClient, parse_soft_header
+
+
+DOCS = {
+    "200123456": {
+        "uid": "200123456",
+        "accession": "GSE123456",
+        "title": "Single-cell RNA-seq of NSCLC tumors",
+        "summary": "Tumor and adjacent normal tissue profiled before and after anti-PD-1.",
+        "taxon": "Homo sapiens",
+        "gdstype": "Expression profiling by high throughput sequencing",
+        "n_samples": 48,
+        "pubmedids": ["34567890"],
+        "ftplink": "ftp://ftp.ncbi.nlm.nih.gov/geo/series/GSE123nnn/GSE123456/",
+    },
+    "200654321": {
+        "uid": "200654321",
+        "accession": "GSE654321",
+        "title": "Proteomics of TNBC",
+        "summary": "",
+        "taxon": "Homo sapiens",
+        "gdstype": "Protein profiling by mass spec; Other",
+        "n_samples": "12",
+        "pubmedids": [],
+        "ftplink": "",
+    },
+}
+
+SOFT = {
+    "GSE123456": """^SERIES = GSE123456
+!Series_title = Single-cell RNA-seq of NSCLC tumors
+!Series_contact_name = Jane,,Doe
+!Series_contact_email = jane.doe@lab.org
+!Series_supplementary_file = ftp://ftp.ncbi.nlm.nih.gov/geo/series/GSE123nnn/GSE123456/suppl/counts.tar
+!Series_sample_id = GSM1
+!Series_sample_id = GSM2
+""",
+    "GSE654321": """^SERIES = GSE654321
+!Series_contact_name = Ali,B.,Khan
+!Series_contact_email = ali@uni.edu
+!Series_supplementary_file = NONE
+""",
+}
+
+
+@pytest_asyncio.fixture
+async def eutils_server():
+    calls = []
+
+    async def esearch(request: web.Request) -> web.Response:
+        calls.append(("esearch", dict(request.query)))
+        return web.json_response(
+            {
+                "esearchresult": {
+                    "count": "2",
+                    "idlist": list(DOCS),
+                    "webenv": "MCID_test",
+                    "querykey": "1",
+                }
+            }
+        )
+
+    async def esummary(request: web.Request) -> web.Response:
+        calls.append(("esummary", dict(request.query)))
+        start = int(request.query.get("retstart", 0))
+        size = int(request.query.get("retmax", 200))
+        uids = list(DOCS)[start:start + size]
+        result = {"uids": uids}
+        result.update({uid: DOCS[uid] for uid in uids})
+        return web.json_response({"result": result})
+
+    async def acc(request: web.Request) -> web.Response:
+        calls.append(("acc", dict(request.query)))
+        text = SOFT.get(request.query.get("acc", ""))
+        if text is None:
+            return web.Response(status=404)
+        return web.Response(text=text)
+
+    app = web.Application()
+    app.router.add_get("/acc.cgi", acc)
+    app.router.add_get("/esearch.fcgi", esearch)
+    app.router.add_get("/esummary.fcgi", esummary)
+    server = TestServer(app)
+    await server.start_server()
+    server.calls = calls
+    yield server
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_eutils_search_maps_esummary_to_geo_datasets(eutils_server):
+    base = str(eutils_server.make_url(""))
+    client = EUtilsGEOClient(base_url=base, geo_base_url=base, batch_size=1, min_interval=0)
+    try:
+        results = await client.search_datasets("NSCLC scRNA-seq", max_results=5)
+    finally:
+        await client.close()
+
+    assert [r["accession"] for r in results] == ["GSE123456", "GSE654321"]
+    first, second = results
+    assert first["description"].startswith("Tumor and adjacent")
+    assert first["organism"] == "Homo sapiens"
+    assert first["sample_size"] == 48
+    assert first["pubmed_id"] == "34567890"
+    assert first["publication_url"] == "https://pubmed.ncbi.nlm.nih.gov/34567890/"
+    assert first["link"].endswith("acc.cgi?acc=GSE123456")
+    assert second["modalities"] == ["Protein profiling by mass spec", "Other"]
+    assert second["sample_size"] == 12
+    assert second["download_url"] is None
+
+    # Contacts come from the SOFT headers; esummary values are never overwritten
+    assert first["contact_email"] == "jane.doe@lab.org"
+    assert first["contact_name"] == "Jane Doe"
+    assert first["download_url"].startswith("ftp://ftp.ncbi.nlm.nih.gov/geo/series/GSE123nnn/GSE123456/")
+    assert first["sample_size"] == 48
+    assert second["contact_name"] == "Ali B. Khan"
+
+    # One esearch using the history server, esummary paged by batch_size, then one SOFT fetch per series
+    kinds = [kind for kind, _ in eutils_server.calls]
+    assert kinds[:3] == ["esearch", "esummary", "esummary"]
+    assert sorted(kinds[3:]) == ["acc", "acc"]
+    assert eutils_server.calls[0][1]["usehistory"] == "y"
+    assert eutils_server.calls[1][1]["WebEnv"] == "MCID_test"
+
+
+def test_parse_soft_header_counts_samples_and_skips_missing_files():
+    header = parse_soft_header(SOFT["GSE123456"] + "!Series_pubmed_id = 111\n")
+    assert header["sample_size"] == 2
+    assert header["pubmed_id"] == "111"
+    assert header["publication_url"] == "https://pubmed.ncbi.nlm.nih.gov/111/"
+    assert parse_soft_header(SOFT["GSE654321"])["download_url"] is None
@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+pytest.importorskip("aiosqlite")
+
+from app.core.integrations.ncbi_eutils import EUtilsGEOClient
+from app.core.scrapers.geo_cache import GEOMetadataCache
+from app.core.scrapers.geo_scraper import GEOScraper
+from app.models.database import GEOAccessionCache
+
+
+@pytest_asyncio.fixture
+async def cache(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'geo.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(GEOAccessionCache.__table__.create)
+    yield GEOMetadataCache(ttl=60, stale_ttl=600, session_factory=async_sessionmaker(engine), enabled=True)
+    await engine.dispose()
+
+
+async def _age(cache, accession, seconds):
+    async with cache.session_factory() as session:
+        row = await session.get(GEOAccessionCache, accession)
+        row.fetched_at = datetime.utcnow() - timedelta(seconds=seconds)
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_cache_fresh_stale_and_expired(cache):
+    await cache.put_many([
+        {"accession": "GSE1", "title": "A", "contact_email": "a@lab.org"},
+        {"accession": "GSE2", "title": "B"},
+        {"accession": "GSE3", "title": "C"},
+    ])
+    await _age(cache, "GSE2", 120)    # past TTL, inside the stale window
+    await _age(cache, "GSE3", 1000)   # past TTL + stale window
+
+    hits = await cache.get_many(["GSE1", "GSE2", "GSE3", "GSE4"])
+    assert set(hits) == {"GSE1", "GSE2"}
+    assert hits["GSE1"].fresh and hits["GSE1"].data["contact_email"] == "a@lab.org"
+    assert not hits["GSE2"].fresh
+
+    # Upserts keep previously cached values the new record lacks
+    await cache.put_many([{"accession": "GSE1", "title": "A2", "contact_email": None}])
+    entry = await cache.get("GSE1")
+    assert entry.data["title"] == "A2"
+    assert entry.data["contact_email"] == "a@lab.org"
+
+
+@pytest.mark.asyncio
+async def test_needs_enrichment_consults_cache(cache):
+    await cache.put_many([
+        {"accession": "GSE1", "contact_email": "a@lab.org", "download_url": "ftp://geo/GSE1"},
+        {"accession": "GSE2", "contact_email": "b@lab.org", "download_url": None},
+    ])
+
+    scraper = GEOScraper(headless=True)
+    scraper.cache = cache
+    scraper._cached = await cache.get_many(["GSE1", "GSE2"])
+
+    cached_ds = {"accession": "GSE1", "title": "A", "contact_email": None}
+    assert scraper._needs_enrichment(cached_ds) is False
+    assert cached_ds["contact_email"] == "a@lab.org"
+    # A cache hit still missing fields is enriched further
+    partial_ds = {"accession": "GSE2", "contact_email": None}
+    assert scraper._needs_enrichment(partial_ds) is True and partial_ds["contact_email"] == "b@lab.org"
+    assert scraper._needs_enrichment({"accession": "GSE9", "contact_email": None}) is True
+
+
+@pytest.mark.asyncio
+async def test_failed_soft_fetches_are_not_cached(cache):
+    async def fetch_soft_headers(accessions):
+        # GSE2's fetch failed, so it is missing from the result
+        return {"GSE1": {"contact_email": "a@lab.org"}}
+
+    client = EUtilsGEOClient(cache=cache)
+    client.fetch_soft_headers = fetch_soft_headers
+    datasets = [{"accession": "GSE1", "title": "A"}, {"accession": "GSE2", "title": "B"}]
+    await client._enrich_from_soft(datasets)
+
+    assert datasets[0]["contact_email"] == "a@lab.org"
+    assert set(await cache.get_many(["GSE1", "GSE2"])) == {"GSE1"}
@@ -0,0 +1,107 @@
+import json
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.core.integrations.github_api import GitHubAPIClient
+from app.utils.scoring import enrich_with_github_profile_data
+
+FIXTURES = Path(__file__).parent / "fixtures" / "github"
+
+
+def _fixture(name):
+    return json.loads((FIXTURES / name).read_text())
+
+
+@pytest_asyncio.fixture
+async def github_server():
+    calls = []
+
+    async def issues(request: web.Request) -> web.Response:
+        page = request.query.get("page", "1")
+        calls.append(("issues", page, request.headers.get("If-None-Match")))
+        etag = f'W/"issues-{page}"'
+        headers = {"ETag": etag, "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4990", "X-RateLimit-Reset": "0"}
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers=headers)
+        if page == "1":
+            next_url = str(request.url.with_query({"page": "2", "per_page": request.query["per_page"]}))
+            headers["Link"] = f'<{next_url}>; rel="next"'
+            return web.json_response(_fixture("issues_page1.json"), headers=headers)
+        return web.json_response(_fixture("issues_page2.json"), headers=headers)
+
+    async def graphql(request: web.Request) -> web.Response:
+        body = await request.json()
+        calls.append(("graphql", body["query"], request.headers.get("Authorization")))
+        return web.json_response(_fixture("graphql_users.json"))
+
+    app = web.Application()
+    app.router.add_get("/repos/scverse/scanpy/issues", issues)
+    app.router.add_post("/graphql", graphql)
+    server = TestServer(app)
+    await server.start_server()
+    server.calls = calls
+    yield server
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_list_issues_paginates_skips_prs_and_uses_etags(github_server):
+    client = GitHubAPIClient(token="t", api_url=str(github_server.make_url("")).rstrip("/"))
+    try:
+        issues = await client.list_issues("scverse/scanpy", max_issues=5)
+        assert [i["issue_number"] for i in issues] == [3301, 3298]
+        assert issues[0]["issue_labels"] == ["question", "io"]
+        assert issues[0]["profile_url"] == "https://github.com/cellnovice"
+        assert issues[1]["issue_body"] == ""
+        assert client.rate_limit["remaining"] == 4990
+
+        # Second run revalidates with If-None-Match and is served from the ETag cache
+        again = await client.list_issues("scverse/scanpy", max_issues=5)
+        assert again == issues
+        conditional = [c for c in github_server.calls if c[0] == "issues" and c[2]]
+        assert len(conditional) == 2
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_etag_cache_keeps_only_the_most_recent_responses(github_server):
+    client = GitHubAPIClient(token="t", api_url=str(github_server.make_url("")).rstrip("/"), etag_cache_size=1)
+    try:
+        for _ in range(2):
+            await client.list_issues("scverse/scanpy", max_issues=5)
+    finally:
+        await client.close()
+
+    # Each page evicts the other, so no request can be revalidated
+    assert not [c for c in github_server.calls if c[0] == "issues" and c[2]]
+    assert client._etags.evictions == 3
+
+
+@pytest.mark.asyncio
+async def test_graphql_profile_batch_feeds_scoring(github_server):
+    client = GitHubAPIClient(token="t", api_url=str(github_server.make_url("")).rstrip("/"))
+    try:
+        profiles = await client.fetch_user_profiles(["cellnovice", "labtech42", "cellnovice"])
+    finally:
+        await client.close()
+
+    # One query for both users, aliased u0/u1
+    graphql_calls = [c for c in github_server.calls if c[0] == "graphql"]
+    assert len(graphql_calls) == 1
+    assert 'u1: user(login: "labtech42")' in graphql_calls[0][1]
+    assert graphql_calls[0][2] == "Bearer t"
+
+    assert set(profiles) == {"cellnovice"}
+    profile = profiles["cellnovice"]
+    assert profile["email"] == "cellnovice@uni.example.edu"
+    assert profile["website"] is None
+    assert profile["followers"] == 1 and profile["public_repos"] == 2
+
+    meta = enrich_with_github_profile_data({"user_created_at": profile["user_created_at"], "followers": 1, "public_repos": 2})
+    assert meta["account_age_days"] == profile["account_age_days"] > 0
+    assert meta["followers"] == 1 and meta["public_repos"] == 2
@@ -0,0 +1,298 @@
+import asyncio
+import random
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+pytest.importorskip("aiosqlite")
+
+from app.core import database
+from app.core.agents import github_leads_agent
+from app.models.database import GitHubSyncState, Lead
+
+
+class FakeScraper:
+    """Returns canned issues (oldest change first) with a random delay so repos finish out of order."""
+
+    total = None  # issues present upstream per repo (defaults to max_issues)
+    calls = []
+
+    def __init__(self, headless=True):
+        pass
+
+    async def fetch_issue_list(self, repo, max_issues=25, profile_enrichment="browser", since=None):
+        FakeScraper.calls.append((repo, since))
+        await asyncio.sleep(random.uniform(0, 0.02))
+        return [
+            {
+                "issue_number": n,
+                "issue_title": f"{repo} issue {n}",
+                "issue_url": f"https://github.com/{repo}/issues/{n}",
+                "issue_updated_at": f"2025-05-{n:02d}T00:00:00Z",
+                "user_login": f"user{n}",
+                "email": f"user{n}@example.org" if n % 2 else None,
+            }
+            for n in range(1, (FakeScraper.total or max_issues) + 1)
+            if since is None or f"2025-05-{n:02d}T00:00:00Z" >= since
+        ][:max_issues]
+
+
+async def noop_provenance(**kwargs):
+    return None
+
+
+@pytest_asyncio.fixture
+async def lead_db(monkeypatch, tmp_path):
+    """Sync and async sessions on one file database; returns the sync engine."""
+    url = f"sqlite:///{tmp_path / 'leads.db'}"
+    engine = create_engine(url)
+    database.Base.metadata.create_all(bind=engine, tables=[Lead.__table__, GitHubSyncState.__table__])
+    async_engine = create_async_engine(database.async_database_url(url))
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=engine))
+    monkeypatch.setattr(database, "get_async_session_factory", lambda: async_sessionmaker(async_engine, expire_on_commit=False))
+    FakeScraper.total = None
+    FakeScraper.calls = []
+    yield engine
+    await async_engine.dispose()
+    engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_prospecting_runs_concurrently_and_merges_deterministically(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def fake_qualify(issue, repo, max_retries=2):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(random.uniform(0, 0.01))
+        in_flight -= 1
+        return {"should_contact": True, "reason": "test", "priority": "high", "confidence": 0.9}
+
+    monkeypatch.setattr(github_leads_agent, "GitHubIssuesScraper", FakeScraper)
+    monkeypatch.setattr(github_leads_agent, "_qualify_lead_with_ai", fake_qualify)
+    monkeypatch.setattr(github_leads_agent, "log_provenance", noop_provenance)
+
+    repos = ["org/a", "org/b", "org/c"]
+    leads = await github_leads_agent.prospect_github_issues(
+        target_repos=repos,
+        max_issues_per_repo=4,
+        require_email=True,
+        persist_to_db=False,
+        repo_concurrency=3,
+        llm_concurrency=2,
+        incremental=False,
+        qualification_batch_size=1,
+    )
+
+    assert [lead["issue_url"] for lead in leads] == [
+        f"https://github.com/{repo}/issues/{n}" for repo in repos for n in (1, 3)
+    ]
+    assert all(lead["repo"] in repos for lead in leads)
+    assert 1 < peak <= 2
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_resumes_from_high_water_mark(monkeypatch, lead_db):
+    qualified = []
+
+    async def fake_qualify(issue, repo, max_retries=2):
+        qualified.append(issue["issue_url"])
+        return {"should_contact": True, "reason": "test", "priority": "high", "confidence": 0.9}
+
+    monkeypatch.setattr(github_leads_agent, "GitHubIssuesScraper", FakeScraper)
+    monkeypatch.setattr(github_leads_agent, "_qualify_lead_with_ai", fake_qualify)
+    monkeypatch.setattr(github_leads_agent, "log_provenance", noop_provenance)
+
+    FakeScraper.total = 3
+    first = await github_leads_agent.prospect_github_issues(
+        target_repos=["org/a"], max_issues_per_repo=5, require_email=False, persist_to_db=True,
+        qualification_batch_size=1,
+    )
+    assert len(first) == 3 and len(qualified) == 3
+
+    # Two new issues upstream: fetched from the cursor on, and only those are qualified
+    FakeScraper.total = 5
+    second = await github_leads_agent.prospect_github_issues(
+        target_repos=["org/a"], max_issues_per_repo=5, require_email=False, persist_to_db=True,
+        qualification_batch_size=1,
+    )
+    assert [lead["issue_number"] for lead in second] == [4, 5]
+    assert FakeScraper.calls[-1] == ("org/a", "2025-05-03T00:00:00Z")
+    assert len(qualified) == 5
+
+    # Leads are stored once and the cursor moved to the newest issue
+    session = database.SessionLocal()
+    assert session.query(Lead).count() == 5
+    state = session.get(GitHubSyncState, "org/a")
+    assert (state.last_issue_number, state.last_updated_at) == (5, "2025-05-05T00:00:00Z")
+    session.close()
+
+
+@pytest.mark.asyncio
+async def test_sync_cursor_only_advances_past_stored_and_qualified_issues(monkeypatch, lead_db):
+    async def fake_qualify(issue, repo, max_retries=2):
+        if issue["issue_number"] == 3 and not retry:
+            raise RuntimeError("LLM unavailable")
+        return {"should_contact": True, "reason": "test", "priority": "high", "confidence": 0.9}
+
+    async def failing_persist(leads):
+        raise RuntimeError("database down")
+
+    monkeypatch.setattr(github_leads_agent, "GitHubIssuesScraper", FakeScraper)
+    monkeypatch.setattr(github_leads_agent, "_qualify_lead_with_ai", fake_qualify)
+    monkeypatch.setattr(github_leads_agent, "log_provenance", noop_provenance)
+    FakeScraper.total = 5
+    retry = False
+
+    def cursor():
+        session = database.SessionLocal()
+        try:
+            state = session.get(GitHubSyncState, "org/a")
+            return state and (state.last_issue_number, state.last_updated_at)
+        finally:
+            session.close()
+
+    run = dict(target_repos=["org/a"], max_issues_per_repo=5, require_email=False, qualification_batch_size=1)
+    # Leads that are not stored (not requested, or the write failed) do not move the cursor
+    await github_leads_agent.prospect_github_issues(persist_to_db=False, **run)
+    with monkeypatch.context() as m:
+        m.setattr(github_leads_agent, "_persist_leads_to_db", failing_persist)
+        await github_leads_agent.prospect_github_issues(persist_to_db=True, **run)
+    assert cursor() is None
+
+    # Issue 3 could not be qualified: the cursor stops at issue 2 and the next run retries it
+    leads = await github_leads_agent.prospect_github_issues(persist_to_db=True, **run)
+    assert [lead["issue_number"] for lead in leads] == [1, 2, 4, 5]
+    assert cursor() == (2, "2025-05-02T00:00:00Z")
+
+    retry = True
+    leads = await github_leads_agent.prospect_github_issues(persist_to_db=True, **run)
+    assert FakeScraper.calls[-1] == ("org/a", "2025-05-02T00:00:00Z")
+    assert [lead["issue_number"] for lead in leads] == [3]
+    assert cursor() == (5, "2025-05-05T00:00:00Z")
+
+
+@pytest.mark.asyncio
+async def test_batch_qualification_falls_back_per_issue_for_missing_items(monkeypatch):
+    batches = []
+    singles = []
+
+    async def fake_batch(batch_input):
+        numbers = [i.issue_number for i in batch_input.issues]
+        batches.append(numbers)
+        # Answer everything except the last issue of each batch; also echo an unknown number
+        items = [
+            github_leads_agent.LeadQualificationBatchItem(
+                issue_number=n, should_contact=n != 2, reason="batch", priority="high", confidence=0.8
+            )
+            for n in numbers[:-1]
+        ]
+        items.append(
+            github_leads_agent.LeadQualificationBatchItem(
+                issue_number=999, should_contact=True, reason="bogus", priority="high", confidence=1.0
+            )
+        )
+        return items
+
+    async def fake_single(issue, repo, max_retries=2):
+        singles.append(issue["issue_number"])
+        return {"should_contact": True, "reason": "single", "priority": "medium", "confidence": 0.5}
+
+    monkeypatch.setattr(github_leads_agent, "_run_batch_qualification", fake_batch)
+    monkeypatch.setattr(github_leads_agent, "_qualify_lead_with_ai", fake_single)
+    monkeypatch.setattr(github_leads_agent, "log_provenance", noop_provenance)
+
+    issues = [{"issue_number": n, "issue_title": f"issue {n}"} for n in range(1, 6)]
+    decisions = await github_leads_agent._qualify_issues(issues, "org/a", asyncio.Semaphore(1), batch_size=3)
+
+    assert batches == [[1, 2, 3], [4, 5]]
+    assert sorted(singles) == [3, 5]
+    assert [d["reason"] for d in decisions] == ["batch", "batch", "single", "batch", "single"]
+    assert decisions[1]["should_contact"] is False
+
+
+@pytest.mark.asyncio
+async def test_prefilter_skips_llm_for_low_scoring_and_emailless_issues(monkeypatch):
+    qualified = []
+    events = []
+
+    class ScoredScraper(FakeScraper):
+        async def fetch_issue_list(self, repo, max_issues=25, profile_enrichment="browser", since=None):
+            return [
+                # Novice-looking, with email
+                {"issue_number": 1, "issue_title": "Help: install fails", "issue_body": "stuck, please help",
+                 "issue_url": f"https://github.com/{repo}/issues/1", "email": "a@example.org", "followers": 1},
+                # Terse title, no keywords, long technical body
+                {"issue_number": 2, "issue_title": "Refactor sparse kernels", "issue_body": "```python\nx = 1\n```" + "x" * 500,
+                 "issue_url": f"https://github.com/{repo}/issues/2", "email": "b@example.org", "followers": 300},
+                # Novice-looking but no email
+                {"issue_number": 3, "issue_title": "How to start?", "issue_body": "new here",
+                 "issue_url": f"https://github.com/{repo}/issues/3"},
+            ]
+
+    async def fake_qualify(issue, repo, max_retries=2):
+        qualified.append(issue["issue_number"])
+        return {"should_contact": True, "reason": "test", "priority": "high", "confidence": 0.9}
+
+    async def capture(**kwargs):
+        events.append(kwargs)
+
+    monkeypatch.setattr(github_leads_agent, "GitHubIssuesScraper", ScoredScraper)
+    monkeypatch.setattr(github_leads_agent, "_qualify_lead_with_ai", fake_qualify)
+    monkeypatch.setattr(github_leads_agent, "log_provenance", capture)
+
+    leads = await github_leads_agent.prospect_github_issues(
+        target_repos=["org/a"], require_email=True, persist_to_db=False, incremental=False,
+        qualification_batch_size=1, prefilter_min_score=0.3,
+    )
+
+    assert qualified == [1]
+    assert [lead["issue_number"] for lead in leads] == [1]
+    assert leads[0]["novice_score"] >= 0.3 and leads[0]["signals"]["keywords"]
+    completed = next(e for e in events if e["action"] == "prospecting_completed")["details"]
+    assert completed["issues_scored"] == 3
+    assert completed["issues_prefiltered"] == 2
+    assert completed["llm_calls_avoided"] == 2
+
+
+def _lead(n, title="t", email=None):
+    return {"repo": "org/a", "issue_number": n, "issue_url": f"https://github.com/org/a/issues/{n}",
+            "issue_title": f"{title} {n}", "user_login": f"user{n}", "profile_url": "", "email": email,
+            "confidence": 0.5, "signals": {"keywords": ["help"]}, "novice_score": 0.4}
+
+
+@pytest.mark.parametrize("dialect_name", ["sqlite", "generic"])
+@pytest.mark.asyncio
+async def test_persist_leads_bulk_upserts_in_few_statements(lead_db, monkeypatch, dialect_name):
+    from sqlalchemy import event
+
+    if dialect_name != "sqlite":
+        monkeypatch.setattr(lead_db.dialect, "name", dialect_name)
+    statements = []
+    event.listen(lead_db, "before_cursor_execute", lambda conn, cursor, stmt, *a: statements.append(stmt))
+
+    assert await github_leads_agent._persist_leads_to_db([_lead(n) for n in range(1, 201)]) == {"inserted": 200, "updated": 0}
+    session = database.SessionLocal()
+    ids = {lead.issue_number: lead.id for lead in session.query(Lead)}
+    session.close()
+
+    statements.clear()
+    counts = await github_leads_agent._persist_leads_to_db(
+        [_lead(5, title="edited", email="x@lab.org"), _lead(201), _lead(202, email="not-an-email")]
+    )
+    assert counts == {"inserted": 1, "updated": 1}
+    # One IN lookup and at most two writes (insert/upsert + update), not one query per lead
+    assert len(statements) <= 3
+
+    session = database.SessionLocal()
+    edited = session.query(Lead).filter_by(issue_number=5).one()
+    assert edited.id == ids[5] and edited.issue_title == "edited 5" and edited.email == "x@lab.org"
+    assert edited.updated_at is not None and edited.stage == "enriched"
+    assert edited.signals["heuristic_score"] == 0.4 and edited.signals["ai_qualified"] is True
+    assert session.query(Lead).count() == 201
+    session.close()
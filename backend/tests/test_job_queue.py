@@ -0,0 +1,175 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+pytest.importorskip("aiosqlite")
+
+from app.core import search_tasks
+from app.core.database import Base
+from app.core.job_queue import SQLJobQueue
+from app.core.worker import Worker, run_search_job
+from app.models.database import QueuedJob, Task
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_leases_hide_jobs_until_they_expire(session_factory):
+    queue = SQLJobQueue(name="test", session_factory=session_factory)
+    assert await queue.enqueue("task-1", "search", {"n": 1}, max_attempts=2)
+    assert not await queue.enqueue("task-1", "search", {"n": 1})  # keyed on the task id
+
+    first = await queue.claim("w1", visibility_timeout=1)
+    assert first.id == "task-1" and first.attempts == 1 and first.payload == {"n": 1}
+    assert await queue.claim("w2", visibility_timeout=1) is None
+
+    await asyncio.sleep(1.1)
+    second = await queue.claim("w2", visibility_timeout=30)
+    assert second.attempts == 2
+    # The first worker lost its lease: its ack and renewals are ignored
+    assert not await queue.extend(first, 30)
+    await queue.ack(first)
+    assert (await queue.stats())["leased"] == 1
+
+    await queue.ack(second)
+    assert await queue.stats() == {"backend": "sqlite", "queue": "test"}
+
+
+@pytest.mark.asyncio
+async def test_worker_retries_with_backoff_and_caps_concurrency(session_factory):
+    queue = SQLJobQueue(name="test", session_factory=session_factory)
+    for n in range(6):
+        await queue.enqueue(f"job-{n}", "flaky", {}, max_attempts=3)
+    await queue.enqueue("doomed", "flaky", {"always_fail": True}, max_attempts=2)
+
+    running, peak, attempts = 0, 0, {}
+
+    async def flaky(job):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            await asyncio.sleep(0.02)
+            attempts[job.id] = job.attempts
+            if job.payload.get("always_fail") or job.attempts == 1:
+                raise RuntimeError("transient")
+        finally:
+            running -= 1
+
+    worker = Worker(queue=queue, concurrency=2, visibility_timeout=5, poll_interval=0.01,
+                    backoff=0.05, backoff_max=0.05, handlers={"flaky": flaky}, dead_handlers={})
+    runner = asyncio.create_task(worker.run())
+    for _ in range(200):
+        await asyncio.sleep(0.02)
+        if worker.completed == 6 and worker.dead == 1:
+            break
+    worker.stop()
+    await runner
+
+    assert peak == 2
+    assert attempts == {**{f"job-{n}": 2 for n in range(6)}, "doomed": 2}
+    assert worker.retried == 7
+    assert worker.retry_delay(1) == 0.05 and Worker(queue=queue, backoff=1, backoff_max=10).retry_delay(3) == 4
+    async with session_factory() as session:
+        dead = await session.get(QueuedJob, "doomed")
+        assert dead.status == "dead" and dead.last_error == "transient"
+        assert await session.get(QueuedJob, "job-0") is None
+
+
+@pytest.mark.asyncio
+async def test_search_job_runs_a_task_once(session_factory, monkeypatch):
+    monkeypatch.setattr(search_tasks, "get_async_session_factory", lambda: session_factory)
+    calls = []
+
+    async def fake_workflow(request, user_email, on_event=None):
+        calls.append(request.query)
+        return {"summary": "done"}
+
+    monkeypatch.setattr(search_tasks.orchestrator, "execute_workflow", fake_workflow)
+    async with session_factory() as session:
+        session.add(Task(id="task-1", type="search", status="pending", input_data={}))
+        await session.commit()
+
+    queue = SQLJobQueue(name="test", session_factory=session_factory)
+    await queue.enqueue("task-1", "search", {"request": {"query": "lung scRNA-seq"}})
+    job = await queue.claim("w1", visibility_timeout=30)
+    await run_search_job(job)
+    await run_search_job(job)  # duplicate delivery
+
+    async with session_factory() as session:
+        task = await session.get(Task, "task-1")
+        assert task.status == "completed" and task.output_data == {"summary": "done"}
+    assert calls == ["lung scRNA-seq"]
+
+
+@pytest.mark.asyncio
+async def test_cancelling_a_task_stops_its_workflow(session_factory, monkeypatch):
+    monkeypatch.setattr(search_tasks, "get_async_session_factory", lambda: session_factory)
+    monkeypatch.setattr(search_tasks.settings, "TASK_CANCEL_CHECK_INTERVAL_SECONDS", 0.05)
+    started, stopped = asyncio.Event(), []
+
+    async def slow_workflow(request, user_email, on_event=None):
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            stopped.append(request.query)
+            raise
+
+    monkeypatch.setattr(search_tasks.orchestrator, "execute_workflow", slow_workflow)
+    async with session_factory() as session:
+        session.add_all([Task(id=f"task-{n}", type="search", status="pending") for n in (1, 2)])
+        await session.commit()
+
+    # In-process: the registry cancels the workflow directly
+    running = asyncio.create_task(search_tasks.execute_search_task("task-1", {"query": "a"}))
+    await started.wait()
+    assert search_tasks.cancel_running_search("task-1")
+    assert await running is None
+
+    # Another process marked the task cancelled: the status watcher stops the workflow
+    started.clear()
+    running = asyncio.create_task(search_tasks.execute_search_task("task-2", {"query": "b"}))
+    await started.wait()
+    async with session_factory() as session:
+        (await session.get(Task, "task-2")).status = "cancelled"
+        await session.commit()
+    assert await asyncio.wait_for(running, timeout=5) is None
+
+    assert stopped == ["a", "b"]
+    assert not search_tasks.cancel_running_search("task-1")
+    async with session_factory() as session:
+        for task_id in ("task-1", "task-2"):
+            task = await session.get(Task, task_id)
+            assert task.status == "cancelled" and task.completed_at is not None
+
+
+@pytest.mark.asyncio
+async def test_a_cancel_landing_as_the_workflow_returns_wins(session_factory, monkeypatch):
+    monkeypatch.setattr(search_tasks, "get_async_session_factory", lambda: session_factory)
+
+    async def cancelled_at_the_end(request, user_email, on_event=None):
+        # Cancelled elsewhere after the last watcher check, before the result is stored
+        async with session_factory() as session:
+            (await session.get(Task, "task-1")).status = "cancelled"
+            await session.commit()
+        return {"summary": "late"}
+
+    monkeypatch.setattr(search_tasks.orchestrator, "execute_workflow", cancelled_at_the_end)
+    async with session_factory() as session:
+        session.add(Task(id="task-1", type="search", status="pending"))
+        await session.commit()
+
+    await search_tasks.execute_search_task("task-1", {"query": "a"})
+    async with session_factory() as session:
+        task = await session.get(Task, "task-1")
+        assert task.status == "cancelled" and task.output_data is None
@@ -0,0 +1,65 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+pytest.importorskip("numpy")
+
+from app.core import database
+from app.core.lead_rescoring import rescore_leads
+from app.models.database import Lead
+from app.utils.scoring import ScoringWeights, calculate_novice_score
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    database.Base.metadata.create_all(bind=engine, tables=[Lead.__table__])
+    factory = sessionmaker(bind=engine)
+    session = factory()
+    for n in range(25):
+        signals = {"keywords": ["help"] if n % 2 else [], "labels": ["question"] if n % 3 == 0 else [],
+                   "issue_body_length": 100 * n, "code_blocks_present": n % 5 == 0, "followers": n}
+        if n == 24:
+            signals = {"qualification_reason": "AI only", "confidence": 0.9}
+        session.add(Lead(repo="org/a", issue_number=n, issue_url=f"https://github.com/org/a/issues/{n}",
+                         issue_title=f"issue {n}", user_login=f"u{n}", profile_url="", signals=signals,
+                         novice_score=0.9))  # AI confidence, as stored by lead qualification
+    session.commit()
+    session.close()
+    return factory
+
+
+def _scores(factory):
+    session = factory()
+    try:
+        return {lead.issue_number: (lead.signals, lead.novice_score) for lead in session.query(Lead)}
+    finally:
+        session.close()
+
+
+def test_rescore_updates_scores_in_chunks_and_skips_unscorable_rows(session_factory):
+    weights = ScoringWeights(keywords=0.5, short_body_below=1000)
+    seen = []
+    stats = rescore_leads(weights=weights, chunk_size=7, session_factory=session_factory, progress=seen.append)
+
+    assert stats["scanned"] == 25 and stats["chunks"] == 4
+    assert stats["rescored"] == 24 and stats["skipped"] == 1
+    assert [s["scanned"] for s in seen] == [7, 14, 21, 25]
+    assert stats["rows_per_second"] > 0
+
+    for number, (signals, confidence) in _scores(session_factory).items():
+        assert confidence == 0.9
+        if number == 24:
+            assert "heuristic_score" not in signals
+        else:
+            assert signals["heuristic_score"] == pytest.approx(calculate_novice_score(signals, weights))
+
+    # Unchanged weights: nothing left to write
+    assert rescore_leads(weights=weights, chunk_size=7, session_factory=session_factory)["updated"] == 0
+
+
+def test_rescore_dry_run_writes_nothing(session_factory):
+    stats = rescore_leads(chunk_size=10, dry_run=True, session_factory=session_factory)
+    assert stats["updated"] > 0
+    assert all("heuristic_score" not in signals for signals, _ in _scores(session_factory).values())
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from app.core.agents.planner_agent import WorkflowStep
+from app.core.plan_executor import PlanExecutor, PlanValidationError, topological_order
+from app.core.utils.query_cache import QueryCache
+
+
+def _step(number, action, dependencies=(), **parameters):
+    return WorkflowStep(step_number=number, action=action, description=action, parameters=parameters,
+                        dependencies=list(dependencies))
+
+
+def test_topological_order_rejects_invalid_plans():
+    diamond = [_step(4, "d", [2, 3]), _step(2, "b", [1]), _step(3, "c", [1]), _step(1, "a")]
+    assert [s.step_number for s in topological_order(diamond)] == [1, 2, 3, 4]
+
+    for steps in (
+        [_step(1, "a"), _step(1, "b")],
+        [_step(1, "a", [9])],
+        [_step(1, "a", [3]), _step(2, "b", [1]), _step(3, "c", [2])],
+    ):
+        with pytest.raises(PlanValidationError):
+            topological_order(steps)
+
+
+@pytest.mark.asyncio
+async def test_independent_steps_run_concurrently_and_dependents_wait():
+    log = []
+
+    async def work(step, results):
+        log.append(f"start:{step.action}")
+        await asyncio.sleep(step.parameters.get("seconds", 0.05))
+        log.append(f"end:{step.action}")
+        return sum(results[dep].output for dep in step.dependencies) + step.step_number
+
+    steps = [_step(1, "a"), _step(2, "b", seconds=0.1), _step(3, "c", [1]), _step(4, "d", [2, 3])]
+    executor = PlanExecutor(handlers={}, default_handler=work, default_timeout=5)
+    started = asyncio.get_running_loop().time()
+    results = await executor.run(steps)
+    elapsed = asyncio.get_running_loop().time() - started
+
+    # c starts once a is done, without waiting for b; d waits for both
+    assert log.index("start:c") < log.index("end:b")
+    assert log.index("start:d") > max(log.index("end:b"), log.index("end:c"))
+    assert results[4].output == 2 + (1 + 3) + 4
+    assert elapsed < 0.25  # a->c (0.1s) overlaps b (0.1s), then d
+
+
+@pytest.mark.asyncio
+async def test_timeouts_failures_and_cached_outputs():
+    calls = []
+
+    async def slow(step, results):
+        await asyncio.sleep(5)
+
+    async def broken(step, results):
+        raise RuntimeError("boom")
+
+    async def lookup(step, results):
+        calls.append(step.parameters["q"])
+        return [step.parameters["q"].upper()]
+
+    cache = QueryCache(max_entries=8, ttl=60, enabled=True)
+    events = []
+    executor = PlanExecutor(
+        handlers={"slow": slow, "broken": broken, "lookup": lookup},
+        default_timeout=5,
+        cache=cache,
+        cacheable_actions={"lookup"},
+        on_event=lambda event, data: events.append((event, data["step_number"])),
+    )
+    steps = [
+        _step(1, "slow", timeout_seconds=0.05), _step(2, "broken"), _step(3, "lookup", q="tp53"),
+        _step(4, "lookup", [1], q="after-timeout"), _step(5, "unknown"),
+    ]
+    results = await asyncio.wait_for(executor.run(steps), timeout=2)
+    assert {n: r.status for n, r in results.items()} == {
+        1: "timed_out", 2: "failed", 3: "completed", 4: "skipped", 5: "failed",
+    }
+    assert results[2].error == "boom" and ("step_finished", 4) in events and ("step_started", 4) not in events
+
+    again = await executor.run([_step(3, "lookup", q="tp53")])
+    assert again[3].cached and again[3].output == ["TP53"] and calls == ["tp53"]
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.utils.provenance import ProvenanceWriter
+from app.models.database import Provenance
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    # File-backed engine with a regular pool, so batches are written from a worker thread;
+    # tables are created on the first flush (missing-table fallback)
+    engine = create_engine(f"sqlite:///{tmp_path / 'prov.db'}")
+    return sessionmaker(bind=engine)
+
+
+def _record(n):
+    return {"actor": "test", "action": f"event_{n}", "details": {"n": n}}
+
+
+def _stored(session_factory):
+    session = session_factory()
+    try:
+        return sorted(row.details["n"] for row in session.query(Provenance))
+    finally:
+        session.close()
+
+
+@pytest.mark.asyncio
+async def test_flushes_by_size_then_by_time_and_on_close(session_factory):
+    writer = ProvenanceWriter(batch_size=5, flush_interval=0.05, max_queue=100,
+                              overflow_policy="drop", session_factory=session_factory, enabled=True)
+    for n in range(12):
+        await writer.submit(_record(n))
+    assert writer.stats()["queued"] == 12  # submit never waits on the database
+
+    await asyncio.sleep(0.3)
+    assert writer.stats()["written"] == 12 and writer.stats()["batches"] == 3
+
+    await writer.submit(_record(12))
+    await writer.close()
+    assert _stored(session_factory) == list(range(13))
+
+
+@pytest.mark.asyncio
+async def test_overflow_drop_and_block_policies(session_factory):
+    dropping = ProvenanceWriter(batch_size=2, flush_interval=60, max_queue=2,
+                                overflow_policy="drop", session_factory=session_factory, enabled=True)
+    for n in range(3):
+        await dropping.submit(_record(n))
+    assert dropping.stats()["dropped"] == 1
+    await dropping.close()
+
+    blocking = ProvenanceWriter(batch_size=2, flush_interval=60, max_queue=2,
+                                overflow_policy="block", session_factory=session_factory, enabled=True)
+    for n in range(10, 13):
+        await blocking.submit(_record(n))
+    # The third caller flushed the full buffer itself before queueing
+    assert blocking.stats()["written"] == 2 and blocking.stats()["queued"] == 1
+    await blocking.close()
+
+    assert _stored(session_factory) == [0, 1, 10, 11, 12]
+
+
+def test_records_survive_event_loop_shutdown(session_factory):
+    writer = ProvenanceWriter(batch_size=100, flush_interval=60, max_queue=1000,
+                              overflow_policy="drop", session_factory=session_factory, enabled=True)
+
+    async def script(start):
+        for n in range(start, start + 3):
+            await writer.submit(_record(n))
+
+    # Scripts and webhooks call asyncio.run; the flusher is cancelled with the loop and flushes first
+    asyncio.run(script(0))
+    asyncio.run(script(3))
+    assert _stored(session_factory) == list(range(6))
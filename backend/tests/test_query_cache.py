@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from app.core.utils.query_cache import QueryCache, query_fingerprint
+
+
+def test_fingerprint_normalizes_equivalent_requests():
+    a = query_fingerprint("  TP53  Lung Cancer ", "GEO", {"modalities": ["scRNA-seq", "RNA-seq"]}, 20)
+    b = query_fingerprint("tp53 lung cancer", "geo", {"modalities": ["rna-seq", "scrna-seq"]}, 20)
+    assert a == b
+    assert a != query_fingerprint("tp53 lung cancer", "GEO", {"modalities": ["rna-seq"]}, 20)
+    assert a != query_fingerprint("tp53 lung cancer", "GEO", {"modalities": ["rna-seq", "scrna-seq"]}, 10)
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_bypass_lru_and_single_flight():
+    cache = QueryCache(max_entries=2, ttl=60, enabled=True)
+    calls = []
+
+    async def compute(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return [{"accession": value}]
+
+    # Concurrent identical misses share one computation
+    r1, r2 = await asyncio.gather(
+        cache.get_or_compute("k1", lambda: compute("a")),
+        cache.get_or_compute("k1", lambda: compute("a")),
+    )
+    assert r1 == r2 == [{"accession": "a"}]
+    assert calls == ["a"]
+
+    # Hit returns a copy; bypass recomputes and refreshes the entry
+    r1[0]["accession"] = "mutated"
+    assert await cache.get_or_compute("k1", lambda: compute("a")) == [{"accession": "a"}]
+    assert await cache.get_or_compute("k1", lambda: compute("b"), bypass=True) == [{"accession": "b"}]
+    assert calls == ["a", "b"]
+
+    # LRU eviction beyond max_entries
+    await cache.get_or_compute("k2", lambda: compute("c"))
+    await cache.get_or_compute("k3", lambda: compute("d"))
+    stats = cache.stats()
+    assert stats["size"] == 2 and stats["evictions"] == 1
+    assert cache.get("k1") is None
+    assert stats["hits"] >= 1 and stats["misses"] >= 3
@@ -0,0 +1,102 @@
+import random
+import re
+
+import pytest
+
+from app.utils.scoring import (
+    CODE_BLOCK_PATTERNS,
+    ERROR_PHRASES,
+    FRUSTRATION_PHRASES,
+    NOVICE_KEYWORDS,
+    extract_signals,
+)
+
+ERROR_PATTERNS = [re.escape(p) for p in ERROR_PHRASES]
+FRUSTRATION_PATTERNS = [r"frustrat", r"annoying", r"driving me crazy", r"pulling my hair", r"spent hours",
+                        r"been trying for", r"why (is|does|doesn't|won't)", r"this (is|doesn't) work"]
+
+
+def _reference_text_signals(title, body):
+    """The original substring/re.search implementation the matcher must agree with."""
+    title, body = (title or "").lower(), (body or "").lower()
+    combined = f"{title} {body}"
+    signals = {"keywords": [k for k in NOVICE_KEYWORDS if k in combined]}
+    if body:
+        signals["code_blocks_present"] = any(re.search(p, body, re.MULTILINE) for p in CODE_BLOCK_PATTERNS)
+        signals["has_error_traces"] = any(re.search(p, body, re.IGNORECASE) for p in ERROR_PATTERNS)
+        signals["shows_frustration"] = any(re.search(p, body, re.IGNORECASE) for p in FRUSTRATION_PATTERNS)
+    else:
+        signals.update(code_blocks_present=None, has_error_traces=None, shows_frustration=None)
+    return signals
+
+
+def _text_signals(title, body):
+    signals = extract_signals({"issue_title": title, "issue_body": body}, {})
+    return {k: signals[k] for k in ("keywords", "code_blocks_present", "has_error_traces", "shows_frustration")}
+
+
+@pytest.mark.parametrize(
+    "title,body",
+    [
+        ("", ""),
+        ("Newbie needs help", ""),
+        ("", "x = 1\nworks fine"),                   # assignment at the very start of the body
+        ("stuck on how", "to install"),               # keyword spanning the title/body join
+        ("Why", "is this failing? KeyError: 'obs'"),  # frustration may not start in the title
+        ("", "the problemodulenotfounderror"),        # phrases overlapping each other
+        ("", "this doesn't work, basically"),
+        ("", "ſpent hours on it"),                     # case-insensitive match beyond ASCII
+        ("", "    indented\n```\nimport scanpy\n```"),
+    ],
+)
+def test_signals_match_reference_on_edge_cases(title, body):
+    assert _text_signals(title, body) == _reference_text_signals(title, body)
+
+
+def test_signals_match_reference_on_random_issues():
+    rng = random.Random(7)
+    vocab = list(NOVICE_KEYWORDS) + list(ERROR_PHRASES) + list(FRUSTRATION_PHRASES) + [
+        "adata", "the", "matrix", "`sc.pp`", "\n", "    ", "=", "!", "?", "Traceback", "ERROR:",
+    ]
+    for _ in range(300):
+        title = rng.choice(["", " "]).join(rng.choice(vocab) for _ in range(rng.randint(0, 6)))
+        body = rng.choice(["", " "]).join(rng.choice(vocab) for _ in range(rng.randint(0, 60)))
+        assert _text_signals(title, body) == _reference_text_signals(title, body), (title, body)
+
+
+def _random_signals(rng):
+    return {
+        "account_age_days": rng.choice([None, 10, 364, 365, 2000, 100.5, "n/a"]),
+        "followers": rng.choice([None, 0, 4, 5, 300]),
+        "public_repos": rng.choice([None, 1, 5, 80]),
+        "keywords": rng.choice([[], ["help"], None]),
+        "code_blocks_present": rng.choice([None, True, False]),
+        "labels": rng.sample(["question", "bug", "usage", "enhancement", "beginner"], rng.randint(0, 2)),
+        "issue_body_length": rng.choice([None, 10, 399, 400, 5000, 12.0]),
+        "punctuation_excess": rng.choice([None, True, False]),
+    }
+
+
+def test_bulk_scores_equal_scalar_scores_for_any_weights():
+    np = pytest.importorskip("numpy")
+    from app.utils.bulk_scoring import SignalColumns, score_columns, select_leads
+    from app.utils.scoring import ScoringWeights, calculate_novice_score, filter_high_scoring_leads
+
+    rng = random.Random(3)
+    signals = [_random_signals(rng) for _ in range(500)]
+    emails = [rng.random() < 0.7 for _ in signals]
+    columns = SignalColumns(signals, has_email=emails)
+
+    for weights in (None, ScoringWeights(keywords=0.4, novice_label_names=["bug"], short_body_below=50, threshold=0.3)):
+        scores = score_columns(columns, weights)
+        assert scores.tolist() == [calculate_novice_score(s, weights) for s in signals]
+
+    # Selection and ranking agree with the per-dict filter
+    scores = score_columns(columns)
+    issues = [
+        {"i": i, "novice_score": float(score), "email": "x@y.org" if has_email else None}
+        for i, (score, has_email) in enumerate(zip(scores, emails))
+    ]
+    expected = [issue["i"] for issue in filter_high_scoring_leads(issues, threshold=0.5)]
+    assert select_leads(scores, columns, threshold=0.5).tolist() == expected
+    assert isinstance(scores, np.ndarray)
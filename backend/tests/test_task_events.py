@@ -0,0 +1,191 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+pytest.importorskip("aiosqlite")
+
+from app.api.v1 import search as search_routes
+from app.core import database, search_tasks, task_events
+from app.core.database import get_async_db
+from app.core.task_events import LocalTaskEventBus, SQLTaskEventBus
+from app.main import app
+from app.models.database import Task
+
+
+def _frames(body):
+    """(event, data) pairs of an event-stream body, skipping comments."""
+    frames = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if fields:
+            frames.append((fields["event"], json.loads(fields["data"])))
+    return frames
+
+
+@pytest.mark.asyncio
+async def test_subscribers_replay_history_then_follow_live_events():
+    bus = LocalTaskEventBus(history_limit=10, retention_seconds=60)
+    bus.publish("t1", "status", {"status": "running"})
+    bus.publish("t1", "plan_ready", {})
+
+    async def collect(last_event_id=None):
+        return [(e.id, e.event) async for e in bus.subscribe("t1", last_event_id)]
+
+    early = asyncio.create_task(collect())
+    resumed = asyncio.create_task(collect(last_event_id=1))
+    await asyncio.sleep(0)
+    bus.publish("t1", "dataset_found", {"accession": "GSE1"})
+    bus.close("t1", {"status": "completed"})
+    bus.publish("t1", "late", {})  # ignored after close
+
+    assert await early == [(1, "status"), (2, "plan_ready"), (3, "dataset_found"), (4, "end")]
+    assert await resumed == [(2, "plan_ready"), (3, "dataset_found"), (4, "end")]
+    assert [e.event async for e in bus.subscribe("unknown")] == []
+
+    expiring = LocalTaskEventBus(retention_seconds=0)
+    expiring.close("t2")
+    await asyncio.sleep(0.01)
+    assert not await expiring.has_events("t2")
+
+
+@pytest_asyncio.fixture
+async def client(monkeypatch, tmp_path):
+    # A file database: with one shared in-memory connection, the stream's polling sessions
+    # would roll back the test's concurrent writes
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'tasks.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(database.Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override():
+        async with factory() as session:
+            yield session
+
+    app.dependency_overrides[get_async_db] = override
+    for module in (search_routes, search_tasks):
+        monkeypatch.setattr(module, "get_async_session_factory", lambda: factory)
+    monkeypatch.setattr(task_events, "_task_event_bus", LocalTaskEventBus())
+    monkeypatch.setattr(search_routes.settings, "SSE_STATUS_POLL_SECONDS", 0.02)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        http.session_factory = factory
+        yield http
+    app.dependency_overrides.pop(get_async_db, None)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_event_stream_of_a_workflow_run_in_process(client, monkeypatch):
+    async def fake_workflow(request, user_email, on_event=None):
+        on_event("plan_ready", {"plan": {"steps": []}})
+        on_event("dataset_found", {"source": "GEO", "dataset": {"accession": "GSE1"}})
+        return {"datasets": [{"accession": "GSE1"}]}
+
+    monkeypatch.setattr(search_tasks.orchestrator, "execute_workflow", fake_workflow)
+    async with client.session_factory() as session:
+        session.add(Task(id="t1", type="search", status="pending", input_data={}))
+        await session.commit()
+
+    # Subscribed before the workflow starts: follows the task row, then its events
+    stream = asyncio.create_task(client.get("/api/v1/search/t1/events"))
+    await asyncio.sleep(0.05)
+    await search_tasks.execute_search_task("t1", {"query": "lung"})
+    response = await asyncio.wait_for(stream, timeout=5)
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = _frames(response.text)
+    assert [event for event, _ in frames] == ["status", "status", "plan_ready", "dataset_found", "end"]
+    assert frames[0][1]["status"] == "pending" and frames[1][1]["status"] == "running"
+    assert frames[-1][1]["status"] == "completed"
+
+    # Reconnecting with Last-Event-ID only replays what was missed
+    resumed = await client.get("/api/v1/search/t1/events", headers={"Last-Event-ID": "2"})
+    assert [event for event, _ in _frames(resumed.text)] == ["dataset_found", "end"]
+
+
+@pytest.mark.asyncio
+async def test_event_stream_follows_tasks_run_elsewhere(client):
+    async with client.session_factory() as session:
+        session.add_all([
+            Task(id="done", type="search", status="failed", error_message="boom"),
+            Task(id="queued", type="search", status="pending"),
+        ])
+        await session.commit()
+
+    finished = await client.get("/api/v1/search/done/events")
+    assert _frames(finished.text) == [
+        ("status", {"task_id": "done", "status": "failed"}),
+        ("end", {"task_id": "done", "status": "failed", "error": "boom"}),
+    ]
+
+    # A queue worker (another process) updates the row; the stream reports the changes
+    stream = asyncio.create_task(client.get("/api/v1/search/queued/events"))
+    for status in ("running", "completed"):
+        await asyncio.sleep(0.1)
+        async with client.session_factory() as session:
+            (await session.get(Task, "queued")).status = status
+            await session.commit()
+    frames = _frames((await asyncio.wait_for(stream, timeout=5)).text)
+    assert [(event, data["status"]) for event, data in frames] == [
+        ("status", "pending"), ("status", "running"), ("status", "completed"), ("end", "completed"),
+    ]
+
+    assert (await client.get("/api/v1/search/missing/events")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_event_stream_of_a_workflow_run_by_a_worker(client, monkeypatch):
+    # The worker and the API each have their own bus over the task_events table
+    worker_bus = SQLTaskEventBus(poll_interval=0.02, session_factory=client.session_factory)
+    api_bus = SQLTaskEventBus(poll_interval=0.02, session_factory=client.session_factory)
+    monkeypatch.setattr(search_tasks, "get_task_event_bus", lambda: worker_bus)
+    monkeypatch.setattr(task_events, "_task_event_bus", api_bus)
+
+    async def fake_workflow(request, user_email, on_event=None):
+        on_event("plan_ready", {"plan": {"steps": []}})
+        on_event("source_results", {"source": "GEO", "count": 1})
+        on_event("summary_ready", {"summary": "one dataset"})
+        return {"datasets": []}
+
+    monkeypatch.setattr(search_tasks.orchestrator, "execute_workflow", fake_workflow)
+    async with client.session_factory() as session:
+        session.add(Task(id="w1", type="search", status="pending", input_data={}))
+        await session.commit()
+
+    stream = asyncio.create_task(client.get("/api/v1/search/w1/events"))
+    await asyncio.sleep(0.05)
+    await search_tasks.execute_search_task("w1", {"query": "lung"})
+    await worker_bus.flush()
+    frames = _frames((await asyncio.wait_for(stream, timeout=5)).text)
+    assert [event for event, _ in frames] == [
+        "status", "status", "plan_ready", "source_results", "summary_ready", "end",
+    ]
+    assert frames[-1][1]["status"] == "completed"
+
+    resumed = await client.get("/api/v1/search/w1/events", headers={"Last-Event-ID": "2"})
+    assert [event for event, _ in _frames(resumed.text)] == ["source_results", "summary_ready", "end"]
+
+
+@pytest.mark.asyncio
+async def test_stored_events_of_tasks_ended_past_retention_are_deleted(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'events.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(database.Base.metadata.create_all)
+    bus = SQLTaskEventBus(retention_seconds=0, session_factory=async_sessionmaker(engine, expire_on_commit=False))
+
+    bus.publish("old", "status", {"status": "running"})
+    bus.close("old", {"status": "completed"})
+    bus.publish("live", "status", {"status": "running"})
+    await bus.flush()
+    assert await bus.has_events("old") and await bus.has_events("live")
+
+    bus.close("live", {"status": "completed"})
+    await bus.flush()
+    assert not await bus.has_events("old")
+    assert [e.event async for e in bus.subscribe("live")] == ["status", "end"]
+    await engine.dispose()